@@ -0,0 +1,102 @@
+"""Row-decode throughput of each database driver
+
+Reads whole tables through every available driver and reports rows per
+second. PyMySQL is included when it is installed, for comparison only;
+the application itself runs on mysql.connector.
+
+    python benchmarks/bench_drivers.py
+    python benchmarks/bench_drivers.py --tables PATIENT BILLING --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+import mysql.connector
+from dotenv import load_dotenv
+
+from config.database import DB_CONFIG
+from database.drivers import available_drivers, driver_options
+
+
+def connection_settings():
+    load_dotenv()
+    return {
+        'host': os.getenv('DB_HOST', '127.0.0.1'),
+        'port': int(os.getenv('DB_PORT', '3306')),
+        'user': os.getenv('DB_USER', 'root'),
+        'password': os.getenv('DB_PASSWORD', ''),
+        'database': os.getenv('DB_NAME', DB_CONFIG.get('database', 'national_hospital'))
+    }
+
+
+def connectors():
+    """Yield (name, connect) for every driver that can be benchmarked here"""
+    settings = connection_settings()
+    for driver in available_drivers():
+        yield driver, lambda driver=driver: mysql.connector.connect(**settings, **driver_options(driver))
+
+    try:
+        import pymysql
+    except ImportError:
+        return
+    yield 'pymysql', lambda: pymysql.connect(
+        host=settings['host'], port=settings['port'], user=settings['user'],
+        password=settings['password'], database=settings['database'],
+        cursorclass=pymysql.cursors.SSCursor
+    )
+
+
+def read_table(connection, table_name, chunk_size):
+    """Stream every row of a table and return the row count"""
+    cursor = connection.cursor()
+    try:
+        cursor.execute(f"SELECT * FROM {table_name}")
+        count = 0
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                return count
+            count += len(rows)
+    finally:
+        cursor.close()
+
+
+def bench_decode(tables, repeat, chunk_size):
+    print(f"{'driver':<10}{'table':<14}{'rows':>10}{'best s':>10}{'mean s':>10}{'rows/s':>14}")
+    for name, connect in connectors():
+        connection = connect()
+        try:
+            for table_name in tables:
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    count = read_table(connection, table_name, chunk_size)
+                    timings.append(time.perf_counter() - started)
+                best = min(timings)
+                rate = count / best if best else 0
+                print(f"{name:<10}{table_name:<14}{count:>10}{best:>10.3f}"
+                      f"{statistics.mean(timings):>10.3f}{rate:>14,.0f}")
+        finally:
+            connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--tables', nargs='+', default=['PATIENT', 'BILLING'], help="tables to read")
+    parser.add_argument('--repeat', type=int, default=3, help="reads per table and driver")
+    parser.add_argument('--chunk-size', type=int, default=1000, help="rows per fetchmany call")
+    args = parser.parse_args()
+    bench_decode(args.tables, args.repeat, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
+
+# References
+# 1. **PyMySQL**
+#    - Used for: Comparing against a second pure-Python driver
+#    - Documentation: [PyMySQL Documentation](https://pymysql.readthedocs.io/)
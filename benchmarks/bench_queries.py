@@ -0,0 +1,82 @@
+"""Database micro-benchmarks
+
+Run against a configured database (see .env):
+
+    python benchmarks/bench_queries.py
+    python benchmarks/bench_queries.py --repeat 5000 --table PATIENT
+"""
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from database.db_manager import DatabaseManager
+
+
+def timed(func, repeat):
+    """Run func repeat times and return per-call timings in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def report(name, timings):
+    timings = sorted(timings)
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) > 1 else timings[0]
+    print(f"{name:<40} mean {statistics.mean(timings):8.3f} ms   "
+          f"p95 {p95:8.3f} ms   calls {len(timings)}")
+
+
+def sample_keys(db, table_name, count):
+    """Pick existing primary key values to look up"""
+    primary_key = db.get_primary_key(table_name)
+    rows = db.execute_query(f"SELECT {primary_key} FROM {table_name} LIMIT %s", (count,))
+    return primary_key, [row[primary_key] for row in rows]
+
+
+def bench_prepared(db, table_name, repeat):
+    """Compare text-protocol and prepared execution of the same recurring queries"""
+    primary_key, keys = sample_keys(db, table_name, 100)
+    if not keys:
+        print(f"{table_name} is empty; nothing to look up")
+        return
+
+    lookup = f"SELECT {db._select_list(table_name)} FROM {table_name} WHERE {primary_key} = %s"
+    count = f"SELECT COUNT(*) FROM {table_name}"
+    position = iter(range(10 ** 9))
+
+    def next_key():
+        return (keys[next(position) % len(keys)],)
+
+    print(f"\nRecurring queries on {table_name} ({repeat} calls each)")
+    report("pk lookup, text protocol", timed(lambda: db.execute_query(lookup, next_key()), repeat))
+    report("pk lookup, prepared", timed(
+        lambda: db.execute_prepared(lookup, next_key(), dictionary=False), repeat))
+    report("count, text protocol", timed(lambda: db.execute_query(count), repeat))
+    report("count, prepared", timed(lambda: db.execute_prepared(count, dictionary=False), repeat))
+
+    stats = db.get_pool_stats()
+    print(f"statement cache: {stats['statement_hits']} hits, {stats['statement_misses']} misses, "
+          f"{stats['prepared_statements']} prepared")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--table', default='PATIENT', help="table to query")
+    parser.add_argument('--repeat', type=int, default=2000, help="calls per measurement")
+    args = parser.parse_args()
+
+    db = DatabaseManager()
+    try:
+        bench_prepared(db, args.table, args.repeat)
+    finally:
+        db.disconnect()
+
+
+if __name__ == "__main__":
+    main()
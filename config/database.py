@@ -7,5 +7,12 @@ DB_CONFIG = {
     'autocommit': True,
     'buffered': True,
     'pool_name': 'hospital_pool',
-    'pool_size': 5
+    'pool_size': 5,
+    'pool_max_idle': 300,  # seconds before an idle connection is recycled
+    'pool_timeout': 10,  # seconds to wait for a free connection
+    'pool_health_check': 30,  # seconds idle before a connection is pinged
+    'statement_cache_size': 64,  # prepared statements kept per pooled connection
+    'driver': 'auto',  # auto, cext (C extension) or pure; DB_DRIVER overrides
+    'dashboard_stats_ttl': 30,  # seconds the dashboard figures are cached
+    'stats_reconcile_interval': 86400  # seconds between full recounts of the summary tables
 }
@@ -0,0 +1,258 @@
+import mysql.connector
+from mysql.connector import Error
+from mysql.connector.errors import PoolError
+from contextlib import contextmanager
+from collections import deque, OrderedDict
+import logging
+import threading
+import time
+
+
+class StatementCache:
+    """LRU of prepared cursors for one connection, keyed by SQL text
+
+    A prepared cursor is only re-used when it is executed with the very
+    string object it was prepared with, so the cache hands that object back
+    with the cursor.
+    """
+
+    def __init__(self, pool, connection, max_size=64):
+        self.pool = pool
+        self.connection = connection
+        self.max_size = max_size
+        self._cursors = OrderedDict()  # (sql, dictionary) -> (cursor, sql)
+
+    def get(self, sql, dictionary=False):
+        """Return a (cursor, statement) pair to execute sql with"""
+        key = (sql, dictionary)
+        entry = self._cursors.get(key)
+        if entry is not None:
+            self._cursors.move_to_end(key)
+            self.pool._count('statement_hits')
+            return entry
+
+        self.pool._count('statement_misses')
+        entry = (self.connection.cursor(prepared=True, dictionary=dictionary), sql)
+        self._cursors[key] = entry
+        while len(self._cursors) > self.max_size:
+            _, (cursor, _) = self._cursors.popitem(last=False)
+            self._close_cursor(cursor)
+        return entry
+
+    def discard(self, sql, dictionary=False):
+        """Forget a statement, e.g. after it failed"""
+        entry = self._cursors.pop((sql, dictionary), None)
+        if entry:
+            self._close_cursor(entry[0])
+
+    def _close_cursor(self, cursor):
+        try:
+            cursor.close()
+        except Error as e:
+            logging.debug(f"Error closing prepared statement: {e}")
+
+    def __len__(self):
+        return len(self._cursors)
+
+
+class ConnectionPool:
+    """Thread-safe pool of MySQL connections shared by all views"""
+
+    def __init__(self, connection_config, pool_name='hospital_pool', pool_size=5,
+                 max_idle=300, checkout_timeout=10.0, health_check_interval=30,
+                 statement_cache_size=64):
+        self.connection_config = dict(connection_config)
+        self.pool_name = pool_name
+        self.pool_size = max(1, int(pool_size))
+        self.max_idle = max_idle
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.statement_cache_size = statement_cache_size
+
+        self._idle = deque()  # (connection, last_used) pairs, most recent on the right
+        self._in_use = set()
+        self._created = 0
+        self._statements = {}  # id(connection) -> StatementCache
+        self._condition = threading.Condition()
+        self._closed = False
+
+        self.stats = {
+            'checkouts': 0,
+            'connections_created': 0,
+            'connections_recycled': 0,
+            'health_check_failures': 0,
+            'exhausted': 0,
+            'timeouts': 0,
+            'total_wait_time': 0.0,
+            'peak_in_use': 0,
+            'statement_hits': 0,
+            'statement_misses': 0
+        }
+
+    def _create_connection(self):
+        """Open a new physical connection"""
+        connection = mysql.connector.connect(**self.connection_config)
+        with self._condition:
+            self.stats['connections_created'] += 1
+        logging.info(f"Pool '{self.pool_name}' opened a new connection")
+        return connection
+
+    def _close_connection(self, connection):
+        """Close a physical connection, ignoring errors from dead sockets"""
+        # Prepared statements die with their session
+        with self._condition:
+            self._statements.pop(id(connection), None)
+        try:
+            connection.close()
+        except Exception as e:
+            logging.debug(f"Error closing pooled connection: {e}")
+
+    def _is_healthy(self, connection, last_used):
+        """Check an idle connection before handing it out"""
+        idle_for = time.monotonic() - last_used
+        if self.max_idle and idle_for > self.max_idle:
+            with self._condition:
+                self.stats['connections_recycled'] += 1
+            return False
+        if idle_for > self.health_check_interval:
+            try:
+                connection.ping(reconnect=False)
+            except Error as e:
+                logging.warning(f"Pooled connection failed health check: {e}")
+                with self._condition:
+                    self.stats['health_check_failures'] += 1
+                return False
+        return True
+
+    def checkout(self, timeout=None):
+        """Take a connection from the pool, waiting up to timeout seconds"""
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        started = time.monotonic()
+        waited = False
+
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise PoolError(f"Pool '{self.pool_name}' is closed")
+
+                entry = None
+                create = False
+                while entry is None and not create:
+                    if self._idle:
+                        entry = self._idle.pop()
+                    elif self._created < self.pool_size:
+                        self._created += 1
+                        create = True
+                    else:
+                        if not waited:
+                            self.stats['exhausted'] += 1
+                            waited = True
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._condition.wait(remaining):
+                            self.stats['timeouts'] += 1
+                            raise PoolError(
+                                f"Pool '{self.pool_name}' exhausted: "
+                                f"{self.pool_size} connections in use"
+                            )
+
+            if create:
+                try:
+                    connection = self._create_connection()
+                except Exception:
+                    with self._condition:
+                        self._created -= 1
+                        self._condition.notify()
+                    raise
+            else:
+                connection, last_used = entry
+                if not self._is_healthy(connection, last_used):
+                    self._close_connection(connection)
+                    with self._condition:
+                        self._created -= 1
+                    continue
+
+            with self._condition:
+                self._in_use.add(id(connection))
+                self.stats['checkouts'] += 1
+                self.stats['total_wait_time'] += time.monotonic() - started
+                self.stats['peak_in_use'] = max(self.stats['peak_in_use'], len(self._in_use))
+            return connection
+
+    def _count(self, stat):
+        with self._condition:
+            self.stats[stat] += 1
+
+    def statements(self, connection):
+        """Get the prepared statement cache of a checked-out connection"""
+        with self._condition:
+            cache = self._statements.get(id(connection))
+            if cache is None or cache.connection is not connection:
+                cache = StatementCache(self, connection, self.statement_cache_size)
+                self._statements[id(connection)] = cache
+            return cache
+
+    def checkin(self, connection, discard=False):
+        """Return a connection to the pool, or close it if it is no longer usable"""
+        try:
+            if not discard and connection.in_transaction:
+                connection.rollback()
+        except Error as e:
+            logging.warning(f"Error resetting pooled connection: {e}")
+            discard = True
+
+        with self._condition:
+            self._in_use.discard(id(connection))
+            if discard or self._closed:
+                self._created -= 1
+            else:
+                self._idle.append((connection, time.monotonic()))
+            self._condition.notify()
+
+        if discard or self._closed:
+            self._close_connection(connection)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """Context manager that checks a connection out and back in"""
+        connection = self.checkout(timeout)
+        discard = False
+        try:
+            yield connection
+        except Error as e:
+            # Drop connections that lost the server rather than pooling them again
+            discard = getattr(e, 'errno', None) in (2006, 2013, 2055)
+            raise
+        finally:
+            self.checkin(connection, discard=discard)
+
+    def get_stats(self):
+        """Return a snapshot of pool usage metrics"""
+        with self._condition:
+            snapshot = dict(self.stats)
+            snapshot['pool_size'] = self.pool_size
+            snapshot['open_connections'] = self._created
+            snapshot['idle'] = len(self._idle)
+            snapshot['in_use'] = len(self._in_use)
+            snapshot['prepared_statements'] = sum(len(cache) for cache in self._statements.values())
+        return snapshot
+
+    def close(self):
+        """Close every idle connection and refuse further checkouts"""
+        with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._created -= len(idle)
+            self._condition.notify_all()
+        for connection, _ in idle:
+            self._close_connection(connection)
+        logging.info(f"Pool '{self.pool_name}' closed")
+
+# References
+# 1. **MySQL Connector/Python**
+#    - Used for: Opening database connections
+#    - Documentation: [MySQL Connector/Python Documentation](https://dev.mysql.com/doc/connector-python/en/)
+# 2. **Python threading module**
+#    - Used for: Guarding the pool across worker threads
+#    - Documentation: [Python threading Documentation](https://docs.python.org/3/library/threading.html)
@@ -1,126 +1,248 @@
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, errorcode
+from contextlib import contextmanager
+import itertools
 import logging
 import os
-from datetime import datetime
+import re
+import sys
+import time
+from pathlib import Path
+from datetime import datetime, timedelta
 from dotenv import load_dotenv
+sys.path.append(str(Path(__file__).parent.parent))
+from config.database import DB_CONFIG
+from database.connection_pool import ConnectionPool
+from database.drivers import select_driver, driver_options
+from database.hospital_stats import HospitalStats, CASCADING_DELETES
+from database.migrator import Migrator
+from database.schema_cache import SchemaCatalog
+from database.search_index import PeopleSearch, escape_like
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Statements that change table definitions and make cached metadata stale
+DDL_PATTERN = re.compile(r'^\s*(CREATE|ALTER|DROP|RENAME)\b', re.IGNORECASE)
+
+# Every dashboard figure in one round trip, used when the summary tables are unavailable
+DASHBOARD_STATS_QUERY = """
+    SELECT
+        (SELECT COUNT(*) FROM PATIENT) AS patients,
+        (SELECT COUNT(*) FROM DOCTOR) AS doctors,
+        (SELECT COUNT(*) FROM ROOM WHERE OCCUPIED < CAPACITY) AS available_rooms,
+        (SELECT COUNT(*) FROM APPOINTMENT
+         WHERE APPOINTMENT_DATE >= CURDATE() AND APPOINTMENT_DATE < CURDATE() + INTERVAL 1 DAY) AS appointments_today,
+        (SELECT COUNT(*) FROM BILLING WHERE PAYMENT_STATUS <> 'Paid') AS pending_bills,
+        (SELECT COALESCE(SUM(AMOUNT), 0) FROM BILLING WHERE PAYMENT_STATUS = 'Paid') AS total_revenue
+"""
+
+# Writes to these tables change the dashboard figures; DEPARTMENT deletes cascade to rooms
+DASHBOARD_TABLES = {'DEPARTMENT', 'PATIENT', 'DOCTOR', 'ROOM', 'APPOINTMENT', 'BILLING'}
+
+# Column types grouped by how search terms are compared against them
+TEXT_TYPES = {'char', 'varchar', 'tinytext', 'text', 'mediumtext', 'longtext', 'enum', 'set'}
+INTEGER_TYPES = {'tinyint', 'smallint', 'mediumint', 'int', 'bigint'}
+DECIMAL_TYPES = {'decimal', 'float', 'double'}
+DATE_TYPES = {'date', 'datetime', 'timestamp'}
+
+def _date_range(term):
+    """Turn a full or partial date such as 2024, 2024-01 or 2024-01-15 10 into a [start, end) range"""
+    match = re.fullmatch(r'(\d{4})(?:-(\d{1,2})(?:-(\d{1,2})(?:[ T](\d{1,2})(?::(\d{1,2})(?::(\d{1,2}))?)?)?)?)?', term)
+    if not match:
+        return None
+    parts = [int(p) for p in match.groups() if p is not None]
+    try:
+        if len(parts) == 1:
+            return datetime(parts[0], 1, 1), datetime(parts[0] + 1, 1, 1)
+        if len(parts) == 2:
+            start = datetime(parts[0], parts[1], 1)
+            end = datetime(parts[0] + parts[1] // 12, parts[1] % 12 + 1, 1)
+            return start, end
+        start = datetime(*parts)
+    except ValueError:
+        return None
+    step = {3: timedelta(days=1), 4: timedelta(hours=1), 5: timedelta(minutes=1), 6: timedelta(seconds=1)}
+    return start, start + step[len(parts)]
+
+def _column_predicate(column, data_type, term):
+    """Return (sql, params) comparing one column with a search term, or None if the term cannot match it"""
+    if data_type in TEXT_TYPES:
+        return f"{column} LIKE %s", [escape_like(term) + '%']
+    if data_type in INTEGER_TYPES and re.fullmatch(r'-?\d+', term):
+        return f"{column} = %s", [int(term)]
+    if data_type in DECIMAL_TYPES and re.fullmatch(r'-?\d+(\.\d+)?', term):
+        return f"{column} = %s", [term]
+    if data_type in DATE_TYPES:
+        date_range = _date_range(term)
+        if date_range:
+            return f"({column} >= %s AND {column} < %s)", list(date_range)
+    return None
+
+# Column converters take every value of one column and return the display values.
+# Dates and datetimes are never falsy, so `v and str(v)` keeps NULLs; str() gives
+# the same text as strftime('%Y-%m-%d[ %H:%M:%S]') at a fraction of the cost.
+def _convert_temporal(values):
+    return [v and str(v) for v in values]
+
+def _convert_decimal(values):
+    return [None if v is None else float(v) for v in values]
+
+def _value_converter(column_type):
+    """Pick the column converter for a COLUMN_TYPE, or None when values are used as they are"""
+    column_type = column_type.lower()
+    if 'date' in column_type or 'timestamp' in column_type:
+        return _convert_temporal
+    if 'decimal' in column_type:
+        return _convert_decimal
+    # Integer columns already arrive as int from the driver
+    return None
+
 class DatabaseManager:
-    def __init__(self):
-        """Initialize database connection"""
-        self.connection = None
-        self.cursor = None
-        self.connect()
+    def __init__(self, auto_connect=True):
+        """Initialize the database connection pool
+
+        With auto_connect=False the caller runs open_pool(), migrate() and
+        preload_metadata() itself, e.g. as startup phases on a worker thread.
+        """
+        self.pool = None
+        self.schema = SchemaCatalog(self)
+        self.migrator = Migrator(self)
+        self.people_search = PeopleSearch(self)
+        self.hospital_stats = HospitalStats(self, DB_CONFIG.get('stats_reconcile_interval', 86400))
+        self._row_converters = {}  # table -> (schema generation, (columns, converters))
+        self._dashboard_stats = None  # (stats, time fetched)
+        self._dashboard_generation = 0  # bumped when a write makes the cached stats stale
+        self.dashboard_stats_ttl = DB_CONFIG.get('dashboard_stats_ttl', 30)
+        self._write_generations = {}  # table -> writes made to it through this manager
+        self._cascade_generation = 0  # bumped by deletes that can cascade to other tables
+        self.db_name = os.getenv('DB_NAME', DB_CONFIG.get('database', 'national_hospital'))
+        self.driver = select_driver(os.getenv('DB_DRIVER', DB_CONFIG.get('driver', 'auto')))
+        if auto_connect:
+            self.connect()
+
+    def _connection_config(self):
+        """Build connection settings from environment variables"""
+        return {
+            'host': os.getenv('DB_HOST', '127.0.0.1'),
+            'port': int(os.getenv('DB_PORT', '3306')),
+            'user': os.getenv('DB_USER', 'root'),
+            'password': os.getenv('DB_PASSWORD', ''),
+            'auth_plugin': 'caching_sha2_password',
+            'allow_local_infile': True,
+            # Reads then leave no transaction open; writes start theirs explicitly
+            'autocommit': True,
+            **driver_options(self.driver)
+        }
 
     def connect(self):
-        """Establish database connection"""
+        """Create the connection pool and initialize the schema"""
         try:
-            # Get database configuration from environment variables
-            db_config = {
-                'host': os.getenv('DB_HOST', '127.0.0.1'),
-                'port': int(os.getenv('DB_PORT', '3306')),
-                'user': os.getenv('DB_USER', 'root'),
-                'password': os.getenv('DB_PASSWORD', ''),
-                'auth_plugin': 'caching_sha2_password',
-                'allow_local_infile': True,
-                'use_pure': True
-            }
-            
-            # First try to connect without database
-            logging.info(f"Attempting to connect to MySQL at {db_config['host']}")
-            self.connection = mysql.connector.connect(**db_config)
-            
-            # Create database if it doesn't exist
-            db_name = os.getenv('DB_NAME', 'national_hospital')
-            self.cursor = self.connection.cursor(dictionary=True)
-            self.cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-            self.cursor.execute(f"USE {db_name}")
-            
-            logging.info("Successfully connected to the database")
-            
-            # Initialize database tables
-            self._initialize_database()
-            
+            self.open_pool()
+            self.migrate()
+            self.preload_metadata()
         except Error as e:
             logging.error(f"Error connecting to database: {e}")
             raise
 
+    def open_pool(self):
+        """Create the connection pool and open its first connection"""
+        db_config = self._connection_config()
+        logging.info(f"Attempting to connect to MySQL at {db_config['host']} using the {self.driver} driver")
+
+        db_config['database'] = self.db_name
+        self.pool = ConnectionPool(
+            db_config,
+            pool_name=DB_CONFIG.get('pool_name', 'hospital_pool'),
+            pool_size=int(os.getenv('DB_POOL_SIZE', DB_CONFIG.get('pool_size', 5))),
+            max_idle=DB_CONFIG.get('pool_max_idle', 300),
+            checkout_timeout=DB_CONFIG.get('pool_timeout', 10),
+            health_check_interval=DB_CONFIG.get('pool_health_check', 30),
+            statement_cache_size=DB_CONFIG.get('statement_cache_size', 64)
+        )
+
+        # The connection goes back to the pool for the next query to reuse
+        try:
+            with self.checkout():
+                pass
+        except Error as e:
+            if e.errno != errorcode.ER_BAD_DB_ERROR:
+                raise
+            # First start against this server
+            self._create_database()
+            with self.checkout():
+                pass
+        logging.info("Successfully connected to the database")
+
+    def migrate(self):
+        """Apply pending migrations; an up-to-date schema costs one query"""
+        return self.migrator.migrate()
+
+    def preload_metadata(self):
+        """Load everything later lookups depend on so views never wait for it"""
+        # Trigger-maintained counters for the dashboard; created before the schema is cached
+        self.hospital_stats.ensure()
+
+        # Load table metadata once so form and table setup never hit INFORMATION_SCHEMA
+        self.schema.load()
+
+        # Tables created before the search indexes existed get them added here
+        self.people_search.ensure_indexes()
+
     def _create_database(self):
         """Create the database if it doesn't exist"""
         try:
             # Connect without database selected
-            config = {
-                'host': os.getenv('DB_HOST', 'localhost'),
-                'user': os.getenv('DB_USER', 'root'),
-                'password': os.getenv('DB_PASSWORD', ''),
-            }
-            
-            temp_connection = mysql.connector.connect(**config)
+            temp_connection = mysql.connector.connect(**self._connection_config())
             temp_cursor = temp_connection.cursor()
-            
+
             # Create database
-            db_name = os.getenv('DB_NAME', 'national_hospital')
-            temp_cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name}")
-            
+            temp_cursor.execute(f"CREATE DATABASE IF NOT EXISTS {self.db_name}")
+
             # Close temporary connection
             temp_cursor.close()
             temp_connection.close()
-            
-            # Now connect with the database
-            self.connect()
-            
+
         except Error as e:
             logging.error(f"Error creating database: {e}")
             raise
 
-    def _initialize_database(self):
-        """Initialize database tables if they don't exist"""
-        try:
-            # Read SQL file
-            sql_file_path = os.path.join(os.path.dirname(__file__), 'init_database.sql')
-            if os.path.exists(sql_file_path):
-                with open(sql_file_path, 'r') as file:
-                    sql_script = file.read()
-                
-                # Execute the entire script at once
-                self.cursor.execute("SET FOREIGN_KEY_CHECKS=0")
-                self.cursor.execute(sql_script, multi=True)
-                self.cursor.execute("SET FOREIGN_KEY_CHECKS=1")
-                self.connection.commit()
-                logging.info("Database tables initialized successfully")
-            
-        except Error as e:
-            logging.error(f"Error initializing database tables: {e}")
-            raise
+    @contextmanager
+    def checkout(self, timeout=None):
+        """Check a connection out of the pool for the duration of a with-block"""
+        if not self.pool:
+            raise Error("Database connection pool is not initialized")
+        with self.pool.connection(timeout) as connection:
+            yield connection
+
+    def get_pool_stats(self):
+        """Get connection pool usage metrics"""
+        return self.pool.get_stats() if self.pool else {}
 
     def disconnect(self):
-        """Safely close database connection"""
+        """Safely close all pooled connections"""
         try:
-            if hasattr(self, 'cursor') and self.cursor:
-                self.cursor.close()
-            if hasattr(self, 'connection') and self.connection:
-                if self.connection.in_transaction:
-                    self.connection.rollback()
-                self.connection.close()
+            if getattr(self, 'pool', None):
+                self.pool.close()
+                self.pool = None
             logging.info("Database connection closed successfully")
         except Exception as e:
             logging.error(f"Error closing database connection: {e}")
 
     def execute_query(self, query, params=None):
-        """Execute a query with optional parameters"""
+        """Execute a query and return its rows, or the affected row count"""
         try:
-            # Check connection and reconnect if needed
-            if not self.connection.is_connected():
-                self.connection.reconnect()
-                self.cursor = self.connection.cursor(dictionary=True)
-
-            # Execute query
-            self.cursor.execute(query, params or ())
+            with self.checkout() as connection:
+                cursor = connection.cursor(dictionary=True, buffered=True)
+                try:
+                    cursor.execute(query, params or ())
+                    result = cursor.fetchall() if cursor.with_rows else cursor.rowcount
+                finally:
+                    cursor.close()
+            if DDL_PATTERN.match(query):
+                self.schema.invalidate()
             logging.info("Query executed successfully")
-            return self.cursor
+            return result
         except Error as e:
             logging.error(f"Query attempt failed: {e}")
             logging.error(f"Query was: {query}")
@@ -128,36 +250,85 @@ class DatabaseManager:
                 logging.error(f"Parameters were: {params}")
             raise
 
+    def execute_prepared(self, query, params=None, dictionary=True):
+        """Execute a recurring query as a server-side prepared statement
+
+        Statements are prepared once per pooled connection and kept in a
+        bounded LRU keyed by SQL text, so repeated calls only send the
+        parameters. Returns rows, as dicts or tuples, or the affected row count.
+        """
+        try:
+            with self.checkout() as connection:
+                statements = self.pool.statements(connection)
+                cursor, statement = statements.get(query, dictionary)
+                try:
+                    cursor.execute(statement, tuple(params or ()))
+                    if cursor.with_rows:
+                        return cursor.fetchall()
+                    return cursor.rowcount
+                except Error:
+                    statements.discard(query, dictionary)
+                    raise
+        except Error as e:
+            logging.error(f"Prepared query failed: {e}")
+            logging.error(f"Query was: {query}")
+            raise
+
+    def fetch_one(self, query, params=None):
+        """Execute a query and return its first row"""
+        rows = self.execute_query(query, params)
+        return rows[0] if rows else None
+
+    def iter_chunks(self, query, params=None, chunk_size=1000, dictionary=False):
+        """Yield a query's rows in lists of up to chunk_size from an unbuffered cursor
+
+        Rows are tuples in SELECT order unless dictionary is set. Rows stay on
+        the server until fetched, so memory use depends on chunk_size rather
+        than the size of the result.
+        """
+        if not self.pool:
+            raise Error("Database connection pool is not initialized")
+        connection = self.pool.checkout()
+        finished = False
+        try:
+            # Unbuffered so rows stay on the server until fetched, whatever the connection default
+            cursor = connection.cursor(dictionary=dictionary, buffered=False)
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield rows
+            finished = True
+            cursor.close()
+        finally:
+            # A result abandoned part way leaves unread rows on the connection, so drop it
+            self.pool.checkin(connection, discard=not finished)
+
+    def iter_rows(self, query, params=None, chunk_size=1000):
+        """Yield a query's rows one at a time as tuples, fetching chunk_size rows per round trip"""
+        for rows in self.iter_chunks(query, params, chunk_size):
+            yield from rows
+
+    def _execute_write(self, query, params=None):
+        """Execute a write statement in its own transaction"""
+        with self.checkout() as connection:
+            cursor = connection.cursor()
+            try:
+                connection.start_transaction()
+                cursor.execute(query, params or ())
+                connection.commit()
+                return cursor.rowcount, cursor.lastrowid
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
     def get_table_fields(self, table_name):
         """Get field information for a table"""
         try:
-            query = """
-                SELECT 
-                    COLUMN_NAME,
-                    DATA_TYPE,
-                    IS_NULLABLE,
-                    COLUMN_DEFAULT,
-                    CHARACTER_MAXIMUM_LENGTH,
-                    COLUMN_KEY,
-                    EXTRA
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = DATABASE()
-                AND TABLE_NAME = %s
-                ORDER BY ORDINAL_POSITION
-            """
-            self.cursor.execute(query, (table_name,))
-            columns = {}
-            for row in self.cursor.fetchall():
-                columns[row['COLUMN_NAME']] = {
-                    'type': row['DATA_TYPE'],
-                    'required': row['IS_NULLABLE'] == 'NO',
-                    'nullable': row['IS_NULLABLE'] == 'YES',
-                    'default': row['COLUMN_DEFAULT'],
-                    'max_length': row['CHARACTER_MAXIMUM_LENGTH'],
-                    'key': row['COLUMN_KEY'],
-                    'auto_increment': row['EXTRA'] == 'auto_increment'
-                }
-            return columns
+            return self.schema.get_fields(table_name)
         except Error as e:
             logging.error(f"Error getting table fields: {e}")
             raise
@@ -168,8 +339,7 @@ class DatabaseManager:
             query = f"SELECT * FROM {table_name}"
             if conditions:
                 query += f" WHERE {conditions}"
-            self.cursor.execute(query)
-            return self.cursor.fetchall()
+            return self.execute_query(query)
         except Error as e:
             logging.error(f"Error getting records: {e}")
             raise
@@ -181,14 +351,99 @@ class DatabaseManager:
             placeholders = ', '.join(['%s'] * len(data))
             query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
             
-            self.cursor.execute(query, list(data.values()))
-            self.connection.commit()
-            return self.cursor.lastrowid
+            _, lastrowid = self._execute_write(query, list(data.values()))
+            self.notify_write(table_name, key=data.get(self.get_primary_key(table_name)) or lastrowid or None)
+            return lastrowid
         except Error as e:
-            self.connection.rollback()
             logging.error(f"Error inserting record: {e}")
             raise
 
+    def insert_many(self, table_name, rows, batch_size=500, upsert=False):
+        """Insert many records in multi-row INSERT batches inside one transaction
+
+        rows is an iterable of dicts sharing the same columns. Each batch runs
+        under its own savepoint, so a failing batch is rolled back and
+        reported while the others are committed together at the end. With
+        upsert, rows whose key already exists update the existing record.
+        Returns a dict with rows, inserted, affected_rows, batches and failures.
+        """
+        rows = iter(rows)
+        first = next(rows, None)
+        result = {'rows': 0, 'inserted': 0, 'affected_rows': 0, 'batches': 0, 'failures': []}
+        if first is None:
+            return result
+
+        fields = self.get_table_fields(table_name)
+        columns = list(first.keys())
+        unknown = [col for col in columns if col not in fields]
+        if unknown:
+            raise ValueError(f"Unknown columns for table {table_name}: {', '.join(unknown)}")
+
+        placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+        prefix = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES "
+        suffix = ''
+        if upsert:
+            primary_key = self.get_primary_key(table_name)
+            updates = [f"{col} = VALUES({col})" for col in columns if col != primary_key]
+            if updates:
+                suffix = " ON DUPLICATE KEY UPDATE " + ', '.join(updates)
+            else:
+                prefix = prefix.replace("INSERT INTO", "INSERT IGNORE INTO", 1)
+
+        batch_size = max(1, int(batch_size))
+        rows = itertools.chain([first], rows)
+        try:
+            with self.checkout() as connection:
+                cursor = connection.cursor()
+                try:
+                    # Savepoints need a transaction, which autocommit connections don't open themselves
+                    connection.start_transaction()
+                    start = 0
+                    while True:
+                        batch = list(itertools.islice(rows, batch_size))
+                        if not batch:
+                            break
+                        params = [row.get(col) for row in batch for col in columns]
+                        query = prefix + ', '.join([placeholders] * len(batch)) + suffix
+
+                        cursor.execute("SAVEPOINT insert_batch")
+                        try:
+                            cursor.execute(query, params)
+                            cursor.execute("RELEASE SAVEPOINT insert_batch")
+                            result['inserted'] += len(batch)
+                            result['affected_rows'] += cursor.rowcount
+                        except Error as e:
+                            cursor.execute("ROLLBACK TO SAVEPOINT insert_batch")
+                            logging.error(f"Batch {result['batches']} of {table_name} failed: {e}")
+                            result['failures'].append({
+                                'batch': result['batches'],
+                                'first_row': start,
+                                'rows': len(batch),
+                                'error': str(e)
+                            })
+
+                        result['batches'] += 1
+                        result['rows'] += len(batch)
+                        start += len(batch)
+
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+
+            self.notify_write(table_name)
+            logging.info(
+                f"Inserted {result['inserted']} of {result['rows']} rows into {table_name} "
+                f"in {result['batches']} batches"
+            )
+            return result
+
+        except Error as e:
+            logging.error(f"Error bulk inserting into {table_name}: {e}")
+            raise
+
     def update_record(self, table_name, data):
         """Update an existing record"""
         try:
@@ -245,12 +500,11 @@ class DatabaseManager:
             set_clause = ', '.join(updates)
             query = f"UPDATE {table_name} SET {set_clause} WHERE {primary_key} = %s"
             
-            self.cursor.execute(query, params)
-            self.connection.commit()
+            self._execute_write(query, params)
+            self.notify_write(table_name, key=record_id)
             return True
 
         except Exception as e:
-            self.connection.rollback()
             logging.error(f"Error updating record: {e}")
             raise
 
@@ -264,34 +518,52 @@ class DatabaseManager:
 
             # Delete the record
             query = f"DELETE FROM {table_name} WHERE {primary_key} = %s"
-            self.cursor.execute(query, (record_id,))
-            
-            # Commit the changes
-            self.connection.commit()
+            self._execute_write(query, (record_id,))
+            self.notify_write(table_name, key=record_id,
+                              cascades=str(table_name).upper() in CASCADING_DELETES)
             return True
 
         except Exception as e:
-            # Rollback on error
-            self.connection.rollback()
             logging.error(f"Error deleting record: {e}")
             raise
 
+    def notify_write(self, table_name, key=None, cascades=False):
+        """Drop derived data that a write to table_name made stale
+
+        Called after every write made through this manager; code that writes
+        on its own connection, like the importer, calls it itself. key is the
+        primary key of the single row written, if known.
+        """
+        table = str(table_name).upper()
+        self._write_generations[table] = self._write_generations.get(table, 0) + 1
+        if cascades:
+            # Foreign keys may have deleted or changed rows in any child table
+            self._cascade_generation += 1
+        self.people_search.mark_stale(table_name, key, cascades)
+        if str(table_name).upper() in DASHBOARD_TABLES:
+            self.invalidate_dashboard_stats()
+
+    def get_write_generation(self, table_name):
+        """Return a value that changes whenever table_name is written through this manager
+
+        Views compare it with the value they loaded under to tell whether
+        their rows are still current. Writes by other clients are not seen.
+        """
+        return (self._cascade_generation, self._write_generations.get(str(table_name).upper(), 0))
+
+    def get_record_by_pk(self, table_name, value):
+        """Get one record by its primary key, converted like get_table_data rows"""
+        primary_key = self.get_primary_key(table_name)
+        if not primary_key:
+            raise ValueError(f"No primary key found for table {table_name}")
+        query = f"SELECT {self._select_list(table_name)} FROM {table_name} WHERE {primary_key} = %s"
+        converted = self._convert_rows(table_name, self.execute_prepared(query, (value,), dictionary=False))
+        return converted[0] if converted else None
+
     def get_table_columns(self, table_name):
         """Get column names for a table"""
         try:
-            query = """
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.COLUMNS 
-                WHERE TABLE_SCHEMA = DATABASE()
-                AND TABLE_NAME = %s 
-                ORDER BY ORDINAL_POSITION
-            """
-            
-            if not self.execute_query(query, (table_name,)):
-                return []
-                
-            return [row['COLUMN_NAME'] for row in self.cursor.fetchall()]
-            
+            return self.schema.get_columns(table_name)
         except Exception as e:
             logging.error(f"Error getting columns for {table_name}: {e}")
             return []
@@ -299,10 +571,7 @@ class DatabaseManager:
     def get_table_column_types(self, table_name):
         """Get column names and their types for a given table"""
         try:
-            query = f"DESCRIBE {table_name}"
-            self.execute_query(query)
-            columns = self.cursor.fetchall()
-            return {col['Field']: col['Type'] for col in columns}  # Return column name to type mapping
+            return self.schema.get_column_types(table_name)
         except Exception as e:
             logging.error(f"Error getting column types: {e}")
             return {}
@@ -310,20 +579,7 @@ class DatabaseManager:
     def get_primary_key(self, table_name):
         """Get the primary key column name for a table"""
         try:
-            query = """
-                SELECT COLUMN_NAME 
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                WHERE TABLE_SCHEMA = DATABASE()
-                AND TABLE_NAME = %s
-                AND CONSTRAINT_NAME = 'PRIMARY'
-            """
-            
-            if not self.execute_query(query, (table_name,)):
-                return None
-                
-            result = self.cursor.fetchall()
-            return result[0]['COLUMN_NAME'] if result else None
-            
+            return self.schema.get_primary_key(table_name)
         except Exception as e:
             logging.error(f"Error getting primary key for {table_name}: {e}")
             return None
@@ -331,42 +587,25 @@ class DatabaseManager:
     def get_foreign_keys(self, table_name):
         """Get foreign key relationships for a table"""
         try:
-            query = """
-                SELECT 
-                    COLUMN_NAME,
-                    REFERENCED_TABLE_NAME,
-                    REFERENCED_COLUMN_NAME
-                FROM INFORMATION_SCHEMA.KEY_COLUMN_USAGE
-                WHERE TABLE_SCHEMA = DATABASE()
-                AND TABLE_NAME = %s
-                AND REFERENCED_TABLE_NAME IS NOT NULL
-            """
-            
-            if not self.execute_query(query, (table_name,)):
-                return {}
-                
-            foreign_keys = {}
-            for row in self.cursor.fetchall():
-                foreign_keys[row['COLUMN_NAME']] = {
-                    'referenced_table': row['REFERENCED_TABLE_NAME'],
-                    'referenced_column': row['REFERENCED_COLUMN_NAME']
-                }
-            return foreign_keys
-            
+            return self.schema.get_foreign_keys(table_name)
         except Exception as e:
             logging.error(f"Error getting foreign keys for {table_name}: {e}")
             return {}
 
+    def refresh_schema(self):
+        """Reload cached table metadata, e.g. after schema changes made elsewhere"""
+        self.schema.refresh()
+
     def get_related_records(self, table_name, column_name, value):
         """Get records from a table that reference the given value"""
         try:
             query = f"SELECT * FROM {table_name} WHERE {column_name} = %s"
             
-            if not self.execute_query(query, (value,)):
+            rows = self.execute_prepared(query, (value,))
+            if not rows:
                 return []
                 
             columns = self.get_table_columns(table_name)
-            rows = self.cursor.fetchall()
             
             result = []
             for row in rows:
@@ -380,64 +619,235 @@ class DatabaseManager:
             logging.error(f"Error getting related records from {table_name}: {e}")
             return []
 
-    def get_table_data(self, table_name, search_term=None):
-        """Get all records from a table with optional search"""
+    def get_table_data(self, table_name, search_term=None, as_tuples=False):
+        """Get all records from a table with optional search
+
+        With as_tuples, rows are tuples in get_table_columns order instead of dicts.
+        """
         try:
-            # Get table columns and their types
-            columns = self.get_table_columns(table_name)
-            column_types = self.get_table_column_types(table_name)
-            
-            # Build the query based on table name and search term
-            query = f"SELECT * FROM {table_name}"
-            params = None
-            
             if search_term:
-                search_conditions = []
-                for col in columns:
-                    search_conditions.append(f"CAST({col} AS CHAR) LIKE %s")
-                where_clause = " OR ".join(search_conditions)
-                query += f" WHERE {where_clause}"
-                params = tuple(f"%{search_term}%" for _ in columns)
-            
-            # Execute query with retry mechanism
-            if not self.execute_query(query, params):
-                return []
-            
-            # Convert results to list of dictionaries
-            rows = self.cursor.fetchall()
-            result = []
-            for row in rows:
-                row_dict = {}
-                for i, col in enumerate(columns):
-                    value = row[col]
-                    # Handle different data types
-                    if value is not None:
-                        col_type = column_types.get(col, '').lower()
-                        if 'datetime' in col_type:
-                            value = value.strftime('%Y-%m-%d %H:%M:%S')
-                        elif 'date' in col_type:
-                            value = value.strftime('%Y-%m-%d')
-                        elif 'decimal' in col_type:
-                            value = float(value)
-                        elif 'int' in col_type:
-                            value = int(value)
-                    row_dict[col] = value
-                result.append(row_dict)
-            return result
+                return self.search_table(table_name, search_term, as_tuples=as_tuples)
+
+            # Stream rows and convert each chunk as it arrives, so raw and converted rows never coexist
+            query = f"SELECT {self._select_list(table_name)} FROM {table_name}"
+            records = []
+            for rows in self.iter_chunks(query):
+                records.extend(self._convert_rows(table_name, rows, as_tuples))
+            return records
             
         except Exception as e:
             logging.error(f"Error fetching data from {table_name}: {e}")
             return []
 
+    def search_table(self, table_name, search_term, column=None, limit=500, as_tuples=False):
+        """Search one column, or every column, of a table
+
+        Text columns use a LIKE prefix match that can use an index, numeric
+        columns match exactly when the term is a number and date columns
+        match the range covered by a partial date such as 2024 or 2024-01.
+        At most limit records are returned.
+        """
+        try:
+            records = []
+            for chunk in self.iter_search(table_name, search_term, column, limit, as_tuples=as_tuples):
+                records.extend(chunk)
+            return records
+
+        except Exception as e:
+            logging.error(f"Error searching {table_name}: {e}")
+            raise
+
+    def _search_fields(self, table_name, column=None):
+        """Return the schema fields a search covers, validating the column name"""
+        fields = self.get_table_fields(table_name)
+        if column:
+            if column not in fields:
+                raise ValueError(f"Unknown column {column} for table {table_name}")
+            fields = {column: fields[column]}
+        return fields
+
+    def build_search_clause(self, table_name, search_term, column=None):
+        """Build a parameterized WHERE clause for a search term from the cached schema"""
+        term = str(search_term).strip()
+        conditions = []
+        params = []
+        for col, info in self._search_fields(table_name, column).items():
+            predicate = _column_predicate(col, info['type'].lower(), term)
+            if predicate:
+                conditions.append(predicate[0])
+                params.extend(predicate[1])
+
+        return " OR ".join(conditions), params
+
+    def iter_search(self, table_name, search_term, column=None, limit=500, chunk_size=100,
+                    as_tuples=False):
+        """Yield search results in chunks as they arrive from the server"""
+        where_clause, params = self.build_search_clause(table_name, search_term, column)
+        if not where_clause:
+            return
+
+        query = f"SELECT {self._select_list(table_name)} FROM {table_name} WHERE {where_clause} LIMIT %s"
+        for rows in self.iter_chunks(query, tuple(params) + (int(limit),), chunk_size):
+            yield self._convert_rows(table_name, rows, as_tuples)
+
+    def filter_records(self, table_name, records, search_term, column=None):
+        """Apply a search to records already fetched, or return None if only the server can
+
+        Terms that only compare against text columns are applied in memory;
+        numbers and dates need the typed predicates of search_table.
+        """
+        term = str(search_term).strip()
+        text_columns = []
+        for col, info in self._search_fields(table_name, column).items():
+            data_type = info['type'].lower()
+            if data_type in TEXT_TYPES:
+                text_columns.append(col)
+            elif _column_predicate(col, data_type, term):
+                return None
+
+        needle = term.lower()
+        return [
+            record for record in records
+            if any(str(record.get(col) or '').lower().startswith(needle) for col in text_columns)
+        ]
+
+    def _select_list(self, table_name):
+        """Column list for SELECTs whose tuple rows _convert_rows expects"""
+        return ', '.join(self._row_converter(table_name)[0])
+
+    def _row_converter(self, table_name):
+        """Get the column names and per-column value converters for a table, built once per schema load"""
+        generation = self.schema.generation
+        cached = self._row_converters.get(table_name)
+        if cached and cached[0] == generation:
+            return cached[1]
+
+        # Tagged with the generation read before the lookups, so a reload part way rebuilds them next time
+        columns = tuple(self.get_table_columns(table_name))
+        column_types = self.get_table_column_types(table_name)
+        converters = tuple(_value_converter(column_types.get(col, '')) for col in columns)
+        self._row_converters[table_name] = (generation, (columns, converters))
+        return columns, converters
+
+    def _convert_rows(self, table_name, rows, as_tuples=False):
+        """Convert raw tuple rows, selected with _select_list, into display-ready dictionaries"""
+        if not rows:
+            return []
+        columns, converters = self._row_converter(table_name)
+
+        # Convert column by column so each typed column is one tight loop and other columns are untouched
+        values = list(zip(*rows))
+        for index, convert in enumerate(converters):
+            if convert:
+                values[index] = convert(values[index])
+        rows = zip(*values)
+
+        if as_tuples:
+            return list(rows)
+        return [dict(zip(columns, row)) for row in rows]
+
+    def get_table_page(self, table_name, page_size=200, order_by=None, descending=False,
+                       after=None, with_total=False):
+        """Get one page of records using keyset pagination
+
+        order_by must be the primary key or an indexed column; after is the
+        next_cursor returned for the previous page. Returns a dict with rows,
+        next_cursor, has_more and, when with_total is set, total and
+        total_is_estimate.
+        """
+        try:
+            fields = self.get_table_fields(table_name)
+            primary_key = self.get_primary_key(table_name)
+            if not fields or not primary_key:
+                raise ValueError(f"No primary key found for table {table_name}")
+
+            order_by = order_by or primary_key
+            if order_by not in fields:
+                raise ValueError(f"Unknown column {order_by} for table {table_name}")
+            if not fields[order_by]['indexed']:
+                raise ValueError(f"Column {order_by} does not lead a BTREE index and cannot be used for paging")
+
+            direction = 'DESC' if descending else 'ASC'
+            op = '<' if descending else '>'
+            query = f"SELECT {self._select_list(table_name)} FROM {table_name}"
+            params = []
+
+            if after is not None:
+                if order_by == primary_key:
+                    query += f" WHERE {primary_key} {op} %s"
+                    params.append(after[-1])
+                else:
+                    last_value, last_key = after
+                    if last_value is None:
+                        # NULLs sort first ascending and last descending
+                        if descending:
+                            query += f" WHERE {order_by} IS NULL AND {primary_key} < %s"
+                        else:
+                            query += f" WHERE {order_by} IS NOT NULL OR ({order_by} IS NULL AND {primary_key} > %s)"
+                        params.append(last_key)
+                    else:
+                        query += (f" WHERE ({order_by} {op} %s"
+                                  f" OR ({order_by} = %s AND {primary_key} {op} %s)")
+                        query += f" OR {order_by} IS NULL)" if descending else ")"
+                        params.extend([last_value, last_value, last_key])
+
+            if order_by == primary_key:
+                query += f" ORDER BY {primary_key} {direction}"
+            else:
+                query += f" ORDER BY {order_by} {direction}, {primary_key} {direction}"
+            query += " LIMIT %s"
+            params.append(int(page_size) + 1)
+
+            # Only a handful of distinct page queries exist per table, so they are worth preparing
+            rows = self.execute_prepared(query, params, dictionary=False)
+            has_more = len(rows) > page_size
+            rows = rows[:page_size]
+
+            # The cursor keeps raw values so the next page compares like with like
+            next_cursor = None
+            if has_more and rows:
+                columns = self.get_table_columns(table_name)
+                last = rows[-1]
+                next_cursor = (last[columns.index(order_by)], last[columns.index(primary_key)])
+
+            page = {
+                'rows': self._convert_rows(table_name, rows),
+                'next_cursor': next_cursor,
+                'has_more': has_more
+            }
+            if with_total:
+                page['total'], page['total_is_estimate'] = self.estimate_row_count(table_name)
+            return page
+
+        except Exception as e:
+            logging.error(f"Error fetching page from {table_name}: {e}")
+            raise
+
+    def estimate_row_count(self, table_name, exact_below=50000):
+        """Estimate a table's row count from table statistics
+
+        Small tables are counted exactly since COUNT(*) is cheap for them.
+        Returns a (count, is_estimate) tuple.
+        """
+        result = self.fetch_one("""
+            SELECT TABLE_ROWS
+            FROM INFORMATION_SCHEMA.TABLES
+            WHERE TABLE_SCHEMA = DATABASE()
+            AND TABLE_NAME = %s
+        """, (table_name,))
+        estimate = result['TABLE_ROWS'] if result else None
+        if estimate is None or estimate < exact_below:
+            return self.count_records(table_name), False
+        return int(estimate), True
+
     def count_records(self, table_name, condition=""):
         """Count records in a table with optional condition"""
         query = f"SELECT COUNT(*) FROM {table_name}"
         if condition:
             query += f" {condition}"
         try:
-            self.execute_query(query)
-            result = self.cursor.fetchone()
-            return result['COUNT(*)'] if result else 0
+            rows = self.execute_prepared(query, dictionary=False)
+            return rows[0][0] if rows else 0
         except Exception as e:
             print(f"Error counting records: {e}")
             return 0
@@ -448,22 +858,23 @@ class DatabaseManager:
             query = f"SELECT COUNT(*) FROM {table_name}"
             if condition:
                 query += f" {condition}"
-            self.execute_query(query)
-            result = self.cursor.fetchone()
-            return result['COUNT(*)'] if result else 0
+            rows = self.execute_prepared(query, dictionary=False)
+            return rows[0][0] if rows else 0
         except Exception as e:
             print(f"Error getting record count: {e}")
             return 0
 
+    def search_people(self, term, limit=20):
+        """Ranked lookup of patients, dependents and doctors by partial name or contact"""
+        try:
+            return self.people_search.search(term, limit)
+        except Exception as e:
+            logging.error(f"Error searching people: {e}")
+            return []
+
     def get_patient_data(self, search_term=None):
         """Get patient data with dependent count"""
         try:
-            # First check connection
-            if not self.connection.is_connected():
-                logging.info("Reconnecting to database...")
-                self.connection.reconnect()
-                self.cursor = self.connection.cursor(dictionary=True)
-                
             base_query = """
                 SELECT 
                     p.PATIENT_ID,
@@ -481,14 +892,9 @@ class DatabaseManager:
             """
             
             if search_term:
-                base_query += """
-                    WHERE (
-                        p.PATIENT_ID LIKE %s OR 
-                        p.PATIENT_NAME LIKE %s OR 
-                        p.PHONE LIKE %s
-                    )
-                """
-                params = tuple(f"%{search_term}%" for _ in range(3))
+                where_clause, params = self.people_search.filter_clause('PATIENT', search_term, 'p')
+                base_query += f" WHERE {where_clause}"
+                params = tuple(params)
             else:
                 params = None
             
@@ -498,11 +904,7 @@ class DatabaseManager:
             if params:
                 logging.info(f"With parameters: {params}")
             
-            if not self.execute_query(base_query, params):
-                logging.error("Patient query execution failed")
-                return []
-                
-            result = self.cursor.fetchall()
+            result = self.execute_query(base_query, params)
             logging.info(f"Patient query successful, retrieved {len(result)} records")
             if len(result) > 0:
                 logging.info(f"First patient record: {result[0]}")
@@ -528,14 +930,11 @@ class DatabaseManager:
             """
             
             if search_term:
-                base_query += """
-                    WHERE (
-                        d.DEPENDENT_ID LIKE %s OR 
-                        d.NAME LIKE %s OR 
-                        p.PATIENT_NAME LIKE %s
-                    )
-                """
-                params = tuple(f"%{search_term}%" for _ in range(3))
+                # Dependents also match through their patient's name or contact
+                where_clause, params = self.people_search.filter_clause(
+                    'DEPENDENTS', search_term, 'd', parent=('PATIENT', 'PATIENT_ID'))
+                base_query += f" WHERE {where_clause}"
+                params = tuple(params)
             else:
                 params = None
 
@@ -543,11 +942,7 @@ class DatabaseManager:
             if params:
                 logging.info(f"With parameters: {params}")
 
-            if not self.execute_query(base_query, params):
-                logging.error("Dependent query execution failed")
-                return []
-
-            result = self.cursor.fetchall()
+            result = self.execute_query(base_query, params)
             logging.info(f"Dependent query successful, retrieved {len(result)} records")
             if len(result) > 0:
                 logging.info(f"First dependent record: {result[0]}")
@@ -557,27 +952,86 @@ class DatabaseManager:
             logging.error(f"Error fetching dependent data: {e}")
             return []
 
+    def get_dashboard_stats(self, max_age=None):
+        """Get the dashboard figures, reusing cached ones younger than max_age seconds
+
+        Returns patients, doctors, available_rooms, appointments_today,
+        pending_bills and total_revenue. They are read from the summary
+        tables, or counted with a single query when those are unavailable.
+        """
+        stats = self.cached_dashboard_stats(max_age)
+        if stats is not None:
+            return stats
+
+        generation = self._dashboard_generation
+        row = None
+        if self.hospital_stats.available:
+            try:
+                row = self.hospital_stats.read()
+            except Error as e:
+                logging.warning(f"Could not read summary statistics, counting tables instead: {e}")
+        if row is None:
+            rows = self.execute_prepared(DASHBOARD_STATS_QUERY)
+            row = rows[0] if rows else {}
+        stats = {key: int(row.get(key) or 0) for key in
+                 ('patients', 'doctors', 'available_rooms', 'appointments_today', 'pending_bills')}
+        stats['total_revenue'] = float(row.get('total_revenue') or 0)
+
+        # A write that landed while the query ran may not be counted, so don't cache the result
+        if generation == self._dashboard_generation:
+            self._dashboard_stats = (stats, time.monotonic())
+        return dict(stats)
+
+    def cached_dashboard_stats(self, max_age=None):
+        """Return the cached dashboard figures if they are fresh, without querying"""
+        cached = self._dashboard_stats
+        if max_age is None:
+            max_age = self.dashboard_stats_ttl
+        if cached and time.monotonic() - cached[1] <= max_age:
+            return dict(cached[0])
+        return None
+
+    def reconcile_hospital_stats(self, if_due=False):
+        """Recount the summary tables from the source tables to repair drift
+
+        With if_due, only recount once stats_reconcile_interval has passed
+        since the last recount. Returns whether a recount ran.
+        """
+        if if_due:
+            if not self.hospital_stats.reconcile_if_due():
+                return False
+        else:
+            self.hospital_stats.reconcile()
+        self.invalidate_dashboard_stats()
+        return True
+
+    def invalidate_dashboard_stats(self):
+        """Forget the cached dashboard figures"""
+        self._dashboard_generation += 1
+        self._dashboard_stats = None
+
+    def _dashboard_stat(self, name, default=0):
+        try:
+            return self.get_dashboard_stats()[name]
+        except Exception as e:
+            logging.error(f"Error getting dashboard statistics: {e}")
+            return default
+
     def count_today_appointments(self):
         """Count appointments scheduled for today"""
-        return self.get_record_count("APPOINTMENT", "WHERE DATE(date) = CURRENT_DATE")
+        return self._dashboard_stat('appointments_today')
 
     def count_available_rooms(self):
-        """Count available rooms"""
-        return self.get_record_count("ROOM", "WHERE status='Available'")
+        """Count rooms with a free bed"""
+        return self._dashboard_stat('available_rooms')
 
     def count_pending_bills(self):
-        """Count pending bills"""
-        return self.get_record_count("BILLING", "WHERE status='Pending'")
+        """Count bills that are not paid yet"""
+        return self._dashboard_stat('pending_bills')
 
     def get_total_revenue(self):
         """Calculate total revenue from paid bills"""
-        try:
-            self.execute_query("SELECT SUM(amount) FROM BILLING WHERE status='Paid'")
-            result = self.cursor.fetchone()
-            return float(result['SUM(amount)']) if result and result['SUM(amount)'] else 0.0
-        except Exception as e:
-            print(f"Error calculating revenue: {e}")
-            return 0.0
+        return self._dashboard_stat('total_revenue', 0.0)
 
     def __del__(self):
         """Ensure connection is closed on deletion"""
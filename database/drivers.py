@@ -0,0 +1,43 @@
+import mysql.connector
+import logging
+
+
+# Protocol implementations mysql.connector can use, fastest first
+DRIVERS = ('cext', 'pure')
+
+
+def available_drivers():
+    """List the drivers that can be used in this environment"""
+    drivers = []
+    if getattr(mysql.connector, 'HAVE_CEXT', False):
+        drivers.append('cext')
+    drivers.append('pure')
+    return drivers
+
+
+def select_driver(preference='auto'):
+    """Resolve a driver preference of auto, cext or pure to a usable driver
+
+    auto picks the C extension whenever it is installed. Asking for the C
+    extension where it is missing falls back to pure Python with a warning.
+    """
+    preference = str(preference or 'auto').strip().lower()
+    available = available_drivers()
+    if preference == 'auto':
+        return available[0]
+    if preference not in DRIVERS:
+        raise ValueError(f"Unknown database driver {preference!r}; use auto, {' or '.join(DRIVERS)}")
+    if preference not in available:
+        logging.warning(f"Database driver {preference} is not installed, using {available[0]}")
+        return available[0]
+    return preference
+
+
+def driver_options(driver):
+    """Connection arguments that make mysql.connector use a driver"""
+    return {'use_pure': driver == 'pure'}
+
+# References
+# 1. **MySQL Connector/Python C Extension**
+#    - Used for: Decoding result rows in C instead of Python
+#    - Documentation: [Connector/Python C Extension](https://dev.mysql.com/doc/connector-python/en/connector-python-cext.html)
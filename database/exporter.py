@@ -0,0 +1,191 @@
+from datetime import datetime, date
+from pathlib import Path
+import csv
+import logging
+import os
+
+
+class ExportCancelled(Exception):
+    """Raised when the caller cancels an export part way"""
+
+
+class TableExporter:
+    """Stream a table, or the rows matching a search, to a CSV, XLSX or PDF file
+
+    Rows come from an unbuffered cursor a chunk at a time and are written
+    straight to the file, so memory use does not grow with the table. A PDF
+    document keeps its finished pages until it is saved, so PDF exports are
+    split into files of at most pdf_pages_per_file pages: name.pdf,
+    name-2.pdf, and so on.
+    """
+
+    def __init__(self, db, table_name, chunk_size=1000, pdf_pages_per_file=500):
+        self.db = db
+        self.table_name = table_name
+        self.chunk_size = chunk_size
+        self.pdf_pages_per_file = pdf_pages_per_file
+        self.files = []  # paths written by the last run
+        self.columns = db.get_table_columns(table_name)
+        if not self.columns:
+            raise ValueError(f"No fields found for table {table_name}")
+
+    def run(self, path, search_term=None, column=None, progress=None, token=None):
+        """Write the rows to path, choosing the format from its extension
+
+        progress(rows_written) is called after every chunk; token is any
+        object with a cancelled attribute. Returns the number of rows written.
+        """
+        suffix = Path(path).suffix.lower()
+        writers = {'.csv': self._write_csv, '.xlsx': self._write_xlsx, '.pdf': self._write_pdf}
+        if suffix not in writers:
+            raise ValueError(f"Unsupported export format: {suffix or path}")
+
+        self.files = [path]
+        try:
+            count = writers[suffix](path, self._chunks(search_term, column, progress, token))
+        except BaseException:
+            # Don't leave half-written files behind
+            for file in self.files:
+                if os.path.exists(file):
+                    os.remove(file)
+            raise
+        logging.info(f"Exported {count} rows from {self.table_name} to {', '.join(map(str, self.files))}")
+        return count
+
+    def _chunks(self, search_term, column, progress, token):
+        """Yield chunks of tuple rows in column order straight from the cursor"""
+        query = f"SELECT {', '.join(self.columns)} FROM {self.table_name}"
+        params = ()
+        if search_term:
+            where_clause, params = self.db.build_search_clause(self.table_name, search_term, column)
+            if not where_clause:
+                return
+            query += f" WHERE {where_clause}"
+        primary_key = self.db.get_primary_key(self.table_name)
+        if primary_key:
+            query += f" ORDER BY {primary_key}"
+
+        written = 0
+        for rows in self.db.iter_chunks(query, tuple(params), self.chunk_size):
+            if token is not None and token.cancelled:
+                raise ExportCancelled("Export cancelled")
+            yield rows
+            written += len(rows)
+            if progress:
+                progress(written)
+
+    def _write_csv(self, path, chunks):
+        count = 0
+        with open(path, 'w', newline='', encoding='utf-8-sig') as file:
+            writer = csv.writer(file)
+            writer.writerow(self.columns)
+            for rows in chunks:
+                writer.writerows(tuple('' if value is None else value for value in row) for row in rows)
+                count += len(rows)
+        return count
+
+    def _write_xlsx(self, path, chunks):
+        # openpyxl is only needed for Excel exports
+        from openpyxl import Workbook
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title=self.table_name[:31])
+        sheet.append(self.columns)
+        count = 0
+        for rows in chunks:
+            for row in rows:
+                sheet.append(row)
+            count += len(rows)
+        workbook.save(path)
+        return count
+
+    def _write_pdf(self, path, chunks):
+        # reportlab is only needed for PDF exports
+        from reportlab.lib.pagesizes import A4, landscape
+        from reportlab.pdfbase.pdfmetrics import stringWidth
+        from reportlab.pdfgen import canvas
+
+        page_width, page_height = landscape(A4)
+        margin = 36
+        font, font_size, row_height = 'Helvetica', 8, 12
+        column_width = (page_width - 2 * margin) / len(self.columns)
+
+        pdf = None
+        page = 0
+
+        def fit(text):
+            # Trim text to its column instead of wrapping so every row is one line
+            text = str(text)
+            limit = column_width - 4
+            if stringWidth(text, font, font_size) <= limit:
+                return text
+            while text and stringWidth(text + '…', font, font_size) > limit:
+                text = text[:-1]
+            return text + '…'
+
+        def open_file():
+            # Later parts go next to the first: patients.pdf, patients-2.pdf, ...
+            if page:
+                target = Path(path)
+                target = str(target.with_name(f"{target.stem}-{len(self.files) + 1}{target.suffix}"))
+                self.files.append(target)
+            document = canvas.Canvas(self.files[-1], pagesize=(page_width, page_height))
+            document.setTitle(self.table_name)
+            return document
+
+        def start_page():
+            nonlocal pdf, page
+            if pdf is None:
+                pdf = open_file()
+            elif page % self.pdf_pages_per_file == 0:
+                pdf.save()
+                pdf = open_file()
+            else:
+                pdf.showPage()
+            page += 1
+            y = page_height - margin
+            pdf.setFont('Helvetica-Bold', 12)
+            pdf.drawString(margin, y, f"{self.table_name} - page {page}")
+            y -= row_height * 2
+            pdf.setFont('Helvetica-Bold', font_size)
+            for index, col in enumerate(self.columns):
+                pdf.drawString(margin + index * column_width, y, fit(col.replace('_', ' ').title()))
+            pdf.line(margin, y - 3, page_width - margin, y - 3)
+            pdf.setFont(font, font_size)
+            return y - row_height
+
+        y = start_page()
+        count = 0
+        for rows in chunks:
+            for row in rows:
+                if y < margin:
+                    y = start_page()
+                for index, value in enumerate(row):
+                    pdf.drawString(margin + index * column_width, y, fit(_display(value)))
+                y -= row_height
+            count += len(rows)
+        pdf.save()
+        return count
+
+
+def _display(value):
+    """Format a value for the PDF export"""
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    # Decimals keep their column's scale, e.g. BILLING.AMOUNT's three places
+    return str(value)
+
+# References
+# 1. **openpyxl**
+#    - Used for: Write-only Excel workbooks
+#    - Documentation: [openpyxl Documentation](https://openpyxl.readthedocs.io/en/stable/optimized.html)
+# 2. **ReportLab**
+#    - Used for: Drawing PDF pages row by row
+#    - Documentation: [ReportLab User Guide](https://docs.reportlab.com/reportlab/userguide/ch2_graphics/)
+# 3. **Python csv module**
+#    - Used for: Writing CSV files
+#    - Documentation: [csv Documentation](https://docs.python.org/3/library/csv.html)
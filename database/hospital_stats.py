@@ -0,0 +1,241 @@
+from mysql.connector import Error
+import logging
+import time
+
+
+# How much one row of a table contributes to each counter; {row} is NEW or OLD in the triggers
+STAT_CONTRIBUTIONS = {
+    'PATIENT': {'patients': "1"},
+    'DOCTOR': {'doctors': "1"},
+    'ROOM': {'available_rooms': "({row}.OCCUPIED < {row}.CAPACITY)"},
+    'BILLING': {
+        'pending_bills': "({row}.PAYMENT_STATUS <> 'Paid')",
+        'total_revenue': "IF({row}.PAYMENT_STATUS = 'Paid', {row}.AMOUNT, 0)"
+    },
+}
+
+# Rows of counted tables that ON DELETE CASCADE removes along with a parent row, by parent.
+# Cascaded deletes do not fire triggers, so a BEFORE DELETE trigger on the parent subtracts
+# them; every predicate follows a foreign key index, so the cost is the rows cascaded.
+_ROOM_PATIENTS = "SELECT PATIENT_ID FROM PATIENT WHERE ROOM_ID = OLD.ROOM_ID"
+_DOCTOR_PATIENTS = "SELECT PATIENT_ID FROM PATIENT WHERE DOCTOR_ID = OLD.DOCTOR_ID"
+_DEPARTMENT_ROOMS = "SELECT ROOM_ID FROM ROOM WHERE DEPARTMENT_ID = OLD.DEPARTMENT_ID"
+_DEPARTMENT_PATIENTS = f"SELECT PATIENT_ID FROM PATIENT WHERE ROOM_ID IN ({_DEPARTMENT_ROOMS})"
+CASCADED_ROWS = {
+    'PATIENT': {
+        'BILLING': "PATIENT_ID = OLD.PATIENT_ID",
+        'APPOINTMENT': "PATIENT_ID = OLD.PATIENT_ID",
+    },
+    'ROOM': {
+        'PATIENT': "ROOM_ID = OLD.ROOM_ID",
+        'BILLING': f"PATIENT_ID IN ({_ROOM_PATIENTS})",
+        'APPOINTMENT': f"PATIENT_ID IN ({_ROOM_PATIENTS})",
+    },
+    'DOCTOR': {
+        'PATIENT': "DOCTOR_ID = OLD.DOCTOR_ID",
+        'BILLING': f"PATIENT_ID IN ({_DOCTOR_PATIENTS})",
+        'APPOINTMENT': f"DOCTOR_ID = OLD.DOCTOR_ID OR PATIENT_ID IN ({_DOCTOR_PATIENTS})",
+    },
+    'DEPARTMENT': {
+        'ROOM': "DEPARTMENT_ID = OLD.DEPARTMENT_ID",
+        'PATIENT': f"ROOM_ID IN ({_DEPARTMENT_ROOMS})",
+        'BILLING': f"PATIENT_ID IN ({_DEPARTMENT_PATIENTS})",
+        'APPOINTMENT': f"PATIENT_ID IN ({_DEPARTMENT_PATIENTS})",
+    },
+}
+
+# Deleting from these cascades into counted tables
+CASCADING_DELETES = set(CASCADED_ROWS)
+
+# Full recount of every counter, used to seed the tables and to repair drift
+RECOUNT_STATS = """
+    REPLACE INTO HOSPITAL_STATS (STAT_NAME, STAT_VALUE)
+    SELECT 'patients', COUNT(*) FROM PATIENT
+    UNION ALL SELECT 'doctors', COUNT(*) FROM DOCTOR
+    UNION ALL SELECT 'available_rooms', COUNT(*) FROM ROOM WHERE OCCUPIED < CAPACITY
+    UNION ALL SELECT 'pending_bills', COUNT(*) FROM BILLING WHERE PAYMENT_STATUS <> 'Paid'
+    UNION ALL SELECT 'total_revenue', COALESCE(SUM(AMOUNT), 0) FROM BILLING WHERE PAYMENT_STATUS = 'Paid'
+    UNION ALL SELECT 'reconciled_at', UNIX_TIMESTAMP()
+"""
+
+RECOUNT_APPOINTMENT_DAYS = """
+    INSERT INTO APPOINTMENT_DAILY_COUNT (APPOINTMENT_DAY, APPOINTMENT_COUNT)
+    SELECT DATE(APPOINTMENT_DATE), COUNT(*) FROM APPOINTMENT GROUP BY DATE(APPOINTMENT_DATE)
+"""
+
+# Every counter plus today's appointments in one primary key lookup per table
+READ_STATS = """
+    SELECT STAT_NAME, STAT_VALUE FROM HOSPITAL_STATS
+    UNION ALL
+    SELECT 'appointments_today', APPOINTMENT_COUNT FROM APPOINTMENT_DAILY_COUNT
+    WHERE APPOINTMENT_DAY = CURDATE()
+"""
+
+
+def _counter_update(deltas):
+    """Build an UPDATE adding each counter's delta expression"""
+    cases = ' '.join(f"WHEN '{name}' THEN {delta}" for name, delta in deltas.items())
+    names = ', '.join(f"'{name}'" for name in deltas)
+    return (f"UPDATE HOSPITAL_STATS SET STAT_VALUE = STAT_VALUE + CASE STAT_NAME {cases} END "
+            f"WHERE STAT_NAME IN ({names})")
+
+
+def _day_change(day, step):
+    """Build a statement moving an appointment day's count by step"""
+    if step > 0:
+        return (f"INSERT INTO APPOINTMENT_DAILY_COUNT (APPOINTMENT_DAY, APPOINTMENT_COUNT) "
+                f"VALUES ({day}, 1) ON DUPLICATE KEY UPDATE APPOINTMENT_COUNT = APPOINTMENT_COUNT + 1")
+    return (f"UPDATE APPOINTMENT_DAILY_COUNT SET APPOINTMENT_COUNT = APPOINTMENT_COUNT - 1 "
+            f"WHERE APPOINTMENT_DAY = {day}")
+
+
+def _cascade_body(cascaded):
+    """Build a trigger body subtracting the rows a parent delete is about to cascade to"""
+    deltas = {}
+    for table, condition in cascaded.items():
+        for name, expr in STAT_CONTRIBUTIONS.get(table, {}).items():
+            deltas[name] = (f"-(SELECT COALESCE(SUM({expr.format(row=table)}), 0) "
+                            f"FROM {table} WHERE {condition})")
+    statements = [_counter_update(deltas)]
+    if 'APPOINTMENT' in cascaded:
+        statements.append(
+            f"UPDATE APPOINTMENT_DAILY_COUNT AS DAILY JOIN ("
+            f"SELECT DATE(APPOINTMENT_DATE) AS APPOINTMENT_DAY, COUNT(*) AS REMOVED FROM APPOINTMENT "
+            f"WHERE {cascaded['APPOINTMENT']} GROUP BY DATE(APPOINTMENT_DATE)) AS GONE "
+            f"ON DAILY.APPOINTMENT_DAY = GONE.APPOINTMENT_DAY "
+            f"SET DAILY.APPOINTMENT_COUNT = DAILY.APPOINTMENT_COUNT - GONE.REMOVED"
+        )
+    return f"BEGIN {'; '.join(statements)}; END"
+
+
+def build_triggers():
+    """Return {trigger name: CREATE TRIGGER statement} keeping the counters current"""
+    triggers = {}
+    for table, contributions in STAT_CONTRIBUTIONS.items():
+        new = {name: expr.format(row='NEW') for name, expr in contributions.items()}
+        old = {name: expr.format(row='OLD') for name, expr in contributions.items()}
+        bodies = {
+            'insert': _counter_update(new),
+            'delete': _counter_update({name: f"-{expr}" for name, expr in old.items()}),
+        }
+        # Only tables whose contribution depends on column values need an update trigger
+        if any('{row}' in expr for expr in contributions.values()):
+            bodies['update'] = _counter_update({name: f"{new[name]} - {old[name]}" for name in contributions})
+        for event, body in bodies.items():
+            name = f"trg_stats_{table.lower()}_{event}"
+            triggers[name] = f"CREATE TRIGGER {name} AFTER {event.upper()} ON {table} FOR EACH ROW {body}"
+
+    new_day, old_day = "DATE(NEW.APPOINTMENT_DATE)", "DATE(OLD.APPOINTMENT_DATE)"
+    triggers['trg_stats_appointment_insert'] = (
+        f"CREATE TRIGGER trg_stats_appointment_insert AFTER INSERT ON APPOINTMENT "
+        f"FOR EACH ROW {_day_change(new_day, 1)}"
+    )
+    triggers['trg_stats_appointment_delete'] = (
+        f"CREATE TRIGGER trg_stats_appointment_delete AFTER DELETE ON APPOINTMENT "
+        f"FOR EACH ROW {_day_change(old_day, -1)}"
+    )
+    triggers['trg_stats_appointment_update'] = (
+        f"CREATE TRIGGER trg_stats_appointment_update AFTER UPDATE ON APPOINTMENT "
+        f"FOR EACH ROW BEGIN IF {new_day} <> {old_day} THEN "
+        f"{_day_change(old_day, -1)}; {_day_change(new_day, 1)}; END IF; END"
+    )
+
+    for table, cascaded in CASCADED_ROWS.items():
+        name = f"trg_stats_{table.lower()}_cascade"
+        triggers[name] = (f"CREATE TRIGGER {name} BEFORE DELETE ON {table} "
+                          f"FOR EACH ROW {_cascade_body(cascaded)}")
+    return triggers
+
+
+class HospitalStats:
+    """Dashboard counters kept current by triggers so reading them costs the same at any data volume
+
+    HOSPITAL_STATS holds one row per counter and APPOINTMENT_DAILY_COUNT one
+    row per day. Triggers on the source tables adjust them on every write,
+    including the rows removed by cascading deletes. reconcile() recounts
+    everything to repair drift from writes made while the triggers were
+    missing; it runs at connect and from reconcile_if_due(), which the app
+    calls periodically so long sessions are repaired too.
+    """
+
+    def __init__(self, db, reconcile_interval=86400):
+        self.db = db
+        self.reconcile_interval = reconcile_interval
+        self.available = None  # unknown until ensure() runs
+
+    def ensure(self):
+        """Create missing triggers, then reconcile if it is due
+
+        The summary tables themselves come from migration 003_hospital_stats.
+        """
+        try:
+            rows = self.db.execute_query("""
+                SELECT TRIGGER_NAME FROM INFORMATION_SCHEMA.TRIGGERS
+                WHERE TRIGGER_SCHEMA = DATABASE()
+            """)
+            existing = {row['TRIGGER_NAME'].lower() for row in rows}
+            created = False
+            for name, statement in build_triggers().items():
+                if name in existing:
+                    continue
+                logging.info(f"Creating statistics trigger {name}")
+                self.db.execute_query(statement)
+                created = True
+
+            self.available = True
+            # Counters only track writes made after their triggers existed
+            if created or self.due():
+                self.reconcile()
+
+        except Error as e:
+            logging.warning(f"Summary statistics unavailable, counting tables instead: {e}")
+            self.available = False
+
+    def due(self):
+        """Whether the last recount is older than reconcile_interval"""
+        rows = self.db.execute_query(
+            "SELECT STAT_VALUE FROM HOSPITAL_STATS WHERE STAT_NAME = 'reconciled_at'"
+        )
+        if not rows:
+            return True
+        return time.time() - float(rows[0]['STAT_VALUE']) >= self.reconcile_interval
+
+    def reconcile(self):
+        """Recount every counter from the source tables in one transaction"""
+        started = time.perf_counter()
+        with self.db.checkout() as connection:
+            cursor = connection.cursor()
+            try:
+                connection.start_transaction()
+                cursor.execute(RECOUNT_STATS)
+                cursor.execute("DELETE FROM APPOINTMENT_DAILY_COUNT")
+                cursor.execute(RECOUNT_APPOINTMENT_DAYS)
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        logging.info(f"Summary statistics reconciled in {time.perf_counter() - started:.2f}s")
+
+    def reconcile_if_due(self):
+        """Reconcile when reconcile_interval has passed; return whether it ran"""
+        if not self.available or not self.due():
+            return False
+        self.reconcile()
+        return True
+
+    def read(self):
+        """Return every counter by name, with appointments_today defaulting to 0"""
+        rows = self.db.execute_prepared(READ_STATS, dictionary=False)
+        stats = {'appointments_today': 0}
+        stats.update((name, value) for name, value in rows)
+        return stats
+
+# References
+# 1. **MySQL Triggers**
+#    - Used for: Keeping the summary counters current on every write
+#    - Documentation: [CREATE TRIGGER Statement](https://dev.mysql.com/doc/refman/8.0/en/create-trigger.html)
+# 2. **MySQL REPLACE**
+#    - Used for: Rewriting counters during reconciliation
+#    - Documentation: [REPLACE Statement](https://dev.mysql.com/doc/refman/8.0/en/replace.html)
@@ -0,0 +1,371 @@
+from mysql.connector import Error
+from datetime import datetime, date
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+import csv
+import itertools
+import logging
+import os
+import pickle
+import tempfile
+
+
+DATE_FORMATS = ('%Y-%m-%d', '%Y/%m/%d')
+DATETIME_FORMATS = ('%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M', '%Y-%m-%dT%H:%M:%S', '%Y/%m/%d %H:%M:%S')
+
+# Only this many row errors are kept for the report; the rest are counted
+MAX_REPORTED_ERRORS = 1000
+
+
+class ImportCancelled(Exception):
+    """Raised when the caller cancels an import part way"""
+
+
+def read_rows(path, chunk_size=1000):
+    """Yield the rows of a CSV or XLSX file as lists of dicts keyed by header"""
+    suffix = Path(path).suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        yield from _read_xlsx(path, chunk_size)
+    elif suffix in ('.csv', '.txt'):
+        yield from _read_csv(path, chunk_size)
+    else:
+        raise ValueError(f"Unsupported file type: {suffix or path}")
+
+
+def _read_csv(path, chunk_size):
+    with open(path, newline='', encoding='utf-8-sig') as file:
+        reader = csv.DictReader(file)
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def _read_xlsx(path, chunk_size):
+    # openpyxl is only needed for Excel imports
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header:
+            return
+        header = [str(cell).strip() if cell is not None else '' for cell in header]
+        chunk = []
+        for values in rows:
+            if all(value is None for value in values):
+                continue
+            chunk.append(dict(zip(header, values)))
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    finally:
+        workbook.close()
+
+
+class TableImporter:
+    """Validate a CSV or XLSX file against the cached schema and load it into a table
+
+    Rows are read and validated a chunk at a time. Valid rows are written to
+    a temporary file and loaded with LOAD DATA LOCAL INFILE; if the server
+    refuses local infile, the file is read again and loaded with batched
+    inserts instead. Invalid rows are skipped and reported.
+
+    Batched inserts read from a spool of already validated rows, so the
+    foreign key lookups are done before insert_many checks out its
+    connection rather than needing a second one while it is held.
+    """
+
+    def __init__(self, db, table_name, chunk_size=1000, upsert=False):
+        self.db = db
+        self.table_name = table_name
+        self.chunk_size = chunk_size
+        self.upsert = upsert
+        self.fields = db.get_table_fields(table_name)
+        self.foreign_keys = db.get_foreign_keys(table_name)
+        if not self.fields:
+            raise ValueError(f"No fields found for table {table_name}")
+        self._known_keys = {}  # column -> referenced values already confirmed to exist
+        self._columns = None  # column order of the temporary LOAD DATA file
+
+    def run(self, path, progress=None, token=None):
+        """Import a file and return a report
+
+        progress(rows_read, rows_valid, phase) is called after every chunk;
+        token is any object with a cancelled attribute. The report has rows,
+        loaded, skipped (valid rows the server dropped as duplicate keys),
+        error_count, errors (row, column, message) and method.
+        """
+        report = {'rows': 0, 'valid': 0, 'loaded': 0, 'skipped': 0, 'error_count': 0, 'errors': [],
+                  'method': None}
+
+        if not self.upsert:
+            temp_path = self._write_valid_rows(path, report, progress, token)
+            try:
+                if report['valid']:
+                    report['loaded'] = self._load_data(temp_path)
+                    # LOCAL implies IGNORE, so rows with a duplicate key are dropped without an error
+                    report['skipped'] = max(report['valid'] - report['loaded'], 0)
+                report['method'] = 'load_data'
+                self.db.notify_write(self.table_name)
+                return report
+            except Error as e:
+                logging.warning(f"LOAD DATA LOCAL INFILE failed, using batched inserts: {e}")
+            finally:
+                os.remove(temp_path)
+
+            report.update(rows=0, valid=0, error_count=0, errors=[])
+
+        # REPLACE would delete and re-insert rows, cascading to their children, so upserts always use inserts
+        report['method'] = 'insert_many'
+        with self._spool_valid_rows(path, report, progress, token) as spool:
+            result = self.db.insert_many(
+                self.table_name,
+                self._spooled_rows(spool, token),
+                batch_size=self.chunk_size,
+                upsert=self.upsert
+            )
+        report['loaded'] = result['inserted']
+        for failure in result['failures']:
+            self._add_error(report, None, None,
+                            f"{failure['rows']} valid rows from number {failure['first_row'] + 1} "
+                            f"failed to insert: {failure['error']}")
+        return report
+
+    def _valid_rows(self, path, report, progress=None, token=None):
+        """Yield validated rows, recording the errors of the rest in report"""
+        columns = None
+        for chunk in read_rows(path, self.chunk_size):
+            if token is not None and token.cancelled:
+                raise ImportCancelled("Import cancelled")
+            if columns is None:
+                columns = self._map_columns(chunk[0].keys())
+
+            first_line = report['rows'] + 2  # line 1 is the header
+            report['rows'] += len(chunk)
+            rows = self._validate_chunk(chunk, columns, first_line, report)
+            report['valid'] += len(rows)
+            if progress:
+                progress(report['rows'], report['valid'], "Validating")
+            yield from rows
+
+    def _write_valid_rows(self, path, report, progress=None, token=None):
+        """Validate the file into a temporary file in LOAD DATA format"""
+        handle, temp_path = tempfile.mkstemp(suffix='.csv', prefix='import_')
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8', newline='') as file:
+                for row in self._valid_rows(path, report, progress, token):
+                    if self._columns is None:
+                        self._columns = list(row)
+                    file.write(','.join(_load_data_field(row[col]) for col in self._columns) + '\n')
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return temp_path
+
+    def _spool_valid_rows(self, path, report, progress=None, token=None):
+        """Validate the whole file into an anonymous temporary file, a pickled chunk at a time"""
+        spool = tempfile.TemporaryFile(prefix='import_')
+        try:
+            rows = self._valid_rows(path, report, progress, token)
+            while True:
+                chunk = list(itertools.islice(rows, self.chunk_size))
+                if not chunk:
+                    break
+                pickle.dump(chunk, spool, protocol=pickle.HIGHEST_PROTOCOL)
+            spool.seek(0)
+        except BaseException:
+            spool.close()
+            raise
+        return spool
+
+    @staticmethod
+    def _spooled_rows(spool, token=None):
+        """Yield the rows written by _spool_valid_rows"""
+        while True:
+            if token is not None and token.cancelled:
+                raise ImportCancelled("Import cancelled")
+            try:
+                chunk = pickle.load(spool)
+            except EOFError:
+                return
+            yield from chunk
+
+    def _load_data(self, temp_path):
+        """Load the validated temporary file with one LOAD DATA statement"""
+        column_list = ', '.join(self._columns)
+        # With no escape character, unquoted NULL is a null and "" inside quotes is a quote
+        query = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {self.table_name} "
+            "CHARACTER SET utf8mb4 "
+            "FIELDS TERMINATED BY ',' ENCLOSED BY '\"' ESCAPED BY '' "
+            "LINES TERMINATED BY '\\n' "
+            f"({column_list})"
+        )
+        with self.db.checkout() as connection:
+            cursor = connection.cursor()
+            try:
+                cursor.execute(query, (temp_path,))
+                connection.commit()
+                loaded = cursor.rowcount
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                cursor.close()
+        logging.info(f"Loaded {loaded} rows into {self.table_name} with LOAD DATA")
+        return loaded
+
+    def _map_columns(self, headers):
+        """Match file headers to table columns, accepting titles like 'Patient Name'"""
+        lookup = {col.upper(): col for col in self.fields}
+        columns = {}
+        unknown = []
+        for header in headers:
+            key = str(header or '').strip().upper().replace(' ', '_')
+            if not key:
+                continue
+            if key in lookup:
+                columns[header] = lookup[key]
+            else:
+                unknown.append(str(header))
+        if unknown:
+            raise ValueError(f"Unknown columns for table {self.table_name}: {', '.join(unknown)}")
+
+        missing = [
+            col for col, info in self.fields.items()
+            if info['required'] and info['default'] is None and not info['auto_increment']
+            and col not in columns.values()
+        ]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        return columns
+
+    def _validate_chunk(self, chunk, columns, first_line, report):
+        """Convert a chunk's values to column types and drop rows that fail a check"""
+        rows = []
+        for offset, raw in enumerate(chunk):
+            line = first_line + offset
+            row = {}
+            valid = True
+            for header, col in columns.items():
+                try:
+                    row[col] = _convert(raw.get(header), self.fields[col])
+                except ValueError as e:
+                    self._add_error(report, line, col, str(e))
+                    valid = False
+            if valid:
+                rows.append((line, row))
+
+        rows = self._check_foreign_keys(rows, report)
+        return [row for _, row in rows]
+
+    def _check_foreign_keys(self, rows, report):
+        """Drop rows whose foreign key values do not exist, one query per key per chunk"""
+        for col, ref in self.foreign_keys.items():
+            known = self._known_keys.setdefault(col, set())
+            wanted = {row[col] for _, row in rows
+                      if row.get(col) is not None and _key_form(row[col]) not in known}
+            if wanted:
+                placeholders = ', '.join(['%s'] * len(wanted))
+                found = self.db.execute_query(
+                    f"SELECT {ref['referenced_column']} AS VALUE FROM {ref['referenced_table']} "
+                    f"WHERE {ref['referenced_column']} IN ({placeholders})",
+                    tuple(wanted)
+                )
+                known.update(_key_form(r['VALUE']) for r in found)
+
+            kept = []
+            for line, row in rows:
+                if row.get(col) is not None and _key_form(row[col]) not in known:
+                    self._add_error(report, line, col,
+                                    f"{row[col]} not found in {ref['referenced_table']}")
+                else:
+                    kept.append((line, row))
+            rows = kept
+        return rows
+
+    def _add_error(self, report, line, column, message):
+        report['error_count'] += 1
+        if len(report['errors']) < MAX_REPORTED_ERRORS:
+            report['errors'].append((line, column, message))
+
+
+def _key_form(value):
+    """Compare text keys the way the schema's case-insensitive collation does"""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def _convert(value, info):
+    """Convert one file value to the column's type, raising ValueError when it does not fit"""
+    if isinstance(value, str):
+        value = value.strip()
+    if value is None or value == '':
+        if info['required'] and info['default'] is None and not info['auto_increment']:
+            raise ValueError("Value is required")
+        return None
+
+    data_type = info['type'].lower()
+    if data_type in ('tinyint', 'smallint', 'mediumint', 'int', 'bigint'):
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        try:
+            return int(str(value))
+        except ValueError:
+            raise ValueError(f"{value} is not a whole number")
+    if data_type in ('decimal', 'float', 'double'):
+        try:
+            return Decimal(str(value))
+        except InvalidOperation:
+            raise ValueError(f"{value} is not a number")
+    if data_type in ('datetime', 'timestamp'):
+        return _parse_datetime(value, DATETIME_FORMATS + DATE_FORMATS)
+    if data_type == 'date':
+        return _parse_datetime(value, DATE_FORMATS + DATETIME_FORMATS).date()
+
+    value = str(value)
+    if info['max_length'] and len(value) > info['max_length']:
+        raise ValueError(f"Longer than {info['max_length']} characters")
+    return value
+
+
+def _parse_datetime(value, formats):
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime(value.year, value.month, value.day)
+    for fmt in formats:
+        try:
+            return datetime.strptime(str(value), fmt)
+        except ValueError:
+            continue
+    raise ValueError(f"{value} is not a valid date")
+
+
+def _load_data_field(value):
+    """Format a value for the temporary LOAD DATA file"""
+    if value is None:
+        return 'NULL'
+    if isinstance(value, datetime):
+        value = value.strftime('%Y-%m-%d %H:%M:%S')
+    elif isinstance(value, date):
+        value = value.strftime('%Y-%m-%d')
+    return '"' + str(value).replace('"', '""') + '"'
+
+# References
+# 1. **MySQL LOAD DATA**
+#    - Used for: Bulk loading validated rows
+#    - Documentation: [LOAD DATA Statement](https://dev.mysql.com/doc/refman/8.0/en/load-data.html)
+# 2. **openpyxl**
+#    - Used for: Reading Excel workbooks in read-only mode
+#    - Documentation: [openpyxl Documentation](https://openpyxl.readthedocs.io/)
+# 3. **Python csv module**
+#    - Used for: Reading CSV files
+#    - Documentation: [csv Documentation](https://docs.python.org/3/library/csv.html)
@@ -0,0 +1,122 @@
+-- Table for DEPARTMENT (must come before DOCTOR and ROOM)
+CREATE TABLE IF NOT EXISTS DEPARTMENT (
+   DEPARTMENT_ID varchar(20) NOT NULL,                                                    
+   DEPARTMENT_NAME varchar(100) NOT NULL,                                           
+   HEAD_OF_DEPARTMENT varchar(20),
+   LOCATION varchar(50),
+   PRIMARY KEY (DEPARTMENT_ID)
+);
+
+-- Table for STAFF (it is needed before other tables)
+CREATE TABLE IF NOT EXISTS STAFF ( 
+   STAFF_ID varchar(20) NOT NULL, 
+   STAFF_NAME varchar(100) NOT NULL, 
+   ROLE varchar(20) NOT NULL,                                                
+   SHIFT varchar(20) NOT NULL,                                               
+   CONTACT_INFO varchar(255),
+   DEPARTMENT_ID VARCHAR(20), -- Foreign key to DEPARTMENT table
+   PRIMARY KEY (STAFF_ID), 
+   FOREIGN KEY (DEPARTMENT_ID) REFERENCES DEPARTMENT (DEPARTMENT_ID)
+          ON DELETE SET NULL
+          ON UPDATE CASCADE
+);
+
+-- Table for DOCTOR (must come after DEPARTMENT and STAFF)
+CREATE TABLE IF NOT EXISTS DOCTOR ( 
+   DOCTOR_ID varchar(20) NOT NULL, 
+   DOCTOR_NAME varchar(100) NOT NULL, 
+   SPECIALIZATION varchar(100) NOT NULL, 
+   CONTACT_INFO varchar(255),                                       
+   DEPARTMENT_ID VARCHAR(20),                              
+   STAFF_ID VARCHAR(20),  -- Foreign key to STAFF table
+   SUPER_ID VARCHAR(20),  -- Self-referencing for supervisor
+   PRIMARY KEY (DOCTOR_ID), 
+   FULLTEXT KEY ft_doctor_search (DOCTOR_NAME, SPECIALIZATION, CONTACT_INFO) WITH PARSER ngram, -- Partial name lookup
+   FOREIGN KEY (DEPARTMENT_ID) REFERENCES DEPARTMENT(DEPARTMENT_ID)
+          ON DELETE SET NULL
+          ON UPDATE CASCADE,
+   FOREIGN KEY (SUPER_ID) REFERENCES DOCTOR(DOCTOR_ID)
+          ON DELETE SET NULL
+          ON UPDATE CASCADE,
+   FOREIGN KEY (STAFF_ID) REFERENCES STAFF(STAFF_ID)
+          ON DELETE SET NULL
+          ON UPDATE CASCADE
+);
+
+-- Table for ROOM (needs DEPARTMENT table already created for foreign key reference)
+CREATE TABLE IF NOT EXISTS ROOM (
+    ROOM_ID VARCHAR(20) NOT NULL, 
+    ROOM_TYPE VARCHAR(20) NOT NULL,                                 
+    CAPACITY INT NOT NULL, 
+    OCCUPIED INT NOT NULL DEFAULT 0,                                  
+    DEPARTMENT_ID VARCHAR(20), -- Foreign key to DEPARTMENT table
+    PRIMARY KEY (ROOM_ID),
+    FOREIGN KEY (DEPARTMENT_ID) REFERENCES DEPARTMENT(DEPARTMENT_ID) 
+          ON DELETE CASCADE
+          ON UPDATE CASCADE
+);
+
+-- Table for PATIENT (must come before APPOINTMENT as APPOINTMENT references it)
+CREATE TABLE IF NOT EXISTS PATIENT (
+    PATIENT_ID VARCHAR(20) NOT NULL, 
+    PATIENT_NAME VARCHAR(100) NOT NULL, 
+    AGE INT NOT NULL, 
+    ADDRESS VARCHAR(255) NOT NULL, 
+    PHONE VARCHAR(15) NOT NULL,                                       
+    ROOM_ID VARCHAR(20),  -- Foreign key to ROOM table
+    GENDER VARCHAR(10) NOT NULL, 
+    DATE datetime,
+    DOCTOR_ID VARCHAR(20),  -- Foreign key to DOCTOR table
+    PRIMARY KEY (PATIENT_ID),
+    FULLTEXT KEY ft_patient_search (PATIENT_NAME, ADDRESS, PHONE) WITH PARSER ngram, -- Partial name/phone lookup
+    FOREIGN KEY (DOCTOR_ID) REFERENCES DOCTOR(DOCTOR_ID)
+            ON DELETE CASCADE
+            ON UPDATE CASCADE,
+    FOREIGN KEY (ROOM_ID) REFERENCES ROOM(ROOM_ID)
+            ON DELETE CASCADE
+            ON UPDATE CASCADE
+);
+
+-- Table for APPOINTMENT (now that PATIENT exists, we can reference it)
+CREATE TABLE IF NOT EXISTS APPOINTMENT ( 
+   APPOINTMENT_ID varchar(20) NOT NULL, 
+   PATIENT_ID varchar(20) NOT NULL, 
+   DOCTOR_ID varchar(20) NOT NULL, 
+   APPOINTMENT_DATE datetime NOT NULL, 
+   STATUS varchar(20) NOT NULL DEFAULT 'Scheduled',      
+   NOTES text,                                                                   
+   PRIMARY KEY (APPOINTMENT_ID), 
+   FOREIGN KEY (PATIENT_ID) REFERENCES PATIENT(PATIENT_ID) 
+   ON DELETE CASCADE 
+   ON UPDATE CASCADE, 
+   FOREIGN KEY (DOCTOR_ID) REFERENCES DOCTOR(DOCTOR_ID) 
+   ON DELETE CASCADE 
+   ON UPDATE CASCADE 
+);
+
+-- Table for BILLING (references PATIENT table)
+CREATE TABLE IF NOT EXISTS BILLING (
+    BILL_ID VARCHAR(20) NOT NULL, 
+    PATIENT_ID VARCHAR(20) NOT NULL, 
+    AMOUNT DECIMAL(10, 3) NOT NULL, 
+    PAYMENT_STATUS VARCHAR(20) NOT NULL DEFAULT 'Unpaid',  
+    BILL_DATE DATETIME NOT NULL,
+    PRIMARY KEY (BILL_ID), 
+    FOREIGN KEY (PATIENT_ID) REFERENCES PATIENT(PATIENT_ID) 
+        ON DELETE CASCADE 
+        ON UPDATE CASCADE
+);
+
+-- Table for DEPENDENTS (references PATIENT table)
+CREATE TABLE IF NOT EXISTS DEPENDENTS (
+   DEPENDENT_ID varchar(20) NOT NULL,
+   PATIENT_ID varchar(20) NOT NULL,
+   NAME varchar(100) NOT NULL,
+   RELATIONSHIP varchar(50) NOT NULL,
+   CONTACT_INFO varchar(255),
+   PRIMARY KEY (DEPENDENT_ID),
+   FULLTEXT KEY ft_dependents_search (NAME, CONTACT_INFO) WITH PARSER ngram, -- Partial name lookup
+   FOREIGN KEY (PATIENT_ID) REFERENCES PATIENT(PATIENT_ID)
+      ON DELETE CASCADE
+      ON UPDATE CASCADE
+);
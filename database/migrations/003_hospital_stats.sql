@@ -0,0 +1,14 @@
+-- Summary tables read by the dashboard; their triggers are created by database/hospital_stats.py
+CREATE TABLE IF NOT EXISTS HOSPITAL_STATS (
+    STAT_NAME VARCHAR(40) NOT NULL,
+    STAT_VALUE DECIMAL(15, 3) NOT NULL DEFAULT 0,
+    UPDATED_AT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    PRIMARY KEY (STAT_NAME)
+);
+
+-- One row per day with appointments
+CREATE TABLE IF NOT EXISTS APPOINTMENT_DAILY_COUNT (
+    APPOINTMENT_DAY DATE NOT NULL,
+    APPOINTMENT_COUNT INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (APPOINTMENT_DAY)
+);
@@ -0,0 +1,278 @@
+from mysql.connector import Error, errorcode
+from pathlib import Path
+import hashlib
+import logging
+import re
+import time
+
+
+MIGRATIONS_DIR = Path(__file__).parent / 'migrations'
+
+# Migration files are applied in version order: 001_schema.sql, 002_seed_data.sql, ...
+MIGRATION_FILE = re.compile(r'^(\d+)_(\w+)\.sql$')
+
+CREATE_VERSION_TABLE = """
+    CREATE TABLE IF NOT EXISTS SCHEMA_VERSION (
+        VERSION INT NOT NULL,
+        NAME VARCHAR(100) NOT NULL,
+        CHECKSUM CHAR(64) NOT NULL,
+        APPLIED_AT DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        EXECUTION_MS INT NOT NULL DEFAULT 0,
+        PRIMARY KEY (VERSION)
+    )
+"""
+
+# Tables the old init_database.sql created; finding them without SCHEMA_VERSION means a
+# database set up before migrations, whose schema (001) and sample data (002) are in place
+LEGACY_TABLES = ('DEPARTMENT', 'STAFF', 'DOCTOR', 'ROOM', 'PATIENT', 'APPOINTMENT', 'BILLING', 'DEPENDENTS')
+SCHEMA_MIGRATION = 1
+SEED_MIGRATION = 2
+
+# Server-wide named lock held while migrating, and how many seconds to wait for it
+MIGRATION_LOCK = 'schema_migrations'
+MIGRATION_LOCK_TIMEOUT = 60
+
+
+class MigrationError(Exception):
+    """Raised when applied migrations no longer match the files on disk"""
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """Return the migration files in a directory as dicts, lowest version first"""
+    migrations = []
+    for path in Path(directory).iterdir():
+        match = MIGRATION_FILE.match(path.name)
+        if not match:
+            continue
+        migrations.append({
+            'version': int(match.group(1)),
+            'name': match.group(2),
+            'path': path,
+            # Line endings depend on the checkout, so they don't count towards the checksum
+            'checksum': hashlib.sha256(path.read_bytes().replace(b'\r\n', b'\n')).hexdigest()
+        })
+    migrations.sort(key=lambda migration: migration['version'])
+
+    versions = [migration['version'] for migration in migrations]
+    if len(versions) != len(set(versions)):
+        raise MigrationError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+def split_statements(script):
+    """Split a SQL script into statements, dropping comments
+
+    Understands quoted strings and the mysql client's DELIMITER command,
+    so routine and trigger bodies containing ';' stay in one statement.
+    """
+    statements = []
+    delimiter = ';'
+    current = []
+    i = 0
+    length = len(script)
+    at_line_start = True
+
+    while i < length:
+        if at_line_start:
+            line_end = script.find('\n', i)
+            line_end = length if line_end == -1 else line_end
+            line = script[i:line_end].strip()
+            if not ''.join(current).strip() and line.upper().startswith('DELIMITER '):
+                delimiter = line.split(None, 1)[1]
+                i = line_end + 1
+                continue
+        at_line_start = False
+
+        char = script[i]
+        if char in ('"', "'", '`'):
+            end = i + 1
+            while end < length and script[end] != char:
+                end += 2 if script[end] == '\\' and char != '`' else 1
+            current.append(script[i:end + 1])
+            i = end + 1
+        elif script.startswith('--', i) or char == '#':
+            line_end = script.find('\n', i)
+            i = length if line_end == -1 else line_end
+        elif script.startswith('/*', i):
+            comment_end = script.find('*/', i + 2)
+            i = length if comment_end == -1 else comment_end + 2
+        elif script.startswith(delimiter, i):
+            statements.append(''.join(current).strip())
+            current = []
+            i += len(delimiter)
+        else:
+            current.append(char)
+            at_line_start = char == '\n'
+            i += 1
+
+    statements.append(''.join(current).strip())
+    return [statement for statement in statements if statement]
+
+
+class Migrator:
+    """Bring the database schema up to date from numbered migration files
+
+    SCHEMA_VERSION records each applied file with its sha256 checksum. When
+    the schema is current, startup costs one query against that table
+    besides taking the lock; only pending files are read and executed.
+    Processes starting together take turns through a named lock, so each
+    migration runs once.
+    """
+
+    def __init__(self, db, directory=MIGRATIONS_DIR, lock_timeout=MIGRATION_LOCK_TIMEOUT):
+        self.db = db
+        self.directory = Path(directory)
+        self.lock_timeout = lock_timeout
+
+    def applied_versions(self, connection=None):
+        """Return {version: checksum} of applied migrations, or None before the first run"""
+        try:
+            if connection is None:
+                rows = self.db.execute_query("SELECT VERSION, CHECKSUM FROM SCHEMA_VERSION")
+            else:
+                rows = self._query(connection, "SELECT VERSION, CHECKSUM FROM SCHEMA_VERSION")
+        except Error as e:
+            if e.errno == errorcode.ER_NO_SUCH_TABLE:
+                return None
+            raise
+        return {row['VERSION']: row['CHECKSUM'] for row in rows}
+
+    def migrate(self):
+        """Apply pending migrations in order and return the versions applied
+
+        Runs on one connection holding the migration lock. GET_LOCK belongs
+        to the session, so the lock is freed even if this process dies.
+        """
+        migrations = load_migrations(self.directory)
+        with self.db.checkout() as connection:
+            rows = self._query(connection, "SELECT GET_LOCK(%s, %s) AS ACQUIRED",
+                               (MIGRATION_LOCK, self.lock_timeout))
+            if not rows or rows[0]['ACQUIRED'] != 1:
+                raise MigrationError(
+                    f"Timed out after {self.lock_timeout} s waiting for another process to migrate the database"
+                )
+            try:
+                # Read only now: whoever held the lock may have applied migrations meanwhile
+                return self._migrate(connection, migrations)
+            finally:
+                try:
+                    self._query(connection, "SELECT RELEASE_LOCK(%s)", (MIGRATION_LOCK,))
+                except Error as e:
+                    logging.debug(f"Could not release the migration lock: {e}")
+
+    def _migrate(self, connection, migrations):
+        """Baseline, verify and apply migrations while the lock is held"""
+        applied = self.applied_versions(connection)
+        if applied is None:
+            self._query(connection, CREATE_VERSION_TABLE)
+            applied = self._baseline(connection, migrations)
+
+        for migration in migrations:
+            checksum = applied.get(migration['version'])
+            if checksum is not None and checksum != migration['checksum']:
+                raise MigrationError(
+                    f"Migration {migration['path'].name} was changed after it was applied; "
+                    "add a new migration instead"
+                )
+
+        pending = [migration for migration in migrations if migration['version'] not in applied]
+        for migration in pending:
+            self._apply(connection, migration)
+        if pending:
+            # The migrations may have changed table definitions
+            self.db.schema.invalidate()
+        else:
+            logging.info(f"Database schema is current at version {max(applied, default=0)}")
+        return [migration['version'] for migration in pending]
+
+    @staticmethod
+    def _query(connection, query, params=None):
+        """Run one statement on connection and return its rows, or the affected row count"""
+        cursor = connection.cursor(dictionary=True, buffered=True)
+        try:
+            cursor.execute(query, params or ())
+            return cursor.fetchall() if cursor.with_rows else cursor.rowcount
+        finally:
+            cursor.close()
+
+    def _baseline(self, connection, migrations):
+        """Record what a database created by the old init script already has, without running it
+
+        Replaying 002_seed_data would bring back sample rows the user has
+        deleted. When only some legacy tables exist, 001_schema still runs
+        to create the rest; it only uses CREATE TABLE IF NOT EXISTS.
+        """
+        placeholders = ', '.join(['%s'] * len(LEGACY_TABLES))
+        rows = self._query(
+            connection,
+            "SELECT TABLE_NAME FROM INFORMATION_SCHEMA.TABLES "
+            f"WHERE TABLE_SCHEMA = DATABASE() AND UPPER(TABLE_NAME) IN ({placeholders})",
+            LEGACY_TABLES
+        )
+        existing = {row['TABLE_NAME'].upper() for row in rows}
+        if not existing:
+            return {}
+
+        baseline = {SEED_MIGRATION}
+        if existing == set(LEGACY_TABLES):
+            baseline.add(SCHEMA_MIGRATION)
+        applied = {}
+        for migration in migrations:
+            if migration['version'] not in baseline:
+                continue
+            logging.info(f"Recording migration {migration['path'].name} as applied to the existing database")
+            self._query(
+                connection,
+                "INSERT INTO SCHEMA_VERSION (VERSION, NAME, CHECKSUM) VALUES (%s, %s, %s)",
+                (migration['version'], migration['name'], migration['checksum'])
+            )
+            applied[migration['version']] = migration['checksum']
+        return applied
+
+    def _apply(self, connection, migration):
+        """Run one migration file and record it in SCHEMA_VERSION
+
+        MySQL commits DDL implicitly, so a failed migration is not rolled
+        back; it is left unrecorded and retried on the next start. Keep
+        migrations idempotent (IF NOT EXISTS, INSERT IGNORE).
+        """
+        started = time.perf_counter()
+        statements = split_statements(migration['path'].read_text(encoding='utf-8'))
+        logging.info(f"Applying migration {migration['path'].name} ({len(statements)} statements)")
+
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SET FOREIGN_KEY_CHECKS=0")
+            connection.start_transaction()
+            for statement in statements:
+                cursor.execute(statement)
+                if cursor.with_rows:
+                    cursor.fetchall()
+            elapsed = int((time.perf_counter() - started) * 1000)
+            cursor.execute(
+                "INSERT INTO SCHEMA_VERSION (VERSION, NAME, CHECKSUM, EXECUTION_MS) VALUES (%s, %s, %s, %s)",
+                (migration['version'], migration['name'], migration['checksum'], elapsed)
+            )
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            try:
+                cursor.execute("SET FOREIGN_KEY_CHECKS=1")
+            except Error as e:
+                logging.debug(f"Could not restore foreign key checks: {e}")
+            cursor.close()
+
+        logging.info(f"Applied migration {migration['path'].name} in {elapsed} ms")
+
+# References
+# 1. **MySQL Connector/Python**
+#    - Used for: Running migration statements and reading error codes
+#    - Documentation: [Connector/Python Error Codes](https://dev.mysql.com/doc/connector-python/en/connector-python-api-errorcode.html)
+# 2. **MySQL Locking Functions**
+#    - Used for: GET_LOCK so concurrent startups migrate one at a time
+#    - Documentation: [Locking Functions](https://dev.mysql.com/doc/refman/8.0/en/locking-functions.html)
+# 3. **hashlib**
+#    - Used for: Checksums of applied migration files
+#    - Documentation: [hashlib Documentation](https://docs.python.org/3/library/hashlib.html)
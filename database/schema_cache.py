@@ -0,0 +1,144 @@
+import logging
+import threading
+
+
+class SchemaCatalog:
+    """In-memory cache of column, key and foreign-key metadata for the schema"""
+
+    # One round trip loads every table; KEY_COLUMN_USAGE adds a row per key a column takes part in.
+    # COLUMN_KEY is also set for FULLTEXT keys and only marks a composite index's first column,
+    # so whether a column can drive an ORDER BY comes from STATISTICS instead
+    BULK_QUERY = """
+        SELECT
+            c.TABLE_NAME,
+            c.COLUMN_NAME,
+            c.DATA_TYPE,
+            c.COLUMN_TYPE,
+            c.IS_NULLABLE,
+            c.COLUMN_DEFAULT,
+            c.CHARACTER_MAXIMUM_LENGTH,
+            c.COLUMN_KEY,
+            c.EXTRA,
+            EXISTS (
+                SELECT 1 FROM INFORMATION_SCHEMA.STATISTICS s
+                WHERE s.TABLE_SCHEMA = c.TABLE_SCHEMA
+                    AND s.TABLE_NAME = c.TABLE_NAME
+                    AND s.COLUMN_NAME = c.COLUMN_NAME
+                    AND s.INDEX_TYPE = 'BTREE'
+                    AND s.SEQ_IN_INDEX = 1
+            ) AS LEADS_BTREE,
+            k.CONSTRAINT_NAME,
+            k.REFERENCED_TABLE_NAME,
+            k.REFERENCED_COLUMN_NAME
+        FROM INFORMATION_SCHEMA.COLUMNS c
+        LEFT JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE k
+            ON k.TABLE_SCHEMA = c.TABLE_SCHEMA
+            AND k.TABLE_NAME = c.TABLE_NAME
+            AND k.COLUMN_NAME = c.COLUMN_NAME
+        WHERE c.TABLE_SCHEMA = DATABASE()
+        ORDER BY c.TABLE_NAME, c.ORDINAL_POSITION, k.ORDINAL_POSITION
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._tables = {}
+        self._names = {}  # upper-cased name -> actual table name
+        self._loaded = False
+        self._lock = threading.RLock()
+        self.generation = 0  # bumped on every load and invalidation so derived caches can tell they are stale
+
+    def load(self):
+        """Load metadata for every table in the schema in one query"""
+        rows = self.db.execute_query(self.BULK_QUERY)
+
+        tables = {}
+        for row in rows:
+            table = tables.setdefault(row['TABLE_NAME'], {
+                'fields': {},
+                'column_types': {},
+                'primary_key': None,
+                'foreign_keys': {}
+            })
+            column = row['COLUMN_NAME']
+            if column not in table['fields']:
+                table['fields'][column] = {
+                    'type': row['DATA_TYPE'],
+                    'required': row['IS_NULLABLE'] == 'NO',
+                    'nullable': row['IS_NULLABLE'] == 'YES',
+                    'default': row['COLUMN_DEFAULT'],
+                    'max_length': row['CHARACTER_MAXIMUM_LENGTH'],
+                    'key': row['COLUMN_KEY'],
+                    'indexed': bool(row['LEADS_BTREE']),  # leads a BTREE index, so ORDER BY can use it
+                    'auto_increment': row['EXTRA'] == 'auto_increment'
+                }
+                table['column_types'][column] = row['COLUMN_TYPE']
+
+            if row['CONSTRAINT_NAME'] == 'PRIMARY' and table['primary_key'] is None:
+                table['primary_key'] = column
+            if row['REFERENCED_TABLE_NAME']:
+                table['foreign_keys'][column] = {
+                    'referenced_table': row['REFERENCED_TABLE_NAME'],
+                    'referenced_column': row['REFERENCED_COLUMN_NAME']
+                }
+
+        with self._lock:
+            self._tables = tables
+            self._names = {name.upper(): name for name in tables}
+            self._loaded = True
+            self.generation += 1
+        logging.info(f"Schema catalog loaded metadata for {len(tables)} tables")
+
+    def invalidate(self):
+        """Drop cached metadata so the next lookup reloads it"""
+        with self._lock:
+            self._loaded = False
+            self.generation += 1
+        logging.info("Schema catalog invalidated")
+
+    def refresh(self):
+        """Reload metadata immediately"""
+        self.invalidate()
+        self.load()
+
+    def _get_table(self, table_name):
+        """Return cached metadata for a table, reloading once on a miss"""
+        with self._lock:
+            if not self._loaded:
+                self.load()
+            name = self._names.get(str(table_name).upper())
+            if name is None:
+                # The table may have been created since the last load
+                self.load()
+                name = self._names.get(str(table_name).upper())
+            return self._tables.get(name) if name else None
+
+    def has_table(self, table_name):
+        return self._get_table(table_name) is not None
+
+    def get_fields(self, table_name):
+        table = self._get_table(table_name)
+        return {col: dict(info) for col, info in table['fields'].items()} if table else {}
+
+    def get_columns(self, table_name):
+        table = self._get_table(table_name)
+        return list(table['fields']) if table else []
+
+    def get_column_types(self, table_name):
+        table = self._get_table(table_name)
+        return dict(table['column_types']) if table else {}
+
+    def get_primary_key(self, table_name):
+        table = self._get_table(table_name)
+        return table['primary_key'] if table else None
+
+    def get_foreign_keys(self, table_name):
+        table = self._get_table(table_name)
+        return {col: dict(info) for col, info in table['foreign_keys'].items()} if table else {}
+
+# References
+# 1. **MySQL INFORMATION_SCHEMA**
+#    - Used for: Reading column and key metadata
+#    - Documentation: [INFORMATION_SCHEMA Tables](https://dev.mysql.com/doc/refman/8.0/en/information-schema.html)
+# 2. **Python threading module**
+#    - Used for: Guarding the catalog across worker threads
+#    - Documentation: [Python threading Documentation](https://docs.python.org/3/library/threading.html)
@@ -0,0 +1,386 @@
+from mysql.connector import Error
+from collections import defaultdict
+import logging
+import threading
+
+
+# Columns covered by each FULLTEXT index; the ngram parser lets partial names and phone numbers match
+SEARCH_INDEXES = {
+    'PATIENT': ('ft_patient_search', ('PATIENT_NAME', 'ADDRESS', 'PHONE')),
+    'DEPENDENTS': ('ft_dependents_search', ('NAME', 'CONTACT_INFO')),
+    'DOCTOR': ('ft_doctor_search', ('DOCTOR_NAME', 'SPECIALIZATION', 'CONTACT_INFO')),
+}
+
+# What a people search returns for each table: label, id, name and contact columns
+SEARCH_TARGETS = {
+    'PATIENT': ('Patient', 'PATIENT_ID', 'PATIENT_NAME', 'PHONE'),
+    'DEPENDENTS': ('Dependent', 'DEPENDENT_ID', 'NAME', 'CONTACT_INFO'),
+    'DOCTOR': ('Doctor', 'DOCTOR_ID', 'DOCTOR_NAME', 'CONTACT_INFO'),
+}
+
+# Searched tables that ON DELETE CASCADE can empty when a parent row is deleted
+CASCADED_SEARCH_TABLES = ('PATIENT', 'DEPENDENTS')
+
+# Matches ngram_token_size; shorter terms produce no tokens and use a prefix match instead
+NGRAM_TOKEN_SIZE = 2
+
+
+def escape_like(value):
+    """Escape LIKE wildcards so a search term only matches literally"""
+    return value.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def _phrase(term):
+    """Quote a term as a boolean-mode phrase so its ngrams must appear in order"""
+    cleaned = ''.join(ch for ch in term if ch not in '"')
+    return f'"{cleaned}"'
+
+
+class TrigramIndex:
+    """In-process trigram index used when the server has no FULLTEXT support"""
+
+    def __init__(self):
+        self._postings = defaultdict(set)  # trigram -> document numbers
+        self._documents = {}  # document number -> (text, payload)
+        self._numbers = {}  # key -> document number
+        self._next_number = 0
+
+    @staticmethod
+    def _trigrams(text):
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    def add(self, key, text, payload):
+        """Index text under key, replacing any document already stored for it"""
+        self.remove(key)
+        number = self._next_number
+        self._next_number += 1
+        text = text.lower()
+        self._documents[number] = (text, payload)
+        self._numbers[key] = number
+        for gram in self._trigrams(text):
+            self._postings[gram].add(number)
+
+    def remove(self, key):
+        """Drop the document stored under key; return whether there was one"""
+        number = self._numbers.pop(key, None)
+        if number is None:
+            return False
+        text, _ = self._documents.pop(number)
+        for gram in self._trigrams(text):
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(number)
+                if not posting:
+                    del self._postings[gram]
+        return True
+
+    def keys(self):
+        return list(self._numbers)
+
+    def __len__(self):
+        return len(self._documents)
+
+    def search(self, term, limit=20):
+        """Return (score, payload) pairs for documents containing term"""
+        term = term.lower()
+        if len(term) < 3:
+            # Too short for a trigram; check every document
+            candidates = list(self._documents)
+        else:
+            postings = sorted((self._postings.get(gram, set()) for gram in self._trigrams(term)), key=len)
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    return []
+
+        matches = []
+        for number in candidates:
+            text, payload = self._documents[number]
+            position = text.find(term)
+            if position == -1:
+                continue
+            # Prefer matches at the start of the text, then at the start of a word
+            if position == 0:
+                score = 3.0
+            elif text[position - 1] == ' ':
+                score = 2.0
+            else:
+                score = 1.0
+            matches.append((score, payload))
+
+        matches.sort(key=lambda match: -match[0])
+        return matches[:limit]
+
+
+class PeopleSearch:
+    """Ranked lookup of patients, dependents and doctors by partial name or contact"""
+
+    def __init__(self, db):
+        self.db = db
+        self.fulltext_available = None  # unknown until ensure_indexes() runs
+        self._trigram = None
+        self._pending = {}  # table -> ids written since the index caught up, None for the whole table
+        self._unverified = set()  # tables where cascading deletes may have removed indexed rows
+        self._lock = threading.Lock()
+
+    def ensure_indexes(self):
+        """Create any missing FULLTEXT indexes on tables that predate them"""
+        try:
+            rows = self.db.execute_query("""
+                SELECT DISTINCT TABLE_NAME, INDEX_NAME
+                FROM INFORMATION_SCHEMA.STATISTICS
+                WHERE TABLE_SCHEMA = DATABASE() AND INDEX_TYPE = 'FULLTEXT'
+            """)
+            existing = {(row['TABLE_NAME'].upper(), row['INDEX_NAME']) for row in rows}
+
+            for table, (index_name, columns) in SEARCH_INDEXES.items():
+                if (table, index_name) in existing:
+                    continue
+                logging.info(f"Creating search index {index_name} on {table}")
+                self.db.execute_query(
+                    f"ALTER TABLE {table} ADD FULLTEXT INDEX {index_name} "
+                    f"({', '.join(columns)}) WITH PARSER ngram"
+                )
+            self.fulltext_available = True
+
+        except Error as e:
+            logging.warning(f"FULLTEXT search unavailable, using trigram index: {e}")
+            self.fulltext_available = False
+
+    def mark_stale(self, table_name=None, key=None, cascades=False):
+        """Note a write so the trigram index catches up before its next search
+
+        key is the primary key of the one row written; without it the whole
+        table is reloaded. cascades marks a delete whose foreign keys may
+        have removed searched rows too. Without a table the index is rebuilt.
+        """
+        with self._lock:
+            if table_name is None:
+                self._trigram = None
+                return
+            table = str(table_name).upper()
+            if table in SEARCH_TARGETS:
+                ids = self._pending.get(table, set())
+                if ids is None or key is None:
+                    self._pending[table] = None
+                else:
+                    ids.add(str(key))
+                    self._pending[table] = ids
+            if cascades:
+                self._unverified.update(CASCADED_SEARCH_TABLES)
+
+    def search(self, term, limit=20):
+        """Return up to limit people matching term, best matches first
+
+        Each result is a dict with type, table, id, name, contact and score.
+        """
+        term = str(term or '').strip()
+        if not term:
+            return []
+
+        if self.fulltext_available is None:
+            self.ensure_indexes()
+
+        if self.fulltext_available:
+            try:
+                if len(term) < NGRAM_TOKEN_SIZE:
+                    return self._search_prefix(term, limit)
+                return self._search_fulltext(term, limit)
+            except Error as e:
+                logging.warning(f"FULLTEXT search failed, using trigram index: {e}")
+                self.fulltext_available = False
+
+        return self._search_trigram(term, limit)
+
+    def filter_clause(self, table_name, term, alias, parent=None):
+        """Build a WHERE fragment matching term against a table's search columns
+
+        parent is an optional (table, foreign key column) pair; rows whose
+        parent row matches are included too. Each condition is its own
+        SELECT in a UNION, because MySQL cannot use a FULLTEXT index for a
+        MATCH that is OR-ed with another condition.
+        """
+        table = str(table_name).upper()
+        id_col = SEARCH_TARGETS[table][1]
+        selects, params = self._matching_ids(table, term, with_id=True)
+        if parent:
+            parent_table, foreign_key = parent
+            parent_selects, parent_params = self._matching_ids(str(parent_table).upper(), term)
+            selects.append(f"SELECT {id_col} AS ID FROM {table} WHERE {foreign_key} IN "
+                           f"(SELECT ID FROM ({' UNION '.join(parent_selects)}) AS parent_matches)")
+            params.extend(parent_params)
+        return (f"{alias}.{id_col} IN (SELECT ID FROM ({' UNION '.join(selects)}) AS matches)",
+                params)
+
+    def _matching_ids(self, table, term, with_id=False):
+        """Return SELECTs of the ids of rows matching term, each able to use its own index"""
+        _, columns = SEARCH_INDEXES[table]
+        id_col = SEARCH_TARGETS[table][1]
+        if self.fulltext_available and len(term) >= NGRAM_TOKEN_SIZE:
+            selects = [f"SELECT {id_col} AS ID FROM {table} "
+                       f"WHERE MATCH({', '.join(columns)}) AGAINST (%s IN BOOLEAN MODE)"]
+            params = [_phrase(term)]
+            if with_id:
+                selects.append(f"SELECT {id_col} AS ID FROM {table} WHERE {id_col} = %s")
+                params.append(term)
+            return selects, params
+
+        prefix = escape_like(term) + '%'
+        searched = ((id_col,) if with_id else ()) + columns
+        conditions = [f"{col} LIKE %s" for col in searched]
+        return [f"SELECT {id_col} AS ID FROM {table} WHERE {' OR '.join(conditions)}"], [prefix] * len(conditions)
+
+    def _search_fulltext(self, term, limit):
+        """Rank matches from every table with MATCH ... AGAINST in one round trip
+
+        An id match and a MATCH are separate SELECTs so each uses its index.
+        """
+        phrase = _phrase(term)
+        prefix = escape_like(term) + '%'
+        selects = []
+        params = []
+        for table, (index_name, columns) in SEARCH_INDEXES.items():
+            label, id_col, name_col, contact_col = SEARCH_TARGETS[table]
+            match = f"MATCH({', '.join(columns)}) AGAINST (%s IN BOOLEAN MODE)"
+            fields = (f"'{table}' AS SOURCE, {id_col} AS ID, {name_col} AS NAME, "
+                      f"{contact_col} AS CONTACT, {match} + ({name_col} LIKE %s) * 10 AS SCORE")
+            selects.append(f"""
+                (SELECT {fields}
+                 FROM {table}
+                 WHERE {id_col} = %s)
+                UNION
+                (SELECT {fields}
+                 FROM {table}
+                 WHERE {match}
+                 ORDER BY SCORE DESC
+                 LIMIT %s)
+            """)
+            params.extend([phrase, prefix, term, phrase, prefix, phrase, limit])
+
+        # UNION rather than UNION ALL drops a row found by both its id and a MATCH
+        query = " UNION ".join(selects) + " ORDER BY SCORE DESC LIMIT %s"
+        params.append(limit)
+        return [self._result(row) for row in self.db.execute_query(query, tuple(params))]
+
+    def _search_prefix(self, term, limit):
+        """Match very short terms against the start of names and ids"""
+        prefix = escape_like(term) + '%'
+        selects = []
+        params = []
+        for table, (label, id_col, name_col, contact_col) in SEARCH_TARGETS.items():
+            selects.append(f"""
+                (SELECT '{table}' AS SOURCE, {id_col} AS ID, {name_col} AS NAME,
+                        {contact_col} AS CONTACT, 1 AS SCORE
+                 FROM {table}
+                 WHERE {name_col} LIKE %s OR {id_col} LIKE %s
+                 LIMIT %s)
+            """)
+            params.extend([prefix, prefix, limit])
+
+        query = " UNION ALL ".join(selects) + " ORDER BY NAME LIMIT %s"
+        params.append(limit)
+        return [self._result(row) for row in self.db.execute_query(query, tuple(params))]
+
+    def _search_trigram(self, term, limit):
+        """Search the in-process index after applying the writes made since the last search
+
+        The first search builds the index; later ones reload only the rows
+        written since, so call it from a worker thread like other queries.
+        """
+        with self._lock:
+            if self._trigram is None:
+                self._build_trigram_index()
+            else:
+                self._apply_pending()
+            matches = self._trigram.search(term, limit)
+            while self._drop_deleted(matches):
+                matches = self._trigram.search(term, limit)
+        return [dict(payload, score=score) for score, payload in matches]
+
+    def _build_trigram_index(self):
+        """Stream the searched columns of every table into a fresh trigram index"""
+        self._trigram = TrigramIndex()
+        self._pending = {}
+        self._unverified = set()
+        for table in SEARCH_TARGETS:
+            self._load_rows(table)
+        logging.info(f"Trigram search index built with {len(self._trigram)} entries")
+
+    def _apply_pending(self):
+        """Reload the rows, or whole tables, written since the index last caught up"""
+        pending, self._pending = self._pending, {}
+        for table, ids in pending.items():
+            if ids is None:
+                for key in self._trigram.keys():
+                    if key[0] == table:
+                        self._trigram.remove(key)
+                self._load_rows(table)
+                continue
+            ids = list(ids)
+            for start in range(0, len(ids), 500):
+                batch = ids[start:start + 500]
+                # Deleted rows are simply not loaded back
+                for record_id in batch:
+                    self._trigram.remove((table, record_id))
+                self._load_rows(table, batch)
+
+    def _load_rows(self, table, ids=None):
+        """Add a table's rows, or only those with the given ids, to the index"""
+        label, id_col, name_col, contact_col = SEARCH_TARGETS[table]
+        _, columns = SEARCH_INDEXES[table]
+        selected = list(dict.fromkeys((id_col, name_col, contact_col) + columns))
+        query = f"SELECT {', '.join(selected)} FROM {table}"
+        params = ()
+        if ids is not None:
+            query += f" WHERE {id_col} IN ({', '.join(['%s'] * len(ids))})"
+            params = tuple(ids)
+
+        for rows in self.db.iter_chunks(query, params):
+            for values in rows:
+                row = dict(zip(selected, values))
+                text = ' '.join(str(row[col]) for col in (id_col,) + columns if row.get(col))
+                self._trigram.add((table, str(row[id_col])), text, {
+                    'type': label,
+                    'table': table,
+                    'id': row[id_col],
+                    'name': row[name_col],
+                    'contact': row[contact_col]
+                })
+
+    def _drop_deleted(self, matches):
+        """Remove matches that cascading deletes took out of the database; return whether any were"""
+        dropped = False
+        for table in self._unverified:
+            id_col = SEARCH_TARGETS[table][1]
+            ids = [str(payload['id']) for _, payload in matches if payload['table'] == table]
+            if not ids:
+                continue
+            rows = self.db.execute_query(
+                f"SELECT {id_col} FROM {table} WHERE {id_col} IN ({', '.join(['%s'] * len(ids))})",
+                tuple(ids)
+            )
+            found = {str(row[id_col]) for row in rows}
+            for record_id in ids:
+                if record_id not in found:
+                    dropped = self._trigram.remove((table, record_id)) or dropped
+        return dropped
+
+    def _result(self, row):
+        label = SEARCH_TARGETS[row['SOURCE']][0]
+        return {
+            'type': label,
+            'table': row['SOURCE'],
+            'id': row['ID'],
+            'name': row['NAME'],
+            'contact': row['CONTACT'],
+            'score': float(row['SCORE'] or 0)
+        }
+
+# References
+# 1. **MySQL Full-Text Search**
+#    - Used for: Ranked MATCH ... AGAINST lookups
+#    - Documentation: [Full-Text Search Functions](https://dev.mysql.com/doc/refman/8.0/en/fulltext-search.html)
+# 2. **MySQL ngram Full-Text Parser**
+#    - Used for: Matching partial names and phone numbers
+#    - Documentation: [ngram Full-Text Parser](https://dev.mysql.com/doc/refman/8.0/en/fulltext-search-ngram.html)
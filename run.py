@@ -2,12 +2,33 @@ import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent))
 
-import tkinter as tk
-from src.app import NationalHospital
+import argparse
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="National Hospital")
+    parser.add_argument('--profile-startup', nargs='?', const='startup_profile.txt', metavar='PATH',
+                        help="append import and startup phase timings to PATH (default: %(const)s)")
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+
+    # Installed before anything heavy is imported so every module is timed
+    profile = None
+    if args.profile_startup:
+        from src.startup_profile import StartupProfile
+        profile = StartupProfile(args.profile_startup)
+        profile.start()
+
+    # Imported here rather than at the top so the profile covers them
+    import tkinter as tk
+    from src.app import NationalHospital
+
     root = tk.Tk()
-    app = NationalHospital(root)
+    if profile:
+        profile.mark('tk_ready')
+    app = NationalHospital(root, profile=profile)
     root.mainloop()
 
 if __name__ == "__main__":
@@ -21,3 +42,6 @@ if __name__ == "__main__":
 # 2. **Pathlib**
 #    - Used for: Path manipulations
 #    - Documentation: [Pathlib Documentation](https://docs.python.org/3/library/pathlib.html)
+# 3. **argparse**
+#    - Used for: Command line options such as --profile-startup
+#    - Documentation: [argparse Documentation](https://docs.python.org/3/library/argparse.html)
@@ -1,9 +1,24 @@
-from .dashboard import Dashboard
-from .table_view import TableView
+# Views are imported on first access so importing src.app stays cheap
+_LAZY_IMPORTS = {
+    'Dashboard': '.dashboard',
+    'TableView': '.table_view',
+}
 
 __all__ = ['Dashboard', 'TableView']
 
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # References
 # 1. **Python import system**
 #    - Used for: Importing modules
 #    - Documentation: [Python Import System](https://docs.python.org/3/reference/import.html)
+# 2. **Module __getattr__ (PEP 562)**
+#    - Used for: Deferring view imports until they are used
+#    - Documentation: [PEP 562](https://peps.python.org/pep-0562/)
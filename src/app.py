@@ -3,27 +3,82 @@ import sys
 import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
-import time
-from database.db_manager import DatabaseManager
 from ui.components import SidebarButton
-from .dashboard import Dashboard
-from .table_view import TableView
+from .data_loader import DataLoader
+from ui.scheduler import UIScheduler
+from .startup import StartupPhases
 import random
 
 class NationalHospital:
-    def __init__(self, root):
+    def __init__(self, root, profile=None):
         self.root = root
         self.root.withdraw()  # Hide the main window initially
+        self.profile = profile  # StartupProfile when run with --profile-startup
         
-        # Initialize database
-        self.db = DatabaseManager()
+        # The database layer is imported and connected in the background while the welcome screen is shown
+        self.db = None
+
+        # One background loader and one timer for periodic UI jobs, shared by every view
+        self.loader = DataLoader(self.root)
+        self.scheduler = UIScheduler(self.root)
         
-        # Check database connection
-        if not self.db.connection:
-            messagebox.showerror("Error", "Could not connect to database")
-            root.destroy()
-            return
+        # Initialize components
+        self.content_area = None
+        self.dashboard = None
+        self.table_view = None
         
+        # Show welcome screen and start the real work behind it
+        self.show_welcome_screen()
+        if self.profile:
+            self.profile.mark('welcome_screen')
+        self.start_initialization()
+
+    def start_initialization(self):
+        """Run the startup phases on a worker thread; the progress bar follows them"""
+        self.startup = StartupPhases()
+        self.startup.add('modules', "Loading modules...", self._load_modules, weight=1)
+        self.startup.add('connect', "Connecting to database...", lambda: self.db.open_pool(), weight=3)
+        self.startup.add('schema', "Checking database schema...", lambda: self.db.migrate(), weight=2)
+        self.startup.add('metadata', "Loading table metadata...", lambda: self.db.preload_metadata(), weight=3)
+        # Warms the statistics cache so the first dashboard shows without waiting
+        self.startup.add('dashboard', "Loading dashboard...", lambda: self.db.get_dashboard_stats(), weight=2)
+        self.loader.submit('startup', self._run_startup, with_token=True,
+                           on_success=self._startup_finished, on_error=self._startup_failed)
+
+    def _load_modules(self):
+        """Import the database layer and the views off the Tk thread"""
+        from database.db_manager import DatabaseManager
+        from . import dashboard, table_view  # noqa: F401 - imported now so building the window doesn't wait
+        self.db = DatabaseManager(auto_connect=False)
+
+    def _run_startup(self, token):
+        return self.startup.run(
+            token, lambda fraction, message: self.loader.post(token, self.update_progress, fraction, message)
+        )
+
+    def _startup_finished(self, timings):
+        self.build_main_window()
+        self.close_welcome_screen()
+        # Connecting only recounts the dashboard counters when they are due, so check hourly too
+        self.scheduler.schedule(self.root, 3600 * 1000, self._reconcile_stats, visible_only=False)
+        if self.profile:
+            self.profile.record_phases(timings)
+            # Idle callbacks run once the main window has been drawn
+            self.root.after_idle(self.profile.finish)
+
+    def _reconcile_stats(self):
+        """Recount the summary tables in the background once stats_reconcile_interval has passed"""
+        self.loader.submit('stats_reconcile', self.db.reconcile_hospital_stats, if_due=True)
+
+    def _startup_failed(self, error):
+        self.close_welcome_screen()
+        if self.profile:
+            self.profile.finish(error)
+        messagebox.showerror("Error", f"Could not connect to database\n{error}")
+        self.root.destroy()
+
+    def build_main_window(self):
+        """Create the main window once the database is ready"""
         # Configure main window
         self.root.title("National Hospital")
         self.root.state('zoomed')
@@ -33,19 +88,14 @@ class NationalHospital:
         self.main_container = tk.Frame(self.root, bg='#f0f0f0')
         self.main_container.pack(fill='both', expand=True)
         
-        # Initialize components
-        self.content_area = None
-        self.dashboard = None
-        
         # Create sidebar and content area first
         self.create_sidebar()
         self.setup_content_area()
         
         # Initialize table_view after content area is created
-        self.table_view = TableView(self.content_area, self.db)
-        
-        # Show welcome screen
-        self.show_welcome_screen()
+        from .table_view import TableView
+        self.table_view = TableView(self.content_area, self.db, loader=self.loader,
+                                    scheduler=self.scheduler)
 
     def create_sidebar(self):
         sidebar = tk.Frame(self.main_container, bg='#2c3e50', width=200)
@@ -80,7 +130,9 @@ class NationalHospital:
         self.content_area.pack(side='right', fill='both', expand=True)
         
         # Initialize dashboard
-        self.dashboard = Dashboard(self.content_area, self.root, self.db)
+        from .dashboard import Dashboard
+        self.dashboard = Dashboard(self.content_area, self.root, self.db, loader=self.loader,
+                                   scheduler=self.scheduler)
 
     def show_welcome_screen(self):
         welcome = tk.Toplevel(self.root)
@@ -237,12 +289,12 @@ class NationalHospital:
         self.pulse_alpha = 0
         self.pulse_increasing = True
         
-        # Start all animations
-        self.animate_particles()
-        self.pulse_icon()
+        # Start all animations; they stop when the welcome window is destroyed
+        self.scheduler.schedule(welcome, 50, self.animate_particles)
+        self.scheduler.schedule(welcome, 50, self.pulse_icon)
         self.typewriter_text("Welcome to", self.welcome_text, 
                            "National Hospital", self.hospital_text)
-        self.welcome_window.after(500, self.update_progress)
+        self.fade_in_text()
     
     def animate_particles(self):
         """Animate floating particles"""
@@ -276,8 +328,6 @@ class NationalHospital:
                     tags='particle'
                 )
             
-            self.welcome_window.after(50, self.animate_particles)
-            
         except Exception as e:
             logging.error(f"Error in particle animation: {e}")
     
@@ -299,28 +349,27 @@ class NationalHospital:
             color = self._interpolate_color('#bbdefb', '#2196f3', self.pulse_alpha)
             self.icon_label.configure(fg=color)
             
-            self.welcome_window.after(50, self.pulse_icon)
-            
         except Exception as e:
             logging.error(f"Error in icon pulse animation: {e}")
     
-    def typewriter_text(self, text1, label1, text2, label2, index1=0, index2=0):
-        """Create typewriter effect for text"""
+    def typewriter_text(self, text1, label1, text2, label2):
+        """Create typewriter effect for text: text1 at one letter per 100 ms, then text2 at one per 50 ms"""
         if not hasattr(self, 'welcome_window'):
             return
-            
-        try:
-            if index1 < len(text1):
-                label1.configure(text=text1[:index1+1])
-                self.welcome_window.after(100, 
-                    lambda: self.typewriter_text(text1, label1, text2, label2, index1+1, index2))
-            elif index2 < len(text2):
-                label2.configure(text=text2[:index2+1])
-                self.welcome_window.after(50, 
-                    lambda: self.typewriter_text(text1, label1, text2, label2, index1, index2+1))
-                
-        except Exception as e:
-            logging.error(f"Error in typewriter animation: {e}")
+        ticks = iter([(label1, text1[:i]) for i in range(1, len(text1) + 1) for _ in (0, 1)]
+                     + [(label2, text2[:i]) for i in range(1, len(text2) + 1)])
+
+        def step():
+            try:
+                label, text = next(ticks)
+                label.configure(text=text)
+            except StopIteration:
+                self.scheduler.cancel(job)
+            except Exception as e:
+                logging.error(f"Error in typewriter animation: {e}")
+                self.scheduler.cancel(job)
+
+        job = self.scheduler.schedule(self.welcome_window, 50, step)
 
     def _interpolate_color(self, color1, color2, fraction):
         """Interpolate between two colors"""
@@ -329,74 +378,71 @@ class NationalHospital:
         rgb = [int(c1[i] + (c2[i] - c1[i]) * fraction) for i in range(3)]
         return f'#{rgb[0]:02x}{rgb[1]:02x}{rgb[2]:02x}'
     
-    def update_progress(self):
-        """Update the welcome screen progress"""
-        status_messages = [
-            "Loading modules...",
-            "Connecting to database...",
-            "Initializing interface...",
-            "Loading patient records...",
-            "Setting up dashboard...",
-            "Almost ready..."
-        ]
-        
+    def fade_in_text(self, steps=30):
+        """Fade the welcome text in from the background colour, one step every 20 ms"""
+        if not hasattr(self, 'welcome_window'):
+            return
+        alphas = iter([step / steps for step in range(steps + 1)])
+
+        def step():
+            try:
+                alpha = next(alphas)
+                self.welcome_text['fg'] = self._interpolate_color('#f8f9fa', '#1976d2', alpha)
+                self.hospital_text['fg'] = self._interpolate_color('#f8f9fa', '#1565c0', alpha)
+            except StopIteration:
+                self.scheduler.cancel(job)
+            except Exception as e:
+                logging.error(f"Error in text fade animation: {e}")
+                self.scheduler.cancel(job)
+
+        job = self.scheduler.schedule(self.welcome_window, 20, step)
+
+    def update_progress(self, fraction, message):
+        """Show how much of the startup work has finished"""
+        if not hasattr(self, 'welcome_window'):
+            return
         try:
-            for i in range(101):
-                self.progress['value'] = i
-                
-                # Update status message
-                if i < 95:
-                    status_index = (i // 16) % len(status_messages)
-                    self.status_label['text'] = status_messages[status_index]
-                    
-                self.loading_label['text'] = f"Loading... {i}%"
-                
-                # Fade in text effect
-                if i < 30:
-                    alpha = i / 30
-                    self.welcome_text['fg'] = self._interpolate_color('#f8f9fa', '#1976d2', alpha)
-                    self.hospital_text['fg'] = self._interpolate_color('#f8f9fa', '#1565c0', alpha)
-                
-                self.welcome_window.update()
-                time.sleep(0.02)
-            
-            # Cleanup and show main window
-            self.welcome_window.destroy()
-            self.root.deiconify()
-            
+            percent = int(fraction * 100)
+            self.progress['value'] = percent
+            self.loading_label['text'] = f"Loading... {percent}%"
+            self.status_label['text'] = message
         except Exception as e:
             logging.error(f"Error during welcome screen progress: {e}")
-            # Ensure main window is shown even if there's an error
-            if hasattr(self, 'welcome_window'):
-                self.welcome_window.destroy()
-            self.root.deiconify()
+
+    def close_welcome_screen(self):
+        """Remove the welcome screen and show the main window"""
+        if hasattr(self, 'welcome_window'):
+            self.scheduler.cancel_owner(self.welcome_window)
+            self.welcome_window.destroy()
+            del self.welcome_window
+        self.root.deiconify()
 
     def show_dashboard(self):
-        # Clear existing content
-        for widget in self.content_area.winfo_children():
-            widget.destroy()
-            
-        # Create new dashboard
-        self.dashboard = Dashboard(self.content_area, self.root, self.db)
-        self.update_datetime()
+        # Hide the table on screen; it stays built for the next visit
+        self.table_view.hide()
+
+        # Reuse the dashboard built at startup unless it is gone
+        if self.dashboard and self.dashboard.winfo_exists():
+            if not self.dashboard.winfo_manager():
+                self.dashboard.show()
+            logging.debug(f"Periodic UI jobs: {self.scheduler.job_counts()}")
+            return
+
+        from .dashboard import Dashboard
+        self.dashboard = Dashboard(self.content_area, self.root, self.db, loader=self.loader,
+                                   scheduler=self.scheduler)
 
     def show_table_view(self, table_name):
+        if self.dashboard and self.dashboard.winfo_exists():
+            self.dashboard.pack_forget()
         self.table_view.setup(self.content_area, table_name)
-
-    def update_datetime(self):
-        try:
-            if hasattr(self.dashboard, 'time_label') and self.dashboard.time_label.winfo_exists():
-                current_time = time.strftime('%I:%M %p')
-                current_date = time.strftime('%B %d, %Y')
-                self.dashboard.time_label.config(text=current_time)
-                self.dashboard.date_label.config(text=current_date)
-                self.root.after(1000, self.update_datetime)
-        except Exception as e:
-            logging.error(f"Error updating datetime: {e}")
+        logging.debug(f"Periodic UI jobs: {self.scheduler.job_counts()}")
 
     def __del__(self):
         try:
-            if hasattr(self, 'db'):
+            if hasattr(self, 'loader'):
+                self.loader.shutdown()
+            if getattr(self, 'db', None):
                 self.db.disconnect()
         except Exception as e:
             logging.error(f"Error during cleanup: {e}")
@@ -408,15 +454,10 @@ if __name__ == '__main__':
 
     import tkinter as tk
     from tkinter import ttk, messagebox
-    import time
-    from database.db_manager import DatabaseManager
     from ui.components import SidebarButton
-    from .dashboard import Dashboard
-    from .table_view import TableView
 
     root = tk.Tk()
     app = NationalHospital(root)
-    app.update_progress()
     root.mainloop()
 
 # References
@@ -6,16 +6,24 @@ import threading
 from datetime import datetime, timedelta
 import math
 import logging
+from src.data_loader import DataLoader
+from ui.scheduler import UIScheduler
 
 class Dashboard(tk.Frame):
-    def __init__(self, parent, root, db):
+    def __init__(self, parent, root, db, loader=None, scheduler=None):
         super().__init__(parent)
         self.root = root
         self.db = db
+        self.loader = loader or DataLoader(self)
+        self.scheduler = scheduler or UIScheduler(root)
+        self.stat_labels = {}
         self.configure(bg='#f0f2f5')  # Modern light background
         self.setup_font()
         self.create_dashboard()
-        self.update_time()
+
+        # Both stop by themselves when the dashboard is destroyed
+        self.scheduler.schedule(self, 1000, self.update_time)
+        self.scheduler.schedule(self, 2000, self.animate_status)
 
     def setup_font(self):
         """Setup digital font for clock, fallback to a similar font if not available"""
@@ -137,6 +145,10 @@ class Dashboard(tk.Frame):
         self.update_time()
         self.animate_status()
 
+    def destroy(self):
+        self.scheduler.cancel_owner(self)
+        super().destroy()
+
     def animate_status(self):
         """Animate the status label with a pulsing effect"""
         try:
@@ -147,7 +159,6 @@ class Dashboard(tk.Frame):
                 self.status_label.configure(fg=colors[current_color])
                 
             self._color_index = (current_color + 1) % len(colors)
-            self.root.after(2000, self.animate_status)
         except Exception as e:
             logging.error(f"Error in status animation: {e}")
 
@@ -169,15 +180,15 @@ class Dashboard(tk.Frame):
         cards_frame.grid_columnconfigure(0, weight=1)
         cards_frame.grid_columnconfigure(1, weight=1)
         
-        # Create enlarged stat cards
+        # Create enlarged stat cards; the figures are filled in once loaded
         stats = [
-            ('Total Patients', self.get_patient_count(), '#1a73e8', '👥'),
-            ('Doctors', self.get_doctor_count(), '#34a853', '👨‍⚕️'),
-            ('Available Rooms', self.get_room_count(), '#fbbc04', '🏥'),
-            ('Appointments Today', self.get_appointment_count(), '#ea4335', '📅')
+            ('patients', 'Total Patients', '#1a73e8', '👥'),
+            ('doctors', 'Doctors', '#34a853', '👨‍⚕️'),
+            ('available_rooms', 'Available Rooms', '#fbbc04', '🏥'),
+            ('appointments_today', 'Appointments Today', '#ea4335', '📅')
         ]
         
-        for i, (title, count, color, icon) in enumerate(stats):
+        for i, (key, title, color, icon) in enumerate(stats):
             row = i // 2
             col = i % 2
             
@@ -193,61 +204,35 @@ class Dashboard(tk.Frame):
                     font=('Segoe UI', 20),
                     bg=color, fg='white').pack()
             
-            tk.Label(inner_frame, text=str(count),
+            self.stat_labels[key] = tk.Label(inner_frame, text='…',
                     font=('Segoe UI', 20, 'bold'),
-                    bg=color, fg='white').pack()
+                    bg=color, fg='white')
+            self.stat_labels[key].pack()
             
             tk.Label(inner_frame, text=title,
                     font=('Segoe UI', 10),
                     bg=color, fg='white').pack()
 
-    def get_patient_count(self):
-        """Get count of patients"""
-        try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM PATIENT")
-            count = cursor.fetchone()[0]
-            cursor.close()
-            return count
-        except Exception as e:
-            logging.error(f"Error getting patient count: {e}")
-            return 0
+        self.load_stats()
 
-    def get_doctor_count(self):
-        """Get count of doctors"""
-        try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM DOCTOR")
-            count = cursor.fetchone()[0]
-            cursor.close()
-            return count
-        except Exception as e:
-            logging.error(f"Error getting doctor count: {e}")
-            return 0
+    def load_stats(self):
+        """Show cached statistics straight away, otherwise query them in the background"""
+        stats = self.db.cached_dashboard_stats()
+        if stats is not None:
+            self.show_stats(stats)
+            return
+        self.loader.submit('dashboard_stats', self.db.get_dashboard_stats,
+                           on_success=self.show_stats, on_error=self._stats_failed)
 
-    def get_room_count(self):
-        """Get count of available rooms"""
-        try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM ROOM WHERE OCCUPIED < CAPACITY")
-            count = cursor.fetchone()[0]
-            cursor.close()
-            return count
-        except Exception as e:
-            logging.error(f"Error getting room count: {e}")
-            return 0
+    def show_stats(self, stats):
+        """Fill the stat cards with loaded figures"""
+        for key, label in self.stat_labels.items():
+            if label.winfo_exists():
+                label.config(text=str(stats.get(key, 0)))
 
-    def get_appointment_count(self):
-        """Get count of appointments today"""
-        try:
-            cursor = self.db.connection.cursor()
-            cursor.execute("SELECT COUNT(*) FROM APPOINTMENT WHERE DATE(APPOINTMENT_DATE) = CURDATE()")
-            count = cursor.fetchone()[0]
-            cursor.close()
-            return count
-        except Exception as e:
-            logging.error(f"Error getting appointment count: {e}")
-            return 0
+    def _stats_failed(self, error):
+        logging.error(f"Error getting dashboard statistics: {error}")
+        self.show_stats({})
 
     def create_recent_activities(self, parent):
         """Create modern recent activities section"""
@@ -259,10 +244,31 @@ class Dashboard(tk.Frame):
                 font=('Segoe UI', 20, 'bold'),
                 bg='#ffffff', fg='#333333').pack(padx=20, pady=(0, 20))
         
+        self.activities_frame = tk.Frame(frame, bg='#ffffff')
+        self.activities_frame.pack(fill='both', expand=True)
+
+        # Placeholder until the first list arrives
+        tk.Label(self.activities_frame, text='Loading…',
+                font=('Segoe UI', 12),
+                bg='#ffffff', fg='#666666').pack(padx=20, pady=10)
+        self.load_recent_activities()
+
+    def load_recent_activities(self):
+        """Query the activities in the background; the current list stays until they arrive"""
+        self.activities_generation = self._activities_generation()
+        self.loader.submit('dashboard_activities', self.get_recent_activities,
+                           on_success=self.show_recent_activities)
+
+    def show_recent_activities(self, activities):
+        """Fill the activities list with loaded activities"""
+        if not self.activities_frame.winfo_exists():
+            return
+        for widget in self.activities_frame.winfo_children():
+            widget.destroy()
+
         # Activities list with larger text
-        activities = self.get_recent_activities()
         for activity in activities:
-            activity_frame = tk.Frame(frame, bg='#ffffff')
+            activity_frame = tk.Frame(self.activities_frame, bg='#ffffff')
             activity_frame.pack(fill='x', padx=20, pady=10)
             
             tk.Label(activity_frame, text=activity['icon'],
@@ -280,43 +286,55 @@ class Dashboard(tk.Frame):
                     font=('Segoe UI', 12),
                     bg='#ffffff', fg='#666666').pack(anchor='w')
 
+    def _activities_generation(self):
+        return tuple(self.db.get_write_generation(table) for table in ('APPOINTMENT', 'PATIENT'))
+
+    def show(self):
+        """Show the dashboard again after it was hidden, refreshing what changed"""
+        self.pack(fill='both', expand=True, padx=20, pady=20)
+        self.load_stats()
+        if self.activities_generation != self._activities_generation():
+            self.load_recent_activities()
+
     def get_recent_activities(self):
-        """Get recent activities from database"""
+        """Get recent activities from database (runs on a worker thread)"""
         activities = []
         try:
-            cursor = self.db.connection.cursor()
-            
-            # Get recent appointments
-            cursor.execute("""
-                SELECT 'APPOINTMENT', APPOINTMENT_DATE, PATIENT_ID 
-                FROM APPOINTMENT 
-                ORDER BY APPOINTMENT_DATE DESC 
-                LIMIT 10
-            """)
+            with self.db.checkout() as connection:
+                # Buffered, and closed even on errors, so no unread result goes back to the pool
+                cursor = connection.cursor(buffered=True)
+                try:
+                    # Get recent appointments
+                    cursor.execute("""
+                        SELECT 'APPOINTMENT', APPOINTMENT_DATE, PATIENT_ID 
+                        FROM APPOINTMENT 
+                        ORDER BY APPOINTMENT_DATE DESC 
+                        LIMIT 10
+                    """)
             
-            for activity_type, date, patient_id in cursor.fetchall():
-                activities.append({
-                    'icon': '📅',
-                    'title': f'New appointment scheduled for Patient #{patient_id}',
-                    'time': date.strftime('%Y-%m-%d %H:%M:%S') if date else 'N/A'
-                })
+                    for activity_type, date, patient_id in cursor.fetchall():
+                        activities.append({
+                            'icon': '📅',
+                            'title': f'New appointment scheduled for Patient #{patient_id}',
+                            'time': date.strftime('%Y-%m-%d %H:%M:%S') if date else 'N/A'
+                        })
             
-            # Get recent patients
-            cursor.execute("""
-                SELECT 'PATIENT', PATIENT_NAME, DATE 
-                FROM PATIENT 
-                ORDER BY DATE DESC 
-                LIMIT 10
-            """)
+                    # Get recent patients
+                    cursor.execute("""
+                        SELECT 'PATIENT', PATIENT_NAME, DATE 
+                        FROM PATIENT 
+                        ORDER BY DATE DESC 
+                        LIMIT 10
+                    """)
             
-            for activity_type, name, date in cursor.fetchall():
-                activities.append({
-                    'icon': '👤',
-                    'title': f'New patient registered: {name}',
-                    'time': date.strftime('%Y-%m-%d %H:%M:%S') if date else 'N/A'
-                })
-            
-            cursor.close()
+                    for activity_type, name, date in cursor.fetchall():
+                        activities.append({
+                            'icon': '👤',
+                            'title': f'New patient registered: {name}',
+                            'time': date.strftime('%Y-%m-%d %H:%M:%S') if date else 'N/A'
+                        })
+                finally:
+                    cursor.close()
         except Exception as e:
             logging.error(f"Error getting recent activities: {e}")
             # Fallback activities if database query fails
@@ -328,7 +346,7 @@ class Dashboard(tk.Frame):
         return activities
 
     def update_time(self):
-        """Update the time display every second with enhanced format and animations"""
+        """Update the time display with enhanced format and animations (runs every second)"""
         try:
             # Get current time components
             current = datetime.now()
@@ -363,9 +381,6 @@ class Dashboard(tk.Frame):
                 
             if hasattr(self, 'week_label') and self.week_label.winfo_exists():
                 self.week_label.config(text=f"Week {week_num}")
-
-            # Schedule the next update
-            self.root.after(1000, self.update_time)
         except Exception as e:
             logging.error(f"Error updating time: {e}")
 
@@ -380,6 +395,9 @@ class Dashboard(tk.Frame):
 # 3. **Datetime**
 #    - Used for: Handling date and time
 #    - Documentation: [Datetime Documentation](https://docs.python.org/3/library/datetime.html)
-# 4. **Math**
+# 4. **concurrent.futures**
+#    - Used for: Loading statistics off the UI thread (via DataLoader)
+#    - Documentation: [concurrent.futures Documentation](https://docs.python.org/3/library/concurrent.futures.html)
+# 5. **Math**
 #    - Used for: Mathematical operations
 #    - Documentation: [Math Documentation](https://docs.python.org/3/library/math.html)
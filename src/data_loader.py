@@ -0,0 +1,121 @@
+from concurrent.futures import ThreadPoolExecutor
+import tkinter as tk
+import logging
+import queue
+import threading
+
+
+class CancellationToken:
+    """Flag shared between a view and the background job it started"""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+
+class DataLoader:
+    """Run database work on a thread pool and hand results back to the Tk thread
+
+    Jobs are submitted on a named channel; submitting a new job on a channel
+    cancels the previous one so its result is discarded instead of being
+    applied to a view that has moved on. Tk widgets are only touched from the
+    main thread: workers queue their callbacks and the loader drains the
+    queue with after() while jobs are in flight.
+    """
+
+    def __init__(self, widget, max_workers=4, poll_interval=50):
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers,
+                                           thread_name_prefix='data-loader')
+        self._results = queue.Queue()
+        self._tokens = {}
+        self._pending = 0
+        self._poll_job = None
+
+    def submit(self, channel, func, *args, on_success=None, on_error=None,
+               with_token=False, **kwargs):
+        """Run func(*args, **kwargs) in the background on the given channel"""
+        self.cancel(channel)
+        token = CancellationToken()
+        self._tokens[channel] = token
+        if with_token:
+            args = (token,) + args
+
+        self._pending += 1
+        self.executor.submit(self._run, channel, token, func, args, kwargs, on_success, on_error)
+        self._schedule_poll()
+        return token
+
+    def _run(self, channel, token, func, args, kwargs, on_success, on_error):
+        """Worker-side wrapper that queues the outcome for the Tk thread"""
+        if token.cancelled:
+            self._results.put((channel, token, None, (), True))
+            return
+        try:
+            result = func(*args, **kwargs)
+            self._results.put((channel, token, on_success, (result,), True))
+        except Exception as e:
+            logging.error(f"Background job failed: {e}")
+            self._results.put((channel, token, on_error, (e,), True))
+
+    def post(self, token, callback, *args):
+        """Queue a callback from a worker thread to run on the Tk thread"""
+        self._results.put((None, token, callback, args, False))
+
+    def cancel(self, channel=None):
+        """Cancel the job on one channel, or on every channel"""
+        if channel is None:
+            tokens = list(self._tokens.values())
+            self._tokens.clear()
+        else:
+            token = self._tokens.pop(channel, None)
+            tokens = [token] if token else []
+        for token in tokens:
+            token.cancel()
+
+    def _schedule_poll(self):
+        if self._poll_job is None:
+            try:
+                self._poll_job = self.widget.after(self.poll_interval, self._poll)
+            except tk.TclError:
+                self._poll_job = None
+
+    def _poll(self):
+        """Apply queued results on the Tk thread"""
+        self._poll_job = None
+        while True:
+            try:
+                channel, token, callback, args, final = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if final:
+                self._pending -= 1
+                if self._tokens.get(channel) is token:
+                    del self._tokens[channel]
+            if callback and not token.cancelled:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    logging.error(f"Error applying background result: {e}")
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def shutdown(self):
+        """Cancel outstanding jobs and stop the worker threads"""
+        self.cancel()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+# References
+# 1. **concurrent.futures**
+#    - Used for: Worker thread pool
+#    - Documentation: [concurrent.futures Documentation](https://docs.python.org/3/library/concurrent.futures.html)
+# 2. **Tkinter**
+#    - Used for: Scheduling callbacks on the main loop with after()
+#    - Documentation: [Python Tkinter Documentation](https://docs.python.org/3/library/tkinter.html)
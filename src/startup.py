@@ -0,0 +1,53 @@
+import logging
+import time
+
+
+class StartupCancelled(Exception):
+    """Raised when startup is abandoned, e.g. because the window was closed"""
+
+
+class StartupPhases:
+    """Ordered, timed startup steps that run off the Tk thread
+
+    Each phase has a weight describing its share of the progress bar, so
+    progress follows the work that has actually finished rather than a
+    fixed animation.
+    """
+
+    def __init__(self):
+        self.phases = []  # (name, message, weight, func)
+        self.timings = {}  # name -> seconds
+
+    def add(self, name, message, func, weight=1):
+        """Append a phase; message is shown while it runs"""
+        self.phases.append((name, message, weight, func))
+
+    def run(self, token=None, progress=None):
+        """Run every phase in order and return {name: seconds}
+
+        progress(fraction, message) is called before each phase and once
+        at the end with a fraction of 1.0. It runs on the worker thread, so
+        Tk callers should hand it on with DataLoader.post().
+        """
+        total = sum(weight for _, _, weight, _ in self.phases) or 1
+        done = 0
+        started = time.perf_counter()
+        for name, message, weight, func in self.phases:
+            if token is not None and token.cancelled:
+                raise StartupCancelled("Startup cancelled")
+            if progress:
+                progress(done / total, message)
+            phase_started = time.perf_counter()
+            func()
+            self.timings[name] = time.perf_counter() - phase_started
+            logging.info(f"Startup phase {name} took {self.timings[name]:.3f}s")
+            done += weight
+        if progress:
+            progress(1.0, "Ready")
+        logging.info(f"Startup finished in {time.perf_counter() - started:.3f}s")
+        return dict(self.timings)
+
+# References
+# 1. **Python time module**
+#    - Used for: Timing startup phases with perf_counter
+#    - Documentation: [time Documentation](https://docs.python.org/3/library/time.html)
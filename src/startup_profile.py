@@ -0,0 +1,146 @@
+from datetime import datetime
+import importlib.abc
+import logging
+import platform
+import sys
+import threading
+import time
+
+
+class _TimedLoader:
+    """Wrap a module loader to time its exec_module, passing everything else through"""
+
+    def __init__(self, profiler, loader):
+        self._profiler = profiler
+        self._loader = loader
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._enter()
+        started = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit(module.__name__, started)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """Record self and cumulative import times per module, like python -X importtime"""
+
+    def __init__(self):
+        self.records = []  # (module, self seconds, cumulative seconds, depth, thread name)
+        self._local = threading.local()
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        # Ask the finders after this one and time whatever loader they return
+        for finder in sys.meta_path[sys.meta_path.index(self) + 1:]:
+            find_spec = getattr(finder, 'find_spec', None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+                spec.loader = _TimedLoader(self, spec.loader)
+            return spec
+        return None
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _enter(self):
+        self._stack().append(0.0)  # time spent in nested imports
+
+    def _exit(self, name, started):
+        cumulative = time.perf_counter() - started
+        stack = self._stack()
+        nested = stack.pop()
+        if stack:
+            stack[-1] += cumulative
+        self.records.append((name, cumulative - nested, cumulative, len(stack),
+                             threading.current_thread().name))
+
+
+class StartupProfile:
+    """Collect import and phase timings for one start and append them to a file
+
+    Run with python run.py --profile-startup [path]. Each run appends a
+    block with the time each mark was reached, the duration of every
+    startup phase and an importtime-style table, so cold starts can be
+    compared across releases.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.started = time.perf_counter()
+        self.marks = []  # (name, seconds since start)
+        self.phases = {}
+        self.imports = ImportTimer()
+        self._finished = False
+
+    def start(self):
+        self.imports.install()
+
+    def mark(self, name):
+        """Record that startup reached a named point"""
+        self.marks.append((name, time.perf_counter() - self.started))
+
+    def record_phases(self, timings):
+        self.phases.update(timings)
+
+    def finish(self, error=None):
+        """Stop timing imports and append the report; later calls do nothing"""
+        if self._finished:
+            return
+        self._finished = True
+        self.mark('failed' if error else 'interactive')
+        self.imports.uninstall()
+        try:
+            with open(self.path, 'a', encoding='utf-8') as file:
+                file.write(self.report(error))
+            logging.info(f"Startup profile written to {self.path}")
+        except OSError as e:
+            logging.error(f"Could not write startup profile: {e}")
+
+    def report(self, error=None):
+        lines = [
+            f"# Startup profile {datetime.now().isoformat(timespec='seconds')} "
+            f"(Python {platform.python_version()}, {platform.system()} {platform.release()})"
+        ]
+        if error:
+            lines.append(f"error: {error}")
+        lines.append("marks:")
+        lines.extend(f"  {name:<24}{seconds * 1000:>10.1f} ms" for name, seconds in self.marks)
+        lines.append("phases:")
+        lines.extend(f"  {name:<24}{seconds * 1000:>10.1f} ms" for name, seconds in self.phases.items())
+        lines.append("imports:")
+        lines.append("import time: self [us] | cumulative | imported package")
+        for name, own, cumulative, depth, thread in self.imports.records:
+            suffix = '' if thread == 'MainThread' else f"  [{thread}]"
+            lines.append(f"import time: {own * 1e6:>9.0f} | {cumulative * 1e6:>10.0f} | "
+                         f"{'  ' * depth}{name}{suffix}")
+        return '\n'.join(lines) + '\n\n'
+
+# References
+# 1. **importlib**
+#    - Used for: Timing module imports with a meta path finder
+#    - Documentation: [importlib Documentation](https://docs.python.org/3/library/importlib.html)
+# 2. **-X importtime**
+#    - Used for: The format of the import table
+#    - Documentation: [Command line options](https://docs.python.org/3/using/cmdline.html#cmdoption-X)
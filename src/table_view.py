@@ -1,15 +1,31 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
+from collections import OrderedDict
 import sys
 from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 from ui.components import DataEntryForm, DataTable
+from ui.scheduler import UIScheduler
+from src.data_loader import DataLoader
+from database.importer import TableImporter
+from database.exporter import TableExporter
 import logging
 
+# Attributes that belong to the table on screen; each cached view keeps its own copy
+VIEW_STATE = (
+    'form', 'table', 'status_frame', 'status_label', 'loading_bar', 'search_var', 'filter_column',
+    'prev_page_btn', 'page_label', 'next_page_btn', 'page_cursors', 'page_index', 'page_has_more',
+    'total_rows', 'total_is_estimate', 'sort_by', 'sort_descending', 'last_search', 'data_generation'
+)
+
 class TableView:
-    def __init__(self, parent, db_manager):
+    def __init__(self, parent, db_manager, loader=None, scheduler=None):
         self.parent = parent
         self.db = db_manager
+        self.loader = loader or DataLoader(parent)
+        self.scheduler = scheduler or UIScheduler(parent)
+        self.pending_loads = {}  # channel -> token of the job still running
+        self.write_count = 0
         self.content_area = None
         self.form = None
         self.table = None
@@ -17,6 +33,21 @@ class TableView:
         self.search_var = None
         self.sort_reverse = False
         self.columns = []
+        self.page_size = 1000
+        self.page_cursors = [None]  # keyset cursor that starts each visited page
+        self.page_index = 0
+        self.page_has_more = False
+        self.total_rows = None
+        self.total_is_estimate = False
+        self.sort_by = None  # column pages are ordered by on the server, None for the primary key
+        self.sort_descending = False
+        self.search_limit = 500  # most rows a search brings back
+        self.search_delay = 250  # ms of typing pause before a search runs
+        self.search_job = None
+        self.last_search = None  # table, column, term and records of the last search shown
+        self.data_generation = None  # db write generation the rows on screen were loaded at
+        self.views = OrderedDict()  # table -> built view, least recently shown first
+        self.view_cache_size = 4  # most table views kept built while hidden
         self.setup_styles()
 
     def setup(self, content_area, table_name):
@@ -24,28 +55,76 @@ class TableView:
         try:
             logging.info(f"Setting up table view for {table_name}")
             self.content_area = content_area
+
+            # Keep the previous table's widgets for the next time it is opened
+            self.hide()
             self.current_table = table_name
-            
-            # Clear any existing content
-            self.clear_content()
-            
-            # Show the table view
-            self.show_table_view(table_name)
+
+            view = self.views.get(table_name)
+            if view and view['frame'].winfo_exists():
+                self._show_cached_view(table_name, view)
+            else:
+                self.show_table_view(table_name)
             
         except Exception as e:
             logging.error(f"Error in setup: {e}")
             messagebox.showerror("Error", f"Failed to set up table view: {str(e)}")
 
+    def hide(self):
+        """Hide the table on screen, keeping its widgets and rows cached"""
+        view = self.views.get(self.current_table)
+        if not view or view['state'] is not None:
+            return
+
+        # Results still loading for the hidden table are no longer wanted
+        if 'data' in self.pending_loads or self.search_job:
+            self.data_generation = None  # reload it when it is shown again
+        self.loader.cancel('data')
+        self.pending_loads.pop('data', None)
+        self._cancel_scheduled_search()
+        self._update_loading()
+
+        view['state'] = {name: getattr(self, name, None) for name in VIEW_STATE}
+        if view['frame'].winfo_exists():
+            view['frame'].pack_forget()
+
+    def _show_cached_view(self, table_name, view):
+        """Show a previously built view, reloading its rows only if the table changed"""
+        self.views.move_to_end(table_name)
+        for name, value in view['state'].items():
+            setattr(self, name, value)
+        view['state'] = None
+        view['frame'].pack(fill='both', expand=True, padx=35, pady=25)
+
+        if self.data_generation != self.db.get_write_generation(table_name):
+            self._reload_view(table_name)
+
+    def _reload_view(self, table_name):
+        """Reload whatever the view was showing: the search typed in or the current page"""
+        if self.search_var.get().strip():
+            self.last_search = None
+            self._on_search()
+        elif self.last_search:
+            self._refresh_table(table_name)
+        else:
+            self.total_rows = None
+            self._load_page(table_name, self.page_index)
+
     def show_table_view(self, table_name):
         """Display the table view for the given table name"""
         try:
-            # Clear existing content
-            self.clear_content()
+            self._discard_view(table_name)
             self.current_table = table_name
+            self.last_search = None
+            self.data_generation = None
+            self.page_index = 0
+            self.page_has_more = False
             
             # Create main container
             main_frame = ttk.Frame(self.content_area)
             main_frame.pack(fill='both', expand=True, padx=35, pady=25)
+            self.views[table_name] = {'frame': main_frame, 'state': None}
+            self._evict_views()
             
             # Create header frame
             header_frame = ttk.Frame(main_frame)
@@ -74,6 +153,13 @@ class TableView:
                 foreground='gray'
             )
             self.status_label.pack(side='left')
+
+            # Loading indicator, shown while background queries run
+            self.loading_bar = ttk.Progressbar(
+                self.status_frame,
+                mode='indeterminate',
+                length=120
+            )
             
             # Create form and table first
             self.create_form_and_table(main_frame, table_name)
@@ -89,6 +175,19 @@ class TableView:
             logging.error(f"Error in show_table_view: {e}")
             messagebox.showerror("Error", f"Failed to show table view: {str(e)}")
 
+    def _discard_view(self, table_name):
+        """Destroy the cached view of a table, if there is one"""
+        view = self.views.pop(table_name, None)
+        if view and view['frame'].winfo_exists():
+            view['frame'].destroy()
+
+    def _evict_views(self):
+        """Destroy the least recently shown views beyond view_cache_size"""
+        while len(self.views) > self.view_cache_size:
+            table_name = next(iter(self.views))
+            logging.info(f"Dropping cached table view for {table_name}")
+            self._discard_view(table_name)
+
     def _setup_search_widgets(self, parent, table_name):
         """Setup search entry and filter widgets"""
         try:
@@ -104,6 +203,10 @@ class TableView:
                 width=30
             )
             search_entry.pack(side='left', padx=5)
+            search_entry.bind('<Return>', lambda e: self._on_search())
+            
+            # Search as the user types, once they pause
+            self.search_var.trace_add('write', self._schedule_search)
             
             # Search button
             search_btn = ttk.Button(
@@ -123,6 +226,24 @@ class TableView:
             )
             reset_btn.pack(side='left', padx=2)
             
+            # Import button
+            import_btn = ttk.Button(
+                search_container,
+                text="Import",
+                command=lambda: self._import_file(table_name),
+                style='Import.TButton'
+            )
+            import_btn.pack(side='left', padx=2)
+            
+            # Export button
+            export_btn = ttk.Button(
+                search_container,
+                text="Export",
+                command=lambda: self._export_file(table_name),
+                style='Import.TButton'
+            )
+            export_btn.pack(side='left', padx=2)
+            
             # Filter frame
             filter_frame = ttk.Frame(parent)
             filter_frame.pack(fill='x', pady=5)
@@ -149,77 +270,117 @@ class TableView:
             logging.error(f"Error setting up search widgets: {e}")
             self.update_status("Error setting up search", "error")
 
+    def _schedule_search(self, *args):
+        """Debounce keystrokes so a search only runs once typing pauses"""
+        self._cancel_scheduled_search()
+        if self.content_area:
+            self.search_job = self.content_area.after(self.search_delay, self._on_search)
+
+    def _cancel_scheduled_search(self):
+        if self.search_job and self.content_area:
+            try:
+                self.content_area.after_cancel(self.search_job)
+            except tk.TclError:
+                pass
+        self.search_job = None
+
     def _on_search(self, *args):
         """Handle search input"""
         try:
+            self._cancel_scheduled_search()
             search_text = self.search_var.get().strip()
             filter_col = self.filter_column.get()
+            column = None if filter_col == "All Columns" else filter_col
             
             if not search_text:
-                self._refresh_table(self.current_table)
-                self.update_status("Showing all records", "info")
+                if self.last_search:
+                    self.last_search = None
+                    self._refresh_table(self.current_table)
                 return
-                
-            # Get all records
-            records = self.db.get_table_data(self.current_table)
-            if not records:
-                self.table.clear()
-                self.update_status("No records found", "info")
+
+            # A longer term can be applied to the previous results without a query
+            refined = self._refine_last_search(search_text, column)
+            if refined is not None:
+                self.loader.cancel('data')
+                self.pending_loads.pop('data', None)
+                self._update_loading()
+                self._show_search_results(refined, search_text, filter_col)
                 return
-                
-            # Filter records
-            filtered_records = []
-            for record in records:
-                if filter_col == "All Columns":
-                    # Search in all columns
-                    if any(str(value).lower().find(search_text.lower()) != -1 
-                          for value in record.values()):
-                        filtered_records.append(record)
-                else:
-                    # Search in specific column
-                    value = str(record.get(filter_col, "")).lower()
-                    if value.find(search_text.lower()) != -1:
-                        filtered_records.append(record)
-            
-            # Update table
-            self.table.clear()
-            self.table.insert_data(filtered_records)
-            
-            # Update status
-            count = len(filtered_records)
-            status = f"Found {count} record{'s' if count != 1 else ''}"
-            if search_text:
-                status += f" matching '{search_text}'"
-            if filter_col != "All Columns":
-                status += f" in {filter_col}"
-            self.update_status(status, "info")
+
+            generation = self.db.get_write_generation(self.current_table)
+            self._run_query(
+                self._stream_search,
+                self.current_table, search_text, column,
+                on_success=lambda records: self._show_search_results(
+                    records, search_text, filter_col, streamed=True, generation=generation),
+                message="Searching...",
+                with_token=True
+            )
             
         except Exception as e:
             logging.error(f"Error in search: {e}")
             self.update_status("Search error occurred", "error")
 
-    def _add_placeholder(self, entry, placeholder):
-        """Add placeholder text to entry widget"""
-        def on_focus_in(event):
-            if entry.get() == placeholder:
-                entry.delete(0, 'end')
-                entry.configure(foreground='#2c3e50')
+    def _refine_last_search(self, search_text, column):
+        """Filter the previous results in memory when the new term extends the old one"""
+        last = self.last_search
+        if (not last or last.get('stale') or last['table'] != self.current_table
+                or last['column'] != column
+                or len(last['records']) >= self.search_limit
+                or not search_text.lower().startswith(last['term'].lower())):
+            return None
+        return self.db.filter_records(self.current_table, last['records'], search_text, column)
+
+    def _stream_search(self, token, table_name, search_text, column):
+        """Fetch search results in chunks, showing each as it arrives (runs on a worker thread)"""
+        records = []
+        for chunk in self.db.iter_search(table_name, search_text, column, self.search_limit):
+            if token.cancelled:
+                break
+            self.loader.post(token, self._show_search_chunk, chunk, not records)
+            records.extend(chunk)
+        return records
 
-        def on_focus_out(event):
-            if not entry.get():
-                entry.insert(0, placeholder)
-                entry.configure(foreground='#95a5a6')
+    def _show_search_chunk(self, chunk, first):
+        """Show one chunk of streamed search results"""
+        if first:
+            self.table.clear()
+            self._update_paging_widgets(enabled=False)
+        self.table.append_data(chunk)
 
-        entry.insert(0, placeholder)
-        entry.configure(foreground='#95a5a6')
-        entry.bind('<FocusIn>', on_focus_in)
-        entry.bind('<FocusOut>', on_focus_out)
+    def _show_search_results(self, records, search_text, filter_col, streamed=False, generation=None):
+        """Display search results"""
+        # Update table; streamed results are already on screen
+        if not streamed or not records:
+            self.table.clear()
+            self.table.insert_data(records)
+        self._update_paging_widgets(enabled=False)
+        self.last_search = {
+            'table': self.current_table,
+            'column': None if filter_col == "All Columns" else filter_col,
+            'term': search_text,
+            'records': records
+        }
+        if generation is not None:
+            self.data_generation = generation
+        
+        # Update status
+        count = len(records)
+        status = f"Found {count} record{'s' if count != 1 else ''}"
+        if count >= self.search_limit:
+            status = f"Showing first {count} records"
+        if search_text:
+            status += f" matching '{search_text}'"
+        if filter_col != "All Columns":
+            status += f" in {filter_col}"
+        self.update_status(status, "info")
 
     def _clear_search(self, entry):
         """Clear search and reset table"""
         try:
             self.search_var.set("")
-            self._add_placeholder(entry, "Type to search...")
+            # Clearing the entry schedules a search of its own; the refresh below replaces it
+            self._cancel_scheduled_search()
             self._refresh_table(self.current_table)
             self.update_status("Search cleared", "info")
             
@@ -244,7 +405,7 @@ class TableView:
             form_frame.pack(side='left', fill='y', padx=(0, 10))
 
             # Create form
-            self.form = DataEntryForm(form_frame, fields, self.db)
+            self.form = DataEntryForm(form_frame, fields, self.db, scheduler=self.scheduler)
             self.form.pack(fill='x', expand=True)
 
             # Add buttons
@@ -273,11 +434,18 @@ class TableView:
 
             # Create table with columns
             columns = [col for col in fields.keys() if not col.startswith('_')]
-            self.table = DataTable(table_frame, columns)
+            self.table = DataTable(table_frame, columns, virtual=True,
+                                   key=self.db.get_primary_key(table_name))
             self.table.pack(fill='both', expand=True)
+            self.table.sort_handler = lambda col, descending: self._on_sort(table_name, col, descending)
+            self.sort_by = None
+            self.sort_descending = False
+
+            # Page navigation
+            self._setup_paging_widgets(table_frame, table_name)
 
             # Bind table selection
-            self.table.tree.bind('<<TreeviewSelect>>', lambda e: self._on_select(e, table_name))
+            self.table.tree.bind('<<RecordSelected>>', lambda e: self._on_select(e, table_name), add='+')
 
             # Initial data load
             self._refresh_table(table_name)
@@ -286,29 +454,170 @@ class TableView:
             logging.error(f"Error creating form and table: {e}")
             messagebox.showerror("Error", f"Failed to create form and table: {str(e)}")
 
-    def _refresh_table(self, table_name):
-        """Refresh table data"""
+    def _setup_paging_widgets(self, parent, table_name):
+        """Setup previous/next page controls below the table"""
+        paging_frame = ttk.Frame(parent)
+        paging_frame.pack(fill='x', pady=(5, 0))
+
+        self.prev_page_btn = ttk.Button(
+            paging_frame,
+            text="◀ Prev",
+            command=lambda: self._change_page(table_name, -1)
+        )
+        self.prev_page_btn.pack(side='left', padx=2)
+
+        self.page_label = ttk.Label(paging_frame, text="", foreground='gray')
+        self.page_label.pack(side='left', padx=10)
+
+        self.next_page_btn = ttk.Button(
+            paging_frame,
+            text="Next ▶",
+            command=lambda: self._change_page(table_name, 1)
+        )
+        self.next_page_btn.pack(side='left', padx=2)
+
+    def _run_query(self, func, *args, on_success, message="Loading...", channel='data',
+                   with_token=False):
+        """Run a database call on the worker pool with the loading indicator shown"""
+        table_name = self.current_table
+        token = None
+
+        def finish():
+            if self.pending_loads.get(channel) is token:
+                del self.pending_loads[channel]
+            self._update_loading()
+
+        def done(result):
+            finish()
+            if table_name == self.current_table:
+                on_success(result)
+
+        def failed(error):
+            finish()
+            if table_name == self.current_table:
+                self.update_status(f"Error: {error}", "error")
+
+        # Submitting on a channel supersedes (and silences) the previous job on it
+        token = self.loader.submit(channel, func, *args, on_success=done, on_error=failed,
+                                   with_token=with_token)
+        self.pending_loads[channel] = token
+        self._update_loading(message)
+        return token
+
+    def _update_loading(self, message=None):
+        """Show the loading indicator while any background query is running"""
         try:
-            if not self.table:
-                logging.error("Table not initialized")
+            if not hasattr(self, 'loading_bar') or not self.loading_bar.winfo_exists():
                 return
+            if self.pending_loads:
+                if not self.loading_bar.winfo_ismapped():
+                    self.loading_bar.pack(side='right', padx=5)
+                    self.loading_bar.start(15)
+                if message:
+                    self.update_status(message, "info")
+            else:
+                self.loading_bar.stop()
+                self.loading_bar.pack_forget()
+        except tk.TclError as e:
+            logging.error(f"Error updating loading indicator: {e}")
 
-            # Get fresh data
-            records = self.db.get_table_data(table_name)
-            if not records:
-                self.update_status("No records found", "info")
-                self.table.clear()
-                return
+    def _refresh_table(self, table_name):
+        """Refresh table data starting from the first page"""
+        self.page_cursors = [None]
+        self.total_rows = None
+        self.last_search = None
+        self._load_page(table_name, 0)
+
+    def _on_sort(self, table_name, column, descending):
+        """Sort paged data with ORDER BY; return False to let the table sort in memory"""
+        # Search results and single-page tables are already complete on screen
+        if self.last_search or (self.page_index == 0 and not self.page_has_more):
+            return False
+
+        field = self.db.get_table_fields(table_name).get(column)
+        if not field or not field['indexed']:
+            # Keyset paging needs a BTREE index led by the sort column; a FULLTEXT key is no use. Sorting just this page would
+            # leave Prev/Next paging by the previous column, so the sort is refused instead
+            self.update_status(f"Cannot sort all pages by {column}: it is not indexed", "warning")
+            return True
 
-            # Update table with new data
+        self.sort_by = column
+        self.sort_descending = descending
+        self.page_cursors = [None]
+        self.table.set_sort_indicator(column, descending)
+        self._load_page(table_name, 0)
+        return True
+
+    def _change_page(self, table_name, step):
+        """Move to the previous or next page"""
+        target = self.page_index + step
+        if target < 0 or target >= len(self.page_cursors):
+            return
+        self._load_page(table_name, target)
+
+    def _load_page(self, table_name, page_index):
+        """Fetch and display one page in the background"""
+        if not self.table:
+            logging.error("Table not initialized")
+            return
+
+        after = self.page_cursors[page_index]
+        with_total = self.total_rows is None
+        order_by, descending = self.sort_by, self.sort_descending
+        generation = self.db.get_write_generation(table_name)
+        self._run_query(
+            lambda: self.db.get_table_page(
+                table_name,
+                page_size=self.page_size,
+                order_by=order_by,
+                descending=descending,
+                after=after,
+                with_total=with_total
+            ),
+            on_success=lambda page: self._show_page(page, page_index, generation)
+        )
+
+    def _show_page(self, page, page_index, generation=None):
+        """Display a fetched page"""
+        try:
+            self.page_index = page_index
+            self.data_generation = generation
+            if 'total' in page:
+                self.total_rows = page['total']
+                self.total_is_estimate = page['total_is_estimate']
+
+            # Remember where the next page starts
+            self.page_has_more = page['has_more']
+            del self.page_cursors[page_index + 1:]
+            if page['has_more']:
+                self.page_cursors.append(page['next_cursor'])
+
+            records = page['rows']
             self.table.clear()
-            self.table.insert_data(records)
-            self.update_status(f"Showing {len(records)} records", "info")
+            if not records:
+                self.update_status("No records found", "info")
+            else:
+                self.table.insert_data(records)
+                if self.sort_by:
+                    self.table.set_sort_indicator(self.sort_by, self.sort_descending)
+                first = page_index * self.page_size + 1
+                last = first + len(records) - 1
+                total = f"{'~' if self.total_is_estimate else ''}{self.total_rows:,}"
+                self.update_status(f"Showing records {first:,}-{last:,} of {total}", "info")
+            self._update_paging_widgets()
 
         except Exception as e:
             logging.error(f"Error refreshing table: {e}")
             messagebox.showerror("Error", f"Failed to refresh table: {str(e)}")
 
+    def _update_paging_widgets(self, enabled=True):
+        """Enable or disable page controls for the current page"""
+        if not hasattr(self, 'page_label'):
+            return
+        self.prev_page_btn.state(['!disabled'] if enabled and self.page_index > 0 else ['disabled'])
+        self.next_page_btn.state(['!disabled'] if enabled and self.page_has_more else ['disabled'])
+        self.page_label.configure(text=f"Page {self.page_index + 1}" if enabled else "")
+
     def _save_record(self, table_name):
         """Save a new record"""
         try:
@@ -317,15 +626,13 @@ class TableView:
             if not data:
                 return
 
-            # Insert record
-            self.db.insert_record(table_name, data)
-            
-            # Update status and show message
-            self.update_status("Record saved successfully", "success")
-            
-            # Refresh and clear
-            self._refresh_table(table_name)
-            self.form.clear()
+            # Insert record in the background
+            self._run_query(
+                self._insert_and_fetch, table_name, data,
+                on_success=lambda record: self._after_write(table_name, "Record saved successfully", record),
+                message="Saving record...",
+                channel=self._next_write_channel()
+            )
             
         except Exception as e:
             logging.error(f"Error saving record: {e}")
@@ -334,9 +641,9 @@ class TableView:
     def _update_record(self, table_name):
         """Update existing record"""
         try:
-            # Get selected item
-            selection = self.table.tree.selection()
-            if not selection:
+            # Get the selected record's primary key
+            record_id = self.table.get_selected_key()
+            if record_id is None:
                 self.update_status("Please select a record to update", "warning")
                 return
 
@@ -345,38 +652,15 @@ class TableView:
             if not data:
                 return
 
-            # Get the selected record's primary key
-            item = selection[0]
-            values = self.table.tree.item(item)['values']
-            if not values:
-                self.update_status("Failed to get record data", "error")
-                return
-
-            # Get primary key column
-            primary_key = self.db.get_primary_key(table_name)
-            if not primary_key:
-                self.update_status("Failed to get primary key", "error")
-                return
-
-            # Get column names
-            columns = self.db.get_table_columns(table_name)
-            if not columns:
-                self.update_status("Failed to get table columns", "error")
-                return
-
-            # Add primary key value to data
-            primary_key_index = columns.index(primary_key)
-            data[primary_key] = values[primary_key_index]
+            data[self.table.key] = record_id
 
-            # Update record
-            self.db.update_record(table_name, data)
-            
-            # Update status and show message
-            self.update_status("Record updated successfully", "success")
-            
-            # Refresh and clear
-            self._refresh_table(table_name)
-            self.form.clear()
+            # Update record in the background
+            self._run_query(
+                self._update_and_fetch, table_name, data,
+                on_success=lambda record: self._after_write(table_name, "Record updated successfully", record),
+                message="Updating record...",
+                channel=self._next_write_channel()
+            )
 
         except Exception as e:
             logging.error(f"Error updating record: {e}")
@@ -385,9 +669,9 @@ class TableView:
     def _delete_record(self, table_name):
         """Delete selected record"""
         try:
-            # Get selected item
-            selection = self.table.tree.selection()
-            if not selection:
+            # Get the selected record's primary key value
+            record_id = self.table.get_selected_key()
+            if record_id is None:
                 self.update_status("Please select a record to delete", "warning")
                 return
 
@@ -395,65 +679,156 @@ class TableView:
             if not messagebox.askyesno("Confirm", "Are you sure you want to delete this record?"):
                 return
 
-            # Get the selected record's primary key value
-            item = selection[0]
-            values = self.table.tree.item(item)['values']
-            if not values:
-                self.update_status("Failed to get record data", "error")
-                return
+            # Delete record in the background
+            self._run_query(
+                self.db.delete_record, table_name, record_id,
+                on_success=lambda _: self._after_write(table_name, "Record deleted successfully",
+                                                       removed=record_id),
+                message="Deleting record...",
+                channel=self._next_write_channel()
+            )
+            
+        except Exception as e:
+            logging.error(f"Error deleting record: {e}")
+            self.update_status(f"Failed to delete record: {str(e)}", "error")
 
-            # Get primary key column
-            primary_key = self.db.get_primary_key(table_name)
-            if not primary_key:
-                self.update_status("Failed to get primary key", "error")
+    def _import_file(self, table_name):
+        """Import records from a CSV or Excel file chosen by the user"""
+        try:
+            path = filedialog.askopenfilename(
+                title=f"Import into {table_name}",
+                filetypes=[("CSV and Excel files", "*.csv *.xlsx"), ("All files", "*.*")]
+            )
+            if not path:
                 return
 
-            # Get column names to find primary key index
-            columns = self.db.get_table_columns(table_name)
-            if not columns:
-                self.update_status("Failed to get table columns", "error")
+            self._run_query(
+                self._run_import, table_name, path,
+                on_success=lambda report: self._show_import_report(table_name, report),
+                message="Importing...",
+                channel=self._next_write_channel(),
+                with_token=True
+            )
+
+        except Exception as e:
+            logging.error(f"Error importing file: {e}")
+            self.update_status(f"Failed to import file: {str(e)}", "error")
+
+    def _run_import(self, token, table_name, path):
+        """Validate and load an import file (runs on a worker thread)"""
+        def progress(rows_read, rows_valid, phase):
+            self.loader.post(token, self.update_status,
+                             f"{phase} {table_name}: {rows_read:,} rows read, {rows_valid:,} valid", "info")
+
+        return TableImporter(self.db, table_name).run(path, progress=progress, token=token)
+
+    def _show_import_report(self, table_name, report):
+        """Summarize a finished import and show the new rows"""
+        self._refresh_table(table_name)
+        self.update_status(f"Imported {report['loaded']:,} of {report['rows']:,} records", "success")
+        notes = []
+        if report['skipped']:
+            notes.append(f"{report['skipped']:,} valid rows were skipped because their key already exists.")
+        if report['error_count']:
+            lines = [
+                ''.join(part for part in (f"Row {line}: " if line else '',
+                                          f"{column}: " if column else '', message))
+                for line, column, message in report['errors'][:10]
+            ]
+            if report['error_count'] > len(lines):
+                lines.append(f"... and {report['error_count'] - len(lines):,} more")
+            notes.append(f"{report['error_count']:,} rows were skipped:\n\n" + "\n".join(lines))
+        if notes:
+            messagebox.showwarning("Import", "\n\n".join(notes))
+
+    def _export_file(self, table_name):
+        """Export the table, or the current search results, to a file chosen by the user"""
+        try:
+            path = filedialog.asksaveasfilename(
+                title=f"Export {table_name}",
+                initialfile=table_name.lower(),
+                defaultextension=".csv",
+                filetypes=[("CSV file", "*.csv"), ("Excel workbook", "*.xlsx"), ("PDF document", "*.pdf")]
+            )
+            if not path:
                 return
 
-            # Get primary key value from values using its index
-            primary_key_index = columns.index(primary_key)
-            record_id = values[primary_key_index]
+            # Export what the user is looking at: every match of the search, or the whole table
+            search = self.last_search
+            search_term = search['term'] if search else None
+            column = search['column'] if search else None
+
+            self._run_query(
+                self._run_export, table_name, path, search_term, column,
+                on_success=lambda result: self._show_export_result(*result),
+                message="Exporting...",
+                channel='export',
+                with_token=True
+            )
 
-            # Delete record
-            self.db.delete_record(table_name, record_id)
-            
-            # Update status
-            self.update_status("Record deleted successfully", "success")
-            
-            # Refresh and clear
-            self._refresh_table(table_name)
-            self.form.clear()
-            
         except Exception as e:
-            logging.error(f"Error deleting record: {e}")
-            self.update_status(f"Failed to delete record: {str(e)}", "error")
+            logging.error(f"Error exporting file: {e}")
+            self.update_status(f"Failed to export file: {str(e)}", "error")
+
+    def _run_export(self, token, table_name, path, search_term, column):
+        """Stream rows to the export file (runs on a worker thread)"""
+        def progress(rows_written):
+            self.loader.post(token, self.update_status, f"Exported {rows_written:,} records...", "info")
+
+        exporter = TableExporter(self.db, table_name)
+        count = exporter.run(path, search_term=search_term, column=column, progress=progress, token=token)
+        return count, exporter.files
+
+    def _show_export_result(self, count, files):
+        """Report a finished export, naming every file a large PDF was split into"""
+        if len(files) > 1:
+            self.update_status(f"Exported {count:,} records to {len(files)} files: {files[0]} to {files[-1]}",
+                               "success")
+        else:
+            self.update_status(f"Exported {count:,} records to {files[0]}", "success")
+
+    def _next_write_channel(self):
+        """Give every write its own channel so a later write never supersedes it"""
+        self.write_count += 1
+        return f"write-{self.write_count}"
+
+    def _insert_and_fetch(self, table_name, data):
+        """Insert a record and read it back with server defaults filled in (runs on a worker thread)"""
+        lastrowid = self.db.insert_record(table_name, data)
+        primary_key = self.db.get_primary_key(table_name)
+        return self.db.get_record_by_pk(table_name, data.get(primary_key) or lastrowid)
+
+    def _update_and_fetch(self, table_name, data):
+        """Update a record and read it back (runs on a worker thread)"""
+        self.db.update_record(table_name, data)
+        return self.db.get_record_by_pk(table_name, data[self.db.get_primary_key(table_name)])
+
+    def _after_write(self, table_name, message, record=None, removed=None):
+        """Apply a finished background write to the rows on screen"""
+        if record is not None:
+            self.table.upsert_record(record)
+        elif removed is not None:
+            self.table.remove_record(removed)
+        else:
+            self._refresh_table(table_name)
+
+        # Earlier results no longer reflect the table, so don't refine them in memory
+        if self.last_search:
+            self.last_search['stale'] = True
+        # The rows on screen already include this write
+        if record is not None or removed is not None:
+            self.data_generation = self.db.get_write_generation(table_name)
+        self.form.clear()
+        self.update_status(message, "success")
 
     def _on_select(self, event, table_name):
         """Handle table row selection"""
         try:
-            # Get selected item
-            selection = self.table.tree.selection()
-            if not selection:
-                return
-
-            # Get the first selected item
-            item = selection[0]
-            
-            # Get all values for the selected row
-            values = self.table.tree.item(item)['values']
-            if not values:
+            # Get the typed record behind the selected row
+            data = self.table.get_selected()
+            if not data:
                 return
 
-            # Get column names
-            columns = self.db.get_table_columns(table_name)
-            
-            # Create dictionary of column names and values
-            data = dict(zip(columns, values))
-            
             # Set the form data
             self.form.set_data(data)
             
@@ -554,10 +929,10 @@ class TableView:
             messagebox.showerror("Error", f"Failed to refresh table: {str(e)}")
 
     def clear_content(self):
-        """Clear all widgets from the content area"""
-        if self.content_area:
-            for widget in self.content_area.winfo_children():
-                widget.destroy()
+        """Destroy every cached table view"""
+        self.hide()
+        for table_name in list(self.views):
+            self._discard_view(table_name)
 
     def setup_styles(self):
         """Setup custom styles for widgets"""
@@ -621,6 +996,21 @@ class TableView:
                  foreground=[('pressed', 'white')],
                  relief=[('pressed', 'flat')])
 
+        # Import button style - Teal
+        style.configure('Import.TButton',
+                       background='#16a085',  
+                       foreground='white',
+                       padding=(15, 8),
+                       relief='flat',
+                       borderwidth=0,
+                       font=('Segoe UI', 10),
+                       width=8,
+                       anchor='center')
+        style.map('Import.TButton',
+                 background=[('active', '#1abc9c'), ('pressed', '#16a085')],
+                 foreground=[('pressed', 'white')],
+                 relief=[('pressed', 'flat')])
+
         # Save button style - Vibrant Green
         style.configure('Save.TButton',
                        background='#00b894',  
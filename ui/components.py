@@ -1,16 +1,26 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from tkcalendar import DateEntry
 from datetime import datetime
 import logging
 import os
 import re
-from PIL import Image, ImageTk
+import sys
 import time
+from ui.scheduler import UIScheduler
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 
+def _date_entry_class():
+    """Import tkcalendar on first use; only forms with date fields need it"""
+    from tkcalendar import DateEntry
+    return DateEntry
+
+def _is_date_entry(widget):
+    """isinstance check for DateEntry that doesn't import tkcalendar when no date field was built"""
+    tkcalendar = sys.modules.get('tkcalendar')
+    return tkcalendar is not None and isinstance(widget, tkcalendar.DateEntry)
+
 class SidebarButton(tk.Button):
     def __init__(self, parent, text, command):
         super().__init__(
@@ -50,14 +60,19 @@ class SidebarButton(tk.Button):
         self.indicator.place_forget()  # Hide indicator
 
 class DataEntryForm(ttk.Frame):
-    def __init__(self, parent, fields, db=None):
+    def __init__(self, parent, fields, db=None, scheduler=None):
         super().__init__(parent)
         self.fields = fields
         self.db = db
+        self.scheduler = scheduler or UIScheduler(self.winfo_toplevel())
         self.entries = {}
         self.time_entries = {}  # Store time-related entries
         self.create_fields()
-        self.update_live_time()  # Start time updates
+
+        # Start time updates; forms without time fields have nothing to tick
+        if self.time_entries:
+            self.update_live_time()
+            self.scheduler.schedule(self, 1000, self.update_live_time)
         
     def create_fields(self):
         """Create form fields based on database schema"""
@@ -112,6 +127,7 @@ class DataEntryForm(ttk.Frame):
             return widget
             
         if field_type in ['date', 'datetime']:
+            DateEntry = _date_entry_class()
             # Date picker with time if it's datetime
             if 'datetime' in field_type or is_time_field:
                 frame = ttk.Frame(self)
@@ -209,9 +225,10 @@ class DataEntryForm(ttk.Frame):
                 if isinstance(widget, (ttk.Entry, tk.Entry)):
                     widget.delete(0, tk.END)
                     widget.insert(0, current_time)
-        
-        # Schedule next update in 1 second
-        self.after(1000, self.update_live_time)
+
+    def destroy(self):
+        self.scheduler.cancel_owner(self)
+        super().destroy()
         
     def focus_next_widget(self, current_widget):
         """Move focus to the next widget in the form"""
@@ -257,7 +274,7 @@ class DataEntryForm(ttk.Frame):
                         data[field_name] = value
                     else:
                         data[field_name] = None
-                elif isinstance(widget, DateEntry):
+                elif _is_date_entry(widget):
                     # Handle date fields
                     date_value = widget.get_date()
                     if date_value:
@@ -333,7 +350,7 @@ class DataEntryForm(ttk.Frame):
                                 widget.date_widget.set_date(date_value)
                         except ValueError as e:
                             logging.error(f"Error parsing datetime: {e}")
-                elif isinstance(widget, DateEntry):
+                elif _is_date_entry(widget):
                     if value:
                         try:
                             # Try datetime format first
@@ -363,7 +380,7 @@ class DataEntryForm(ttk.Frame):
     def clear(self):
         """Clear all form fields"""
         for widget in self.entries.values():
-            if isinstance(widget, DateEntry):
+            if _is_date_entry(widget):
                 widget.set_date(datetime.now())
             elif isinstance(widget, ttk.Checkbutton):
                 widget.var.set(False)
@@ -374,10 +391,36 @@ class DataEntryForm(ttk.Frame):
             else:
                 widget.delete(0, tk.END)
 
+def _sort_key(value):
+    """Order empty values first, then numbers numerically, then text case-insensitively"""
+    if value is None or value == '':
+        return (0, 0)
+    if isinstance(value, (int, float)):
+        return (1, value)
+    return (2, str(value).casefold())
+
 class DataTable(ttk.Frame):
-    def __init__(self, parent, columns):
+    def __init__(self, parent, columns, virtual=False, key=None):
         super().__init__(parent)
         self.columns = columns
+        self.virtual = virtual
+        # Primary key column used to find rows; the first column identified rows before keys were passed in
+        self.key = key or (columns[0] if columns else None)
+        # Virtual mode keeps records here and only renders a window of them
+        self._rows = []
+        self._window_items = []
+        self._offset = 0
+        self._visible_rows = 1
+        self._selected_index = None
+        self._positions = {}  # virtual mode: key value -> index in _rows
+        self._items = {}  # normal mode: key value -> tree item
+        self._records = {}  # normal mode: tree item -> typed record (and so its key value)
+        self._sort_keys = {}  # column -> {id(record): sort key}, dropped whenever rows change
+        self._sort_column = None
+        self._sort_descending = False
+        # Called as sort_handler(column, descending); returning True means it handled the sort itself,
+        # including the heading arrow, or refused it
+        self.sort_handler = None
         self.setup_table()
 
     def setup_table(self):
@@ -390,9 +433,13 @@ class DataTable(ttk.Frame):
         self.tree = ttk.Treeview(self.tree_frame, columns=self.columns, show='headings')
         
         # Create scrollbars
-        self.vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
+        if self.virtual:
+            self.vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self._on_vscroll)
+        else:
+            self.vsb = ttk.Scrollbar(self.tree_frame, orient="vertical", command=self.tree.yview)
+            self.tree.configure(yscrollcommand=self.vsb.set)
         self.hsb = ttk.Scrollbar(self.tree_frame, orient="horizontal", command=self.tree.xview)
-        self.tree.configure(yscrollcommand=self.vsb.set, xscrollcommand=self.hsb.set)
+        self.tree.configure(xscrollcommand=self.hsb.set)
 
         # Grid layout
         self.tree.grid(column=0, row=0, sticky='nsew')
@@ -411,46 +458,345 @@ class DataTable(ttk.Frame):
         self.tree.bind('<Double-1>', self.on_double_click)
         self.tree.bind('<Return>', self.on_double_click)
 
+        # <<RecordSelected>> fires on the tree when the user picks a different record
+        if self.virtual:
+            self.tree.bind('<Configure>', self._on_resize)
+            self.tree.bind('<<TreeviewSelect>>', self._on_window_select, add='+')
+            self.tree.bind('<MouseWheel>', self._on_mousewheel)
+            self.tree.bind('<Button-4>', lambda e: self._scroll_by(-3))
+            self.tree.bind('<Button-5>', lambda e: self._scroll_by(3))
+            self.tree.bind('<Up>', lambda e: self._move_selection(-1))
+            self.tree.bind('<Down>', lambda e: self._move_selection(1))
+            self.tree.bind('<Prior>', lambda e: self._move_selection(-self._visible_rows))
+            self.tree.bind('<Next>', lambda e: self._move_selection(self._visible_rows))
+        else:
+            self.tree.bind('<<TreeviewSelect>>', self._on_tree_select, add='+')
+
+    def _display_values(self, record):
+        """Format a record for display in the tree"""
+        return [str(record.get(col, '')) for col in self.columns]
+
+    def _row_height(self):
+        """Get the configured Treeview row height"""
+        try:
+            return int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        except (ValueError, tk.TclError):
+            return 20
+
+    def _on_resize(self, event):
+        """Size the recycled item window to the rows that fit in the viewport"""
+        row_height = self._row_height()
+        header_height = row_height + 5
+        if self._window_items:
+            bbox = self.tree.bbox(self._window_items[0])
+            if bbox:
+                header_height = bbox[1]
+        visible_rows = max(1, (event.height - header_height) // row_height)
+        if visible_rows != self._visible_rows:
+            self._visible_rows = visible_rows
+            self._render()
+
+    def _render(self):
+        """Fill the recycled tree items with the rows at the current offset"""
+        total = len(self._rows)
+        max_offset = max(0, total - self._visible_rows)
+        self._offset = min(max(0, self._offset), max_offset)
+        count = min(self._visible_rows, total - self._offset)
+
+        # Grow or shrink the item window; items themselves are reused
+        while len(self._window_items) < count:
+            self._window_items.append(self.tree.insert('', 'end', values=()))
+        if len(self._window_items) > count:
+            self.tree.delete(*self._window_items[count:])
+            del self._window_items[count:]
+
+        for slot, item in enumerate(self._window_items):
+            self.tree.item(item, values=self._display_values(self._rows[self._offset + slot]))
+
+        # Keep the selection on the same record, not the same tree item
+        selected_slot = None
+        if self._selected_index is not None:
+            slot = self._selected_index - self._offset
+            if 0 <= slot < count:
+                selected_slot = slot
+        current = self.tree.selection()
+        if selected_slot is None:
+            if current:
+                self.tree.selection_remove(*current)
+        elif current != (self._window_items[selected_slot],):
+            self.tree.selection_set(self._window_items[selected_slot])
+            self.tree.focus(self._window_items[selected_slot])
+
+        self._update_scrollbar()
+
+    def _update_scrollbar(self):
+        """Show the window's position within all rows on the scrollbar"""
+        total = len(self._rows)
+        if total:
+            self.vsb.set(self._offset / total, (self._offset + len(self._window_items)) / total)
+        else:
+            self.vsb.set(0, 1)
+
+    def _reindex(self, start=0):
+        """Rebuild key positions for the rows from start onwards"""
+        if not self.key:
+            return
+        if start == 0:
+            self._positions = {}
+        for index in range(start, len(self._rows)):
+            self._positions[self._rows[index].get(self.key)] = index
+
+    def _on_vscroll(self, action, amount, unit=None):
+        """Translate scrollbar commands into window offsets"""
+        if action == 'moveto':
+            self._offset = int(float(amount) * len(self._rows))
+            self._render()
+        elif action == 'scroll':
+            step = self._visible_rows if unit == 'pages' else 1
+            self._scroll_by(int(amount) * step)
+
+    def _on_mousewheel(self, event):
+        """Scroll the window with the mouse wheel"""
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        return self._scroll_by(-delta * 3)
+
+    def _scroll_by(self, rows):
+        """Scroll the window by a number of rows"""
+        self._offset += rows
+        self._render()
+        return 'break'
+
+    def _on_tree_select(self, event):
+        """Report a selection made in the tree (normal mode)"""
+        if self.tree.selection():
+            self._record_selected()
+
+    def _on_window_select(self, event):
+        """Track which record is selected as items are recycled
+
+        _render also moves the tree selection while scrolling, sorting or
+        upserting, and Tk delivers <<TreeviewSelect>> for those changes
+        later from the event queue. They leave the selected record as it
+        was, so only a change of record is reported as <<RecordSelected>>.
+        """
+        selection = self.tree.selection()
+        if not selection or selection[0] not in self._window_items:
+            return  # cleared because the selected record scrolled out of the window
+        index = self._offset + self._window_items.index(selection[0])
+        if index != self._selected_index:
+            self._selected_index = index
+            self._record_selected()
+
+    def _record_selected(self):
+        self.tree.event_generate('<<RecordSelected>>')
+
+    def _move_selection(self, step):
+        """Move the selection with the keyboard, scrolling past the window edges"""
+        if not self._rows:
+            return 'break'
+        if self._selected_index is None:
+            index = self._offset
+        else:
+            index = min(max(0, self._selected_index + step), len(self._rows) - 1)
+        changed = index != self._selected_index
+        self._scroll_to(index)
+        if changed:
+            self._record_selected()
+        return 'break'
+
+    def _scroll_to(self, index):
+        """Select a record and scroll it into the window"""
+        self._selected_index = index
+        if index < self._offset:
+            self._offset = index
+        elif index >= self._offset + self._visible_rows:
+            self._offset = index - self._visible_rows + 1
+        self._render()
+
     def insert_data(self, data):
         """Insert data into the table"""
         # Clear existing items
         self.clear()
+        if self._sort_column:
+            # New rows arrive in their own order
+            self.set_sort_indicator(None)
         
+        if self.virtual:
+            self._rows = list(data)
+            self._reindex()
+            self._render()
+            return
+
         # Insert new data
         for item in data:
-            values = [str(item.get(col, '')) for col in self.columns]
-            self.tree.insert('', 'end', values=values)
+            self._insert_item(item)
+
+    def append_data(self, data):
+        """Add rows after the existing ones without clearing the table"""
+        self._sort_keys = {}
+        if self.virtual:
+            start = len(self._rows)
+            self._rows.extend(data)
+            self._reindex(start)
+            self._render()
+            return
+
+        for item in data:
+            self._insert_item(item)
+
+    def _insert_item(self, record):
+        """Add one tree item for a record (normal mode)"""
+        record = dict(record)
+        item = self.tree.insert('', 'end', values=self._display_values(record))
+        self._records[item] = record
+        if self.key:
+            self._items[record.get(self.key)] = item
+        return item
+
+    def upsert_record(self, record):
+        """Insert a record, or replace the row with the same key, touching only that row"""
+        self._sort_keys = {}
+        key_value = record.get(self.key) if self.key else None
+        if self.virtual:
+            index = self._positions.get(key_value) if self.key else None
+            if index is None:
+                index = len(self._rows)
+                self._rows.append(dict(record))
+                if self.key:
+                    self._positions[key_value] = index
+            else:
+                self._rows[index] = dict(record)
+
+            slot = index - self._offset
+            if 0 <= slot < len(self._window_items):
+                self.tree.item(self._window_items[slot], values=self._display_values(record))
+            elif slot == len(self._window_items) and slot < self._visible_rows:
+                # A new row that fits in a window that is not full yet
+                self._render()
+            self._update_scrollbar()
+            return
+
+        item = self._items.get(key_value) if self.key else None
+        if item is None:
+            self._insert_item(record)
+        else:
+            self._records[item] = dict(record)
+            self.tree.item(item, values=self._display_values(record))
+
+    def remove_record(self, key_value):
+        """Remove the row with the given key value, if it is shown
+
+        In virtual mode this is O(n): the rows after the removed one shift
+        down and their key positions are rebuilt. Virtual tables hold at most
+        one page or one search result, and rows are removed one at a time as
+        the user deletes them, so this stays cheap. Batch deletes should
+        reload the page instead of calling this per row.
+        """
+        self._sort_keys = {}
+        if self.virtual:
+            index = self._positions.pop(key_value, None)
+            if index is None:
+                return False
+            del self._rows[index]
+            self._reindex(index)
+            if self._selected_index is not None:
+                if self._selected_index == index:
+                    self._selected_index = None
+                elif self._selected_index > index:
+                    self._selected_index -= 1
+            self._render()
+            return True
+
+        item = self._items.pop(key_value, None)
+        if item is None:
+            return False
+        self._records.pop(item, None)
+        self.tree.delete(item)
+        return True
 
     def clear(self):
         """Clear all items from the table"""
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._sort_keys = {}
+        if self.virtual:
+            self._rows = []
+            self._positions = {}
+            self._offset = 0
+            self._selected_index = None
+            self._render()
+            return
+
+        self._items = {}
+        self._records = {}
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
 
     def get_selected(self):
-        """Get the selected item"""
+        """Get a copy of the selected record"""
+        record = self.get_selected_record()
+        return dict(record) if record is not None else None
+
+    def get_selected_record(self):
+        """Get the typed record behind the selected row, without parsing displayed values"""
+        if self.virtual:
+            if self._selected_index is None or self._selected_index >= len(self._rows):
+                return None
+            return self._rows[self._selected_index]
+
         selection = self.tree.selection()
         if not selection:
             return None
-        
-        item = self.tree.item(selection[0])
-        return dict(zip(self.columns, item['values']))
+        return self._records.get(selection[0])
+
+    def get_selected_key(self):
+        """Get the key value of the selected record"""
+        record = self.get_selected_record()
+        return record.get(self.key) if record is not None and self.key else None
 
     def sort_column(self, col):
-        """Sort table by column"""
-        # Get all items
-        data = [(self.tree.set(child, col), child) 
-                for child in self.tree.get_children('')]
-        
-        # Sort data
-        data.sort(reverse=self.tree.heading(col).get('reverse', False))
-        
-        # Rearrange items
-        for idx, (_, child) in enumerate(data):
-            self.tree.move(child, '', idx)
-        
-        # Toggle sort direction
-        self.tree.heading(col, 
-                         reverse=not self.tree.heading(col).get('reverse', False))
+        """Sort table by column, toggling the direction on repeated clicks"""
+        descending = self._sort_column == col and not self._sort_descending
+        if self.sort_handler and self.sort_handler(col, descending):
+            return
+        self.sort_by(col, descending)
+
+    def sort_by(self, col, descending=False):
+        """Sort the rows in memory by their typed values"""
+        keys = self._column_sort_keys(col)
+        sort_key = lambda record: keys[id(record)]
+
+        if self.virtual:
+            selected = self._rows[self._selected_index] if self._selected_index is not None else None
+            self._rows.sort(key=sort_key, reverse=descending)
+            self._reindex()
+            self._selected_index = self._positions.get(selected.get(self.key)) if selected is not None else None
+            self._render()
+        else:
+            children = self.tree.get_children('')
+            ordered = sorted(children, key=lambda item: sort_key(self._records[item]), reverse=descending)
+            for idx, child in enumerate(ordered):
+                self.tree.move(child, '', idx)
+
+        self.set_sort_indicator(col, descending)
+
+    def _column_sort_keys(self, col):
+        """Compute the sort key of every record for a column once and reuse it"""
+        keys = self._sort_keys.get(col)
+        if keys is None:
+            records = self._rows if self.virtual else self._records.values()
+            keys = {id(record): _sort_key(record.get(col)) for record in records}
+            self._sort_keys[col] = keys
+        return keys
+
+    def set_sort_indicator(self, col, descending=False):
+        """Mark the sorted column's heading with an arrow"""
+        self._sort_column = col
+        self._sort_descending = descending
+        for column in self.columns:
+            text = column.replace('_', ' ').title()
+            if column == col:
+                text += ' ▼' if descending else ' ▲'
+            self.tree.heading(column, text=text)
 
     def on_double_click(self, event):
         """Handle double click event"""
@@ -459,28 +805,39 @@ class DataTable(ttk.Frame):
 
     def get_all_data(self):
         """Get all data from the table"""
-        data = []
-        for item in self.tree.get_children():
-            values = self.tree.item(item)['values']
-            data.append(dict(zip(self.columns, values)))
-        return data
+        if self.virtual:
+            return [dict(record) for record in self._rows]
+
+        return [dict(self._records[item]) for item in self.tree.get_children()]
+
+    def get_record(self, key_value):
+        """Get the record with the given key value"""
+        if self.virtual:
+            index = self._positions.get(key_value)
+            return self._rows[index] if index is not None else None
+
+        item = self._items.get(key_value)
+        return self._records.get(item) if item is not None else None
 
     def select_item(self, item_id):
-        """Select a specific item by ID"""
-        for item in self.tree.get_children():
-            if self.tree.item(item)['values'][0] == item_id:
-                self.tree.selection_set(item)
-                self.tree.focus(item)
-                self.tree.see(item)
-                break
+        """Select a specific item by its key value"""
+        if self.virtual:
+            index = self._positions.get(item_id)
+            if index is not None:
+                self._scroll_to(index)
+            return
+
+        item = self._items.get(item_id)
+        if item is not None:
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+            self.tree.see(item)
 
     def update_item(self, item_id, new_values):
-        """Update a specific item"""
-        for item in self.tree.get_children():
-            if self.tree.item(item)['values'][0] == item_id:
-                self.tree.item(item, values=[new_values.get(col, '') 
-                                           for col in self.columns])
-                break
+        """Update a specific item by its key value"""
+        record = self.get_record(item_id)
+        if record is not None:
+            self.upsert_record(dict(record, **new_values))
 
 class StatBox(tk.Frame):
     def __init__(self, parent, title, value="0", icon="📊", color="#3498db"):
@@ -647,6 +1004,8 @@ class WelcomeScreen(tk.Toplevel):
         
         # Add hospital logo
         try:
+            # Pillow is only needed for the logo
+            from PIL import Image, ImageTk
             logo_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "assets", "hospital_icon.png")
             logo_image = Image.open(logo_path)
             logo_image = logo_image.resize((200, 200), Image.Resampling.LANCZOS)
@@ -0,0 +1,123 @@
+import tkinter as tk
+import itertools
+import logging
+import math
+import time
+
+
+class UIScheduler:
+    """Run every periodic UI job from a single after() timer
+
+    Views schedule jobs against an owner widget instead of rescheduling
+    themselves with after(). Due times are aligned to multiples of each
+    job's interval, so a 1 s clock and a 2 s animation fire on the same
+    tick, and only one timer is pending however many jobs there are. A job
+    is dropped once its owner is destroyed, and skipped while the owner is
+    hidden, so views that are torn down or cached leave nothing ticking.
+    """
+
+    def __init__(self, widget, slack=20):
+        self.widget = widget
+        self.slack = slack / 1000  # jobs due this close to a tick run with it
+        self._jobs = {}  # job id -> job
+        self._ids = itertools.count(1)
+        self._timer = None
+        self._timer_due = None
+
+    def schedule(self, owner, interval, func, name=None, visible_only=True):
+        """Call func() every interval ms for as long as owner exists; returns a job id"""
+        job_id = next(self._ids)
+        self._jobs[job_id] = {
+            'owner': owner,
+            'interval': interval / 1000,
+            'func': func,
+            'name': name or getattr(func, '__qualname__', repr(func)),
+            'visible_only': visible_only,
+            'due': self._next_due(interval / 1000, time.time())
+        }
+        self._arm()
+        return job_id
+
+    def cancel(self, job_id):
+        """Stop one job"""
+        self._jobs.pop(job_id, None)
+        self._arm()
+
+    def cancel_owner(self, owner):
+        """Stop every job scheduled for owner, e.g. when a view is torn down"""
+        for job_id in [job_id for job_id, job in self._jobs.items() if job['owner'] is owner]:
+            del self._jobs[job_id]
+        self._arm()
+
+    def job_counts(self):
+        """Return {job name: active jobs} for diagnostics"""
+        self._drop_dead_jobs()
+        counts = {}
+        for job in self._jobs.values():
+            counts[job['name']] = counts.get(job['name'], 0) + 1
+        return counts
+
+    @staticmethod
+    def _next_due(interval, now):
+        """First multiple of interval after now"""
+        return (math.floor(now / interval) + 1) * interval
+
+    @staticmethod
+    def _alive(owner):
+        try:
+            return bool(owner.winfo_exists())
+        except tk.TclError:
+            return False
+
+    def _drop_dead_jobs(self):
+        for job_id in [job_id for job_id, job in self._jobs.items() if not self._alive(job['owner'])]:
+            del self._jobs[job_id]
+
+    def _arm(self):
+        """Point the single timer at the earliest due job"""
+        due = min((job['due'] for job in self._jobs.values()), default=None)
+        if due == self._timer_due:
+            return
+        if self._timer is not None:
+            try:
+                self.widget.after_cancel(self._timer)
+            except tk.TclError:
+                pass
+        self._timer = self._timer_due = None
+        if due is None:
+            return
+
+        delay = max(int(math.ceil((due - time.time()) * 1000)), 1)
+        try:
+            self._timer = self.widget.after(delay, self._tick)
+            self._timer_due = due
+        except tk.TclError:
+            # The scheduler's own widget is gone, so the app is closing
+            self._jobs.clear()
+
+    def _tick(self):
+        """Run the jobs that are due and re-arm the timer"""
+        self._timer = self._timer_due = None
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job_id not in self._jobs:
+                continue  # cancelled by a job that ran earlier in this tick
+            if not self._alive(job['owner']):
+                del self._jobs[job_id]
+                continue
+            if job['due'] > now + self.slack:
+                continue
+
+            job['due'] = self._next_due(job['interval'], now + self.slack)
+            if job['visible_only'] and not job['owner'].winfo_viewable():
+                continue
+            try:
+                job['func']()
+            except Exception as e:
+                logging.error(f"Scheduled UI job {job['name']} failed: {e}")
+        self._arm()
+
+# References
+# 1. **Tkinter after()**
+#    - Used for: The single timer behind every periodic UI job
+#    - Documentation: [Tkinter Documentation](https://docs.python.org/3/library/tkinter.html)